@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """ Provides in-memory conversion of PDF to text. """
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from logging import (
     Formatter,
     FileHandler,
@@ -7,16 +9,26 @@ from logging import (
     getLogger
 )
 from pathlib import Path
+from typing import Iterator
 from pdf2image import convert_from_path
 from PyPDF2 import PdfReader
 from pytesseract import (
     pytesseract,
     image_to_string
 )
+import hashlib
 import logging
+import os
 import shutil
+import string
 
 
+MIN_TEXT_CHARS = 32
+""" Minimum number of characters of a usable text layer in a page. """
+
+MIN_TEXT_QUALITY = 0.8
+""" Minimum fraction of regular characters of a usable text layer. """
+
 ##############################################################################
 # LOGGING
 ##############################################################################
@@ -47,12 +59,30 @@ def init_logger(debug=True):
 
 
 class PdfToTextConverter:
-    """ Performs text extraction from PDF file. """
+    """ Performs text extraction from PDF file.
+
+    Pages with a usable embedded text layer (see `is_usable_text`) are
+    extracted directly; only image pages are rasterized and recognized.
+    These are rasterized in chunks of `chunk_size` pages and recognized
+    by a pool of `workers` processes running tesseract, so that the next
+    chunk is rasterized while the previous one is being recognized and
+    memory remains bounded by the chunk size instead of document size.
+
+    If `cache_dir` is provided, recognized text is stored per page under
+    a key made of the PDF contents hash, page number, resolution and
+    tesseract settings, so that runs over the same files are reused.
+    """
     def __init__(self,
             tesseract_cmd: Path,
-            poppler_path: Path
+            poppler_path: Path,
+            cache_dir: Path = None,
+            lang: str = None,
+            config: str = ""
         ) -> None:
+        self._tesseract_cmd = tesseract_cmd
         self._poppler_path = poppler_path
+        self._cache = None if cache_dir is None else OcrCache(cache_dir)
+        self._options = {"lang": lang, "config": config}
         pytesseract.tesseract_cmd = tesseract_cmd
 
     def __call__(self,
@@ -61,23 +91,127 @@ class PdfToTextConverter:
             first_page: int = None,
             last_page: int = None,
             userpw: str = None,
-            thread_count: int = 8
+            thread_count: int = 8,
+            workers: int = None,
+            chunk_size: int = 8,
+            output: Path = None,
+            text_layer: bool = True
         ):
-        """ In-memory convertion of PDF to text. """
+        """ In-memory convertion of PDF to text.
+
+        If `output` is provided, text of pages is also written to this
+        file as soon as pages are recognized (in page order). Set
+        `text_layer=False` to recognize all pages with tesseract.
+        """
         try:
-            ensure_readable_pdf(pdf_path)
+            n_pages = ensure_readable_pdf(pdf_path)
         except RuntimeError as err:
             logging.error(f"Skipping {pdf_path}: {err}")
             return
 
+        first_page = 1 if first_page is None else first_page
+        last_page = n_pages if last_page is None else min(last_page, n_pages)
+        page_range = range(first_page, last_page + 1)
+
+        # Text known without OCR: embedded text layer or cached results.
+        known = {}
+
+        if text_layer:
+            for page, text in extract_text_layer(pdf_path, page_range):
+                if is_usable_text(text):
+                    known[page] = text
+
+        if self._cache is not None:
+            key = self._cache.key(pdf_path, dpi, **self._options)
+
+            for page in page_range:
+                if page in known:
+                    continue
+
+                if (text := self._cache.get(key, page)) is not None:
+                    known[page] = text
+
+        missing = [page for page in page_range if page not in known]
+        logging.info(f"Text found for {len(known)}/{len(page_range)} pages")
+
+        images = iter_page_images(pdf_path, dpi, missing, userpw,
+            thread_count, self._poppler_path, chunk_size)
+        ocr = ocr_pages(images, self._tesseract_cmd, workers,
+                        chunk_size, **self._options)
+
+        texts = []
+        fp = open(output, "w", encoding="utf-8") if output else None
+
         try:
-            image_list = pdf_to_images(pdf_path, dpi, first_page,
-                last_page, userpw, thread_count, self._poppler_path)
+            for page in page_range:
+                if page in known:
+                    text = known[page]
+                else:
+                    ocr_page, text = next(ocr)
+
+                    if ocr_page != page:
+                        raise RuntimeError(f"OCR of page {ocr_page} "
+                                           f"received for page {page}")
+
+                    logging.info(f"Page {page}/{last_page} (OCR)")
+
+                    if self._cache is not None:
+                        self._cache.put(key, page, text)
+
+                texts.append(text)
+
+                if fp is not None:
+                    fp.write(f"{text}\n---\n")
+                    fp.flush()
         except Exception as err:
             logging.error(f"Converting pdf2txt: {err}")
-            return
+        finally:
+            ocr.close()
+
+            if fp is not None:
+                fp.close()
+
+        return "".join(f"{text}\n---\n" for text in texts)
+
+
+class OcrCache:
+    """ On-disk cache of text recognized from PDF pages. """
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(pdf_path: Path, dpi: int, **options) -> str:
+        """ Cache key of a PDF file contents and recognition settings. """
+        digest = hashlib.sha1()
+
+        with open(pdf_path, "rb") as fp:
+            while block := fp.read(1 << 20):
+                digest.update(block)
+
+        settings = repr((dpi, sorted(options.items()))).encode("utf-8")
+        settings = hashlib.sha1(settings).hexdigest()[:12]
 
-        return image_to_text(image_list)
+        return f"{digest.hexdigest()}/{settings}"
+
+    def path(self, key: str, page: int) -> Path:
+        """ Path of cached text of a given page. """
+        return self._cache_dir / key / f"page-{page:05d}.txt"
+
+    def get(self, key: str, page: int) -> str | None:
+        """ Retrieve text of page if cached. """
+        if (path := self.path(key, page)).exists():
+            return path.read_text(encoding="utf-8")
+
+        return None
+
+    def put(self, key: str, page: int, text: str) -> None:
+        """ Store text of page (atomically). """
+        path = self.path(key, page)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        partial.write_text(text, encoding="utf-8")
+        partial.replace(path)
 
 
 ##############################################################################
@@ -114,6 +248,8 @@ def ensure_readable_pdf(pdf_path):
     for key, value in doc.metadata.items():
         logging.info(f"{key}: {value}")
 
+    return n_pages
+
 
 def pdf_to_images(
         pdf_path: Path | str,
@@ -147,25 +283,134 @@ def pdf_to_images(
     return image_list
 
 
+def extract_text_layer(pdf_path, pages) -> Iterator[tuple]:
+    """ Yield `(page, text)` of embedded text layer of pages. """
+    doc = PdfReader(pdf_path)
+
+    for page in pages:
+        try:
+            text = doc.pages[page - 1].extract_text() or ""
+        except Exception as err:
+            logging.warning(f"Reading text layer of page {page}: {err}")
+            text = ""
+
+        yield page, text
+
+
+def is_usable_text(text: str) -> bool:
+    """ Check whether extracted text layer is worth using.
+
+    Text must have at least `MIN_TEXT_CHARS` non-blank characters, of
+    which at least a fraction `MIN_TEXT_QUALITY` are letters, digits or
+    punctuation (broken font encodings produce replacement characters or
+    `(cid:N)` sequences instead).
+    """
+    chars = "".join(text.split())
+
+    if len(chars) < MIN_TEXT_CHARS or "(cid:" in chars:
+        return False
+
+    regular = sum(c.isalnum() or c in string.punctuation for c in chars)
+    return regular >= MIN_TEXT_QUALITY * len(chars)
+
+
+def iter_page_images(
+        pdf_path: Path | str,
+        dpi: int,
+        pages: list[int],
+        userpw: str,
+        thread_count: int,
+        poppler_path: str,
+        chunk_size: int = 8
+    ) -> Iterator[tuple]:
+    """ Rasterize pages in chunks, yielding `(page, image)` pairs.
+
+    Chunks are runs of at most `chunk_size` consecutive pages of the
+    sorted list `pages`, each rasterized with a single poppler call.
+    """
+    chunk = []
+
+    for page in [*pages, None]:
+        if chunk and (page is None or page != chunk[-1] + 1
+                      or len(chunk) == chunk_size):
+            image_list = pdf_to_images(pdf_path, dpi, chunk[0], chunk[-1],
+                userpw, min(thread_count, len(chunk)), poppler_path)
+
+            # Pages cannot be identified if some failed to rasterize.
+            if len(image_list) != len(chunk):
+                raise RuntimeError(f"Got {len(image_list)} images for pages "
+                                   f"{chunk[0]}-{chunk[-1]}")
+
+            yield from zip(chunk, image_list)
+            chunk = []
+
+        if page is not None:
+            chunk.append(page)
+
+
+def _init_ocr_worker(tesseract_cmd) -> None:
+    """ Configure tesseract in worker process. """
+    # Parallelism comes from pages, avoid oversubscribing cores.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def _ocr_page(image, **options) -> str:
+    """ Extract text from a single page image. """
+    return image_to_string(image, **options)
+
+
+def ocr_pages(
+        pages: Iterator[tuple],
+        tesseract_cmd: Path,
+        workers: int = None,
+        queue_size: int = 8,
+        **options
+    ) -> Iterator[tuple]:
+    """ Recognize text of `(page, image)` pairs in a process pool.
+
+    Pages are consumed from `pages` (*e.g.* while they are rasterized)
+    and submitted to the pool; results are yielded as `(page, text)` in
+    page order, keeping at most `queue_size` pages ahead of consumer.
+    Keyword `options` (`lang`, `config`) are provided to tesseract.
+    """
+    pending = deque()
+    workers = workers or os.cpu_count()
+
+    with ProcessPoolExecutor(workers, initializer=_init_ocr_worker,
+                             initargs=(tesseract_cmd,)) as pool:
+        for page, image in pages:
+            future = pool.submit(_ocr_page, image, **options)
+            pending.append((page, future))
+
+            while len(pending) > queue_size:
+                page, future = pending.popleft()
+                yield page, future.result()
+
+        while pending:
+            page, future = pending.popleft()
+            yield page, future.result()
+
+
 def image_to_text(image_list) -> str:
     """ Extract text from sequence of images. """
-    texts = ""
+    texts = []
 
     try:
         for idx, image in enumerate(image_list):
             logging.info(f"Image {idx+1}/{len(image_list)}")
-            texts += image_to_string(image)
-            texts += "\n---\n"
+            texts.append(image_to_string(image))
 
     except Exception as err:
         logging.error(f"Extracting text from image: {err}")
 
-    return texts
+    return "".join(f"{text}\n---\n" for text in texts)
 
 
 def get_converter(
         tesseract_cmd: Path = None,
-        poppler_cmd: Path = None
+        poppler_cmd: Path = None,
+        cache_dir: Path = None
     ) -> callable:
     """ Generate a converter for the current environment. """
     init_logger()
@@ -178,7 +423,7 @@ def get_converter(
     logging.info(F"tesseract is {tesseract_cmd}")
     logging.info(F"poppler at {poppler_path}")
 
-    return PdfToTextConverter(tesseract_cmd, poppler_path)
+    return PdfToTextConverter(tesseract_cmd, poppler_path, cache_dir)
 
 
 # TODO support direct image conversion.
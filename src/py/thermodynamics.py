@@ -10,5 +10,13 @@ class MaierKelleySpecificHeat:
         return (a[0] + a[1] * T + a[2] * pow(T, -2)) / M
 
     def mixture_specific_heat(self, T, Y, M, a):
-        """ Mixture averaged specific heat [J/(kg.K)]. """
-        return np.sum(Y * self.specific_heat(T, M, a.T))
+        """ Mixture averaged specific heat [J/(kg.K)].
+
+        Temperature might be an array, in which case all species are
+        evaluated at once over a `(*T.shape, n_species)` grid and mass
+        fractions `Y` are given either as `(n_species,)` for a single
+        composition or as `(*T.shape, n_species)`.
+        """
+        T = np.asarray(T, dtype=float)
+        cp = self.specific_heat(T[..., None], M, np.asarray(a).T)
+        return np.sum(Y * cp, axis=-1)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+""" Tests of PDF to text conversion with stubbed external tools. """
+from pathlib import Path
+import importlib
+import sys
+import types
+import pytest
+
+SRC_PY = Path(__file__).resolve().parents[1] / "src" / "py"
+
+BORN_DIGITAL = "Born digital page {} with plenty of regular text in it."
+
+
+class StubPage:
+    """ PDF page whose text layer is usable for even page numbers. """
+    def __init__(self, page):
+        self._page = page
+
+    def extract_text(self):
+        return BORN_DIGITAL.format(self._page) if self._page % 2 == 0 else ""
+
+
+class StubReader:
+    """ PDF document of ten pages. """
+    def __init__(self, path):
+        self.pages = [StubPage(k + 1) for k in range(10)]
+        self.is_encrypted = False
+        self.metadata = {}
+
+
+@pytest.fixture
+def pdf_convert(monkeypatch):
+    """ Import module with poppler, tesseract and PyPDF2 replaced. """
+    rasterized = []
+
+    def convert_from_path(pdf_path, first_page, last_page, **kwargs):
+        rasterized.extend(range(first_page, last_page + 1))
+        return [f"image {p}" for p in range(first_page, last_page + 1)]
+
+    def image_to_string(image, **kwargs):
+        return f"ocr of {image}"
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = convert_from_path
+
+    pytesseract = types.ModuleType("pytesseract")
+    pytesseract.pytesseract = types.SimpleNamespace(tesseract_cmd=None)
+    pytesseract.image_to_string = image_to_string
+
+    pypdf2 = types.ModuleType("PyPDF2")
+    pypdf2.PdfReader = StubReader
+
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    monkeypatch.setitem(sys.modules, "PyPDF2", pypdf2)
+    monkeypatch.syspath_prepend(str(SRC_PY))
+    monkeypatch.delitem(sys.modules, "pdf_convert", raising=False)
+
+    module = importlib.import_module("pdf_convert")
+    module.rasterized = rasterized
+    return module
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """ File with some contents to be hashed. """
+    path = tmp_path / "document.pdf"
+    path.write_bytes(b"%PDF-stub")
+    return path
+
+
+def test_text_layer_and_ocr_merge_order(pdf_convert, pdf_path, tmp_path):
+    """ Pages from text layer and OCR are merged in page order. """
+    converter = pdf_convert.PdfToTextConverter("tesseract", None,
+                                               cache_dir=tmp_path / "cache")
+    text = converter(pdf_path, first_page=2, last_page=9, workers=1,
+                     chunk_size=2)
+
+    expected = [BORN_DIGITAL.format(p) if p % 2 == 0 else f"ocr of image {p}"
+                for p in range(2, 10)]
+
+    assert text.split("\n---\n")[:-1] == expected
+    assert pdf_convert.rasterized == [3, 5, 7, 9]
+
+    # Second run is served from text layer and cache only.
+    pdf_convert.rasterized.clear()
+    assert converter(pdf_path, first_page=2, last_page=9) == text
+    assert pdf_convert.rasterized == []
+
+
+def test_dropped_page_is_not_cached(pdf_convert, pdf_path, tmp_path):
+    """ Missing images never lead to text stored under wrong pages. """
+    def convert_from_path(pdf_path, first_page, last_page, **kwargs):
+        pages = range(first_page, last_page + 1)
+        return [f"image {p}" for p in pages if p != 3]
+
+    pdf_convert.convert_from_path = convert_from_path
+
+    cache_dir = tmp_path / "cache"
+    converter = pdf_convert.PdfToTextConverter("tesseract", None,
+                                               cache_dir=cache_dir)
+    text = converter(pdf_path, first_page=1, last_page=6, workers=1,
+                     chunk_size=4, text_layer=False)
+
+    assert "ocr of image 4" not in text
+    assert not [p for p in cache_dir.rglob("*.txt")
+                if p.read_text() != f"ocr of image {int(p.stem[5:])}"]
@@ -3,13 +3,15 @@ from cantera import gas_constant
 from cantera import stefan_boltzmann
 from casadi import exp
 from casadi import heaviside
+from casadi import log
 from casadi import sqrt
 from casadi import sum1
 from casadi import vertcat
-from casadi import nlpsol
+from casadi import DM
 from casadi import Function
 from casadi import MX
 from casadi import SX
+from majordome.solvers import cached_nlpsol
 from majordome.utilities import Capturing
 from scipy.special import polygamma
 import cantera as ct
@@ -71,78 +73,122 @@ KG_COEFS = [-7.494e-03, +1.709e-04, -2.377e-07,
             +2.202e-10, -9.463e-14, +1.581e-17]
 
 
-class Species:
-    """ Chemical species with NASA7 thermophysical properties.
-    
-    TODO
-    ----
-    - Implement kinetic theory transport properties.
+class Nasa7Database:
+    """ NASA7 thermophysical properties of all species of a mixture.
+
+    Coefficients of all species are packed into `(N_species, 7)` arrays
+    for each temperature range, so that properties of all species are
+    evaluated with a single product with a temperature basis, ranges being
+    selected by a mask over temperatures. Numeric temperatures of shape
+    `(N_T,)` produce `(N_T, N_species)` matrices, scalars producing vectors
+    of shape `(N_species,)`, while symbolic (CasADi) scalar temperatures
+    produce column vectors of species properties, so that the same engine
+    serves numerical evaluation and NLP formulation.
+    Temperature derivatives are provided analytically for Jacobians.
 
     Parameters
     ----------
-    mw : float
-        Species molecular weight [g/mol].
-    lo : list[float]
-        Low temperature NASA7 polynomial coefficients.
-    hi : list[float]
-        High temperature NASA7 polynomial coefficients.
+    db : dict[str, tuple[float, list[float], list[float]]]
+        Database dictionary with keyes as species names and values
+        of molecular weight, low, and high temperature NASA7 data.
     Tc : float
         Temperature of change between `lo` and `hi` ranges.
     """
-    def __init__(self, mw, lo, hi, Tc=1000.0):
-        self._mw = mw
+    def __init__(self, db, Tc=1000.0):
+        self._names = list(db.keys())
+        self._mw = np.array([data[0] for data in db.values()])
+        self._lo = np.array([data[1] for data in db.values()])
+        self._hi = np.array([data[2] for data in db.values()])
         self._Tc = Tc
 
-        T = SX.sym("T")
-        self._c = self._poly_nasa7_c(T, lo, hi)
-        self._h = self._poly_nasa7_h(T, lo, hi)
+    @staticmethod
+    def _basis_c(T):
+        """ Temperature basis of specific heat over R. """
+        return [1, T, T**2, T**3, T**4, 0, 0]
+
+    @staticmethod
+    def _basis_h(T):
+        """ Temperature basis of specific enthalpy over R. """
+        return [T, T**2 / 2, T**3 / 3, T**4 / 4, T**5 / 5, 1, 0]
+
+    @staticmethod
+    def _basis_s(T):
+        """ Temperature basis of specific entropy over R. """
+        lnT = log(T) if isinstance(T, (SX, MX)) else np.log(T)
+        return [lnT, T, T**2 / 2, T**3 / 3, T**4 / 4, 0, 1]
+
+    @staticmethod
+    def _basis_dc(T):
+        """ Temperature basis of specific heat derivative over R. """
+        return [0, 1, 2 * T, 3 * T**2, 4 * T**3, 0, 0]
+
+    def _evaluate(self, T, basis):
+        """ Evaluate property of all species over given basis. """
+        if isinstance(T, (SX, MX)):
+            b = vertcat(*basis(T))
+            p_lo = DM(self._lo) @ b
+            p_hi = DM(self._hi) @ b
+            return gas_constant * (p_lo + heaviside(T - self._Tc) *
+                                   (p_hi - p_lo))
+
+        T = np.asarray(T, dtype=float)
+        shape = T.shape
+        T = T.reshape(-1)
+
+        B = np.column_stack(np.broadcast_arrays(*basis(T)))
+
+        p_lo = B @ self._lo.T
+        p_hi = B @ self._hi.T
+        mask = np.heaviside(T - self._Tc, 0.5)[:, None]
+        v = gas_constant * (p_lo + mask * (p_hi - p_lo))
+
+        # Scalar temperatures do not get a leading dimension.
+        return v.reshape((*shape, -1))
 
-    def _poly_nasa7_c(self, T, a, b):
-        """ Compose NASA7 specific heat polynomials. """
-        def poly(c):
-            p = c[0] + c[1] * T + c[2] * T**2 + c[3] * T**3 + c[4] * T**4
-            return p
+    def cp_mole(self, T):
+        """ Species specific heats [J/(mol.K)]. """
+        return self._evaluate(T, self._basis_c)
 
-        p_lo, p_hi = poly(a), poly(b)
-        f = p_lo + heaviside(T - self._Tc) * (p_hi - p_lo)
-        F = Function("cp", [T], [gas_constant * f])
+    def enthalpy_mole(self, T):
+        """ Species specific enthalpies [J/mol]. """
+        return self._evaluate(T, self._basis_h)
 
-        return F
+    def entropy_mole(self, T):
+        """ Species standard state specific entropies [J/(mol.K)]. """
+        return self._evaluate(T, self._basis_s)
 
-    def _poly_nasa7_h(self, T, a, b):
-        """ Compose NASA7 specific enthalpy polynomials. """
-        def poly(c):
-            d = [ck / k for k, ck in enumerate(c[:5], 1)]
-            p = d[0] + d[1] * T + d[2] * T**2 + d[3] * T**3 + d[4] * T**4
-            return p + c[5] / T
+    def cp_mole_derivative(self, T):
+        """ Species specific heats temperature derivative [J/(mol.K²)].
 
-        p_lo, p_hi = poly(a), poly(b)
-        f = p_lo + heaviside(T - self._Tc) * (p_hi - p_lo)
-        F = Function("h", [T], [gas_constant * T * f])
+        Notice that the derivatives of enthalpy and entropy are given
+        by `cp_mole` and `cp_mole / T`, respectively.
+        """
+        return self._evaluate(T, self._basis_dc)
 
-        return F
-
-    def cp_mole(self, T):
-        """ Species specific heat [J/(mol.K)]. """
-        v = self._c(T)
-        return v if isinstance(T, SX) else v.full().ravel()
-    
-    def enthalpy_mole(self, T):
-        """ Species specific enthalpy [J/mol]. """
-        v = self._h(T)
-        return v if isinstance(T, SX) else v.full().ravel()
+    def _per_mass(self, v):
+        """ Convert molar properties of species to mass units. """
+        return v / (DM(self._mw) if isinstance(v, (SX, MX)) else self._mw)
 
     def cp_mass(self, T):
-        """ Species specific heat [J/(g.K)]. """
-        return self.cp_mole(T) / self._mw
+        """ Species specific heats [J/(g.K)]. """
+        return self._per_mass(self.cp_mole(T))
 
     def enthalpy_mass(self, T):
-        """ Species specific enthalpy [J/g]. """
-        return self.enthalpy_mole(T) / self._mw
+        """ Species specific enthalpies [J/g]. """
+        return self._per_mass(self.enthalpy_mole(T))
+
+    def cp_mass_derivative(self, T):
+        """ Species specific heats temperature derivative [J/(g.K²)]. """
+        return self._per_mass(self.cp_mole_derivative(T))
+
+    @property
+    def species_names(self):
+        """ Returns list of species in database. """
+        return self._names
 
     @property
-    def molecular_weight(self):
-        """ Species molecular weight [g/mol]. """
+    def molecular_weights(self):
+        """ Species molecular weights [g/mol]. """
         return self._mw
 
 
@@ -160,17 +206,19 @@ class Mixture:
         of molecular weight, low, and high temperature NASA7 data.
     """
     def __init__(self, db):
-        sol = {name: Species(*data) 
-               for name, data in db.items()}
-
-        mw = [s.molecular_weight for s in sol.values()]
-        
-        self._sol = sol
-        self._mw = np.array(mw)
+        self._db = Nasa7Database(db)
+        self._mw = self._db.molecular_weights
 
-        self._species_names = list(self._sol.keys())
+        self._species_names = self._db.species_names
         self._n_species = len(self._species_names)
 
+    @staticmethod
+    def _weighted_sum(v, Y):
+        """ Sum species properties `v` weighted by fractions `Y`. """
+        if isinstance(v, (SX, MX)):
+            return sum1(v * Y)
+        return np.sum(v * Y, axis=-1)
+
     def mean_molecular_mass(self, V, inputs="mass"):
         """ Mixture mean molecular mass in [g/mol]. """
         match inputs:
@@ -191,13 +239,25 @@ class Mixture:
         return P * mw / (gas_constant * T)
 
     def specific_heat(self, T, Y):
-        """ Mass weighted average of mixture specific heat. """
-        return sum([s.cp_mass(T) * Y[k]
-                    for k, s in enumerate(self._sol.values())])
+        """ Mass weighted average of mixture specific heat.
+
+        For numerical temperatures of shape `(N_T,)` mass fractions are
+        either `(N_species,)` or `(N_T, N_species)`.
+        """
+        return self._weighted_sum(self._db.cp_mass(T), Y)
+
+    def specific_heat_derivative(self, T, Y):
+        """ Temperature derivative of mixture specific heat. """
+        return self._weighted_sum(self._db.cp_mass_derivative(T), Y)
 
     def enthalpies(self, T):
-        """ Array of enthalpies of mixture species. """
-        return np.array([s.enthalpy_mass(T) for s in self._sol.values()])
+        """ Species enthalpies, `(*T.shape, N_species)` if numerical. """
+        return self._db.enthalpy_mass(T)
+
+    @property
+    def database(self):
+        """ Provides access to species properties engine. """
+        return self._db
 
     @property
     def species_names(self):
@@ -310,6 +370,10 @@ class ConsSectWalledPfr:
         eps_w=0.9,
         eps_s=0.8
     ):
+        # Problem signature for solver caching.
+        self._signature = ("ConsSectWalledPfr", R, Lz, Nz, dR, mdot,
+                           Te, kr, n, beta, eps_w, eps_s)
+
         # Store base parameters.
         self._Lz = Lz
         self._Nz = Nz
@@ -516,11 +580,8 @@ class ConsSectWalledPfr:
 
         return df
 
-    def solve(self, y0, t0, verbosity=3):
-        """ Perform multiple shooting solution of problem. """
-        # Bounds of variables values per cell.
-        lbx, ubx = self.__get_solution_bounds([*y0, t0], self._Nz)
-
+    def __formulate(self):
+        """ Formulate multiple shooting NLP of problem. """
         # Variables, constraints.
         x, g = [], []
 
@@ -546,9 +607,17 @@ class ConsSectWalledPfr:
             # Constrain problem.
             g.extend([xp - xk, gk])
 
-        x = vertcat(*x)
-        g = vertcat(*g)
-        results, out = _ipopt_solve(x, g, lbx, ubx, verbosity)
+        return {"x": vertcat(*x), "f": 1, "g": vertcat(*g)}
+
+    def solve(self, y0, t0, verbosity=3, codegen=False):
+        """ Perform multiple shooting solution of problem. """
+        # Bounds of variables values per cell.
+        lbx, ubx = self.__get_solution_bounds([*y0, t0], self._Nz)
+
+        # Initial state only enters the problem through bounds.
+        results, out = _ipopt_solve(self._signature, self.__formulate,
+                                    lbx, ubx, verbosity=verbosity,
+                                    codegen=codegen)
 
         df = self.__retrieve_solution(results)
         df["z"] = np.linspace(0.0, self._Lz, self._Nz+1)
@@ -633,27 +702,25 @@ def freeboard_viscosity(T):
 
 def validate_database_properties(db, gas, Ts=(300, 3000, 100)):
     """ Compare all species properties against Cantera. """
-    def validate_species_properties(name, mw, lo, hi, gas, T):
-        """ Compare species properties against Cantera. """
-        spe = Species(mw, lo, hi)
-
-        c1 = spe.cp_mole(T)[0]
-        c2 = gas.species(name).thermo.cp(T)
-        is_c_ok = np.allclose(c1, c2, rtol=1.0e-06, atol=1.0e-03)
+    T = np.linspace(*Ts)
+    nasa = Nasa7Database(db)
 
-        h1 = spe.enthalpy_mole(T)[0]
-        h2 = gas.species(name).thermo.h(T)
-        is_h_ok = np.allclose(h1, h2, rtol=1.0e-06, atol=1.0e-03)
+    sarr = ct.SolutionArray(gas, shape=T.shape)
+    sarr.TP = T, ct.one_atm
+    idx = [gas.species_index(name) for name in nasa.species_names]
 
-        return is_c_ok and is_h_ok
+    c1 = nasa.cp_mole(T)
+    c2 = gas_constant * sarr.standard_cp_R[:, idx]
+    is_c_ok = np.isclose(c1, c2, rtol=1.0e-06, atol=1.0e-03)
 
-    for T in np.linspace(*Ts):
-        for name, (mw, lo, hi) in db.items():
-            is_ok = validate_species_properties(name, mw, lo, hi, gas, T)
+    h1 = nasa.enthalpy_mole(T)
+    h2 = gas_constant * T[:, None] * sarr.standard_enthalpies_RT[:, idx]
+    is_h_ok = np.isclose(h1, h2, rtol=1.0e-06, atol=1.0e-03)
 
-            if not is_ok:
-                print(f"Failed validating {name} at {T}K")
-                return False
+    if not (is_ok := is_c_ok & is_h_ok).all():
+        i, k = np.argwhere(~is_ok)[0]
+        print(f"Failed validating {nasa.species_names[k]} at {T[i]}K")
+        return False
 
     return True
 
@@ -706,7 +773,7 @@ def plot_reactor_state(df, ylim1=None, ylim2=None):
 
 
 def solve_constrain_method(mix, Nz, Lz, y0, t0, mdot, Ac, Pc,
-                           htc, Tw, verbosity=3):
+                           htc, Tw, verbosity=3, codegen=False):
     """ Formulate problem as finite differences constraints. """
     # Length of slice over flow direction [m].
     dz = Lz / Nz
@@ -714,6 +781,85 @@ def solve_constrain_method(mix, Nz, Lz, y0, t0, mdot, Ac, Pc,
     # The following is true across all sections:
     rho_u = mdot / Ac
 
+    # Bounds of variables values per cell.
+    lbx, ubx = _get_solution_bounds([*y0, t0], Nz)
+
+    # Only problem structure enters the signature, values are parameters.
+    signature = ("solve_constrain_method", *_mixture_signature(mix), Nz)
+    builder = lambda: _formulate_constrain_method(mix, Nz)
+    p = [rho_u, htc, Pc, Ac, Tw, dz]
+
+    results, out = _ipopt_solve(signature, builder, lbx, ubx, p=p,
+                                verbosity=verbosity, codegen=codegen)
+
+    df = _retrieve_solution(results, mix)
+    df["z"] = np.linspace(0.0, Lz, Nz+1)
+
+    return df, out
+
+
+def solve_multiple_shooting(mix, Nz, Lz, y0, t0, mdot, areac, perim,
+                            htcfn, tempw, kefun, verbosity=3, codegen=False,
+                            parallelization="serial", warm_start=True):
+    """ Formulate problem through multiple shooting constraints.
+
+    Integration of all segments is mapped over a single RK4 stepper, so
+    that problem assembly does not grow with `Nz`; `parallelization` is
+    provided to CasADi `map` and can be `"serial"`, `"openmp"` (requires
+    CasADi built with OpenMP, otherwise falls back to serial), or
+    `"thread"`. Segment sensitivities are computed by forward AD through
+    the mapped stepper. If `warm_start`, the NLP initial guess is the
+    single-shooting trajectory obtained by chaining the stepper from the
+    inlet state.
+    """
+    # Length of slice over flow direction [m].
+    dz = Lz / Nz
+
+    # Parameters of all slices, evaluated at start and middle of slices.
+    get_params = _make_get_params(mdot, areac, perim, kefun, tempw, htcfn)
+    P = np.array([[*get_params(k * dz), *get_params(k * dz + dz / 2)]
+                  for k in range(Nz)]).T
+    p = np.hstack((P.ravel(order="F"), dz))
+
+    # Bounds of variables values per cell.
+    lbw, ubw = _get_solution_bounds([*y0, t0], Nz)
+
+    # Initial guess from a cheap forward (single-shooting) integration.
+    x0 = None
+
+    if warm_start:
+        x0 = _single_shooting_guess(mix, [*y0, t0], P, dz)
+        x0 = np.clip(x0, lbw, ubw)
+
+    # Only problem structure enters the signature, values are parameters.
+    signature = ("solve_multiple_shooting", *_mixture_signature(mix), Nz,
+                 parallelization)
+    builder = lambda: _formulate_multiple_shooting(mix, Nz, parallelization)
+
+    results, out = _ipopt_solve(signature, builder, lbw, ubw, p=p, x0=x0,
+                                verbosity=verbosity, codegen=codegen)
+
+    df = _retrieve_solution(results, mix)
+    df["z"] = np.linspace(0.0, Lz, Nz+1)
+
+    return df, out
+
+
+def _mixture_signature(mix):
+    """ Hashable identification of mixture for solver caching. """
+    return (mix.__class__.__name__, tuple(mix.species_names))
+
+
+def _formulate_constrain_method(mix, Nz):
+    """ Create parametric finite differences constraints NLP. """
+    # Free parameters of problem.
+    rho_u = SX.sym("rho_u")
+    htc = SX.sym("htc")
+    Pc = SX.sym("Pc")
+    Ac = SX.sym("Ac")
+    Tw = SX.sym("Tw")
+    dz = SX.sym("dz")
+
     # Number of equations to solve per slice.
     Ns = 1 + mix.n_species
 
@@ -726,16 +872,10 @@ def solve_constrain_method(mix, Nz, Lz, y0, t0, mdot, Ac, Pc,
     # Array of constraints with initial state.
     g = []
 
-    # Bounds of variables values per cell.
-    lbx, ubx = _get_solution_bounds([*y0, t0], Nz)
-
     # Create ODE model for slices derivatives.
     ode, _, _ = _formulate_ode_problem(mix)
 
-    # Initialize cellz coordinate.
-    z = 0
-
-    for k in range(Ns, Ne + Ns, Ns):
+    for j, k in enumerate(range(Ns, Ne + Ns, Ns)):
         # Get slice/past slice indices over array.
         last = k + Ns - 1
         past = k - Ns
@@ -743,73 +883,57 @@ def solve_constrain_method(mix, Nz, Lz, y0, t0, mdot, Ac, Pc,
         # Retrieve slice state.
         Xk = X[k:last+1]
 
-        # k-epsilon ratio proposed by Mujumdar.
-        ke = z / Lz
-        z += dz
+        # k-epsilon ratio proposed by Mujumdar (z / Lz).
+        ke = j / Nz
 
         # Compute RHS of ODE system.
-        dXdz = ode(Xk, [rho_u, ke, htc, Pc, Ac, Tw])
+        dXdz = ode(Xk, vertcat(rho_u, ke, htc, Pc, Ac, Tw))
 
         # Add ODE constraints.
-        g.extend([
-            (Xk[0] - X[past+0]) / dz - dXdz[0],
-            (Xk[1] - X[past+1]) / dz - dXdz[1],
-            (Xk[2] - X[past+2]) / dz - dXdz[2],
-            (Xk[3] - X[past+3]) / dz - dXdz[3],
-            (Xk[4] - X[past+4]) / dz - dXdz[4],
-            (Xk[5] - X[past+5]) / dz - dXdz[5],
-            (Xk[6] - X[past+6]) / dz - dXdz[6]
-        ])
-
-    results, out = _ipopt_solve(X, vertcat(*g), lbx, ubx, verbosity)
+        g.append((Xk - X[past:past+Ns]) / dz - dXdz)
 
-    df = _retrieve_solution(results, mix)
-    df["z"] = np.linspace(0.0, Lz, Nz+1)
-
-    return df, out
+    p = vertcat(rho_u, htc, Pc, Ac, Tw, dz)
+    return {"x": X, "p": p, "f": 1, "g": vertcat(*g)}
 
 
-def solve_multiple_shooting(mix, Nz, Lz, y0, t0, mdot, areac, perim,
-                            htcfn, tempw, kefun, verbosity=3):
-    """ Formulate problem through multiple shooting constraints. """
-    # Length of slice over flow direction [m].
-    dz = Lz / Nz
-
-    # Integrator for generating stepping function.
-    integ_rk4 = _make_get_stepper_rk4(
-        mix, dz, mdot, areac, perim, kefun, tempw, htcfn)
+def _formulate_multiple_shooting(mix, Nz, parallelization="serial"):
+    """ Create parametric multiple shooting NLP.
 
-    # List of variables
-    w = []
+    Variables are the states at all slice boundaries, stored as columns of
+    a matrix; the stepper is mapped over all slices at once and the lifted
+    states are constrained to match the integrated ones.
+    """
+    F = _make_stepper_rk4(mix).map(Nz, parallelization)
 
-    # Bounds of variables values per cell.
-    lbw, ubw = _get_solution_bounds([*y0, t0], Nz)
+    # Number of equations to solve per slice.
+    Ns = 1 + mix.n_species
 
-    # Constraints
-    g = []
+    # States at slice boundaries, parameters at start and middle of each
+    # slice, and step.
+    X = MX.sym("X", Ns, Nz + 1)
+    P = MX.sym("P", 12, Nz)
+    dz = MX.sym("dz")
 
-    # Create and enforce initial state.
-    Xk = MX.sym("X0", 7)
-    w.append(Xk)
+    # Integrate all slices and constrain to the "lifted" states.
+    g = F(X[:, :-1], P[:6, :], P[6:, :], dz) - X[:, 1:]
 
-    for k in range(Nz):
-        # Create and call integrator, and "lift" the variable.
-        X_prev = integ_rk4(k * dz)(Xk)
+    x = X.reshape((-1, 1))
+    p = vertcat(P.reshape((-1, 1)), dz)
+    return {"x": x, "p": p, "f": 1, "g": g.reshape((-1, 1))}
 
-        # Create new symbolic state
-        Xk = MX.sym(f"X{k+1}", 7)
-        w.append(Xk)
 
-        # Constrain problem
-        g.append(X_prev - Xk)
+def _single_shooting_guess(mix, X0, P, dz):
+    """ Chain stepper over all slices from inlet state `X0`. """
+    F = _make_stepper_rk4(mix)
 
-    results, out = _ipopt_solve(vertcat(*w), vertcat(*g),
-                               lbw, ubw, verbosity)
+    Xk = DM(X0)
+    trajectory = [Xk]
 
-    df = _retrieve_solution(results, mix)
-    df["z"] = np.linspace(0.0, Lz, Nz+1)
+    for k in range(P.shape[1]):
+        Xk = F(Xk, P[:6, k], P[6:, k], dz)
+        trajectory.append(Xk)
 
-    return df, out
+    return np.hstack([Xk.full() for Xk in trajectory]).ravel(order="F")
 
 
 def _get_solution_bounds(X0, Nz):
@@ -861,10 +985,15 @@ def _formulate_ode_problem(mix):
     return f, x, p
 
 
-def _ipopt_solve(x, g, lbx, ubx, verbosity=3):
-    """ Solve reactor NLP and returns results and outputs. """
-    nlp = {"x": x, "f": 1, "g": g}
+def _ipopt_solve(signature, builder, lbx, ubx, p=None, x0=None,
+                 verbosity=3, codegen=False):
+    """ Solve reactor NLP and returns results and outputs.
 
+    Solvers are cached by `signature` (and solver options) and `builder`
+    is only called the first time a given problem structure is required.
+    If no initial guess `x0` is provided, the middle of the upper bounds
+    is used.
+    """
     # https://coin-or.github.io/Ipopt/OPTIONS.html
     opts = {
         "ipopt.print_level": verbosity,
@@ -872,17 +1001,22 @@ def _ipopt_solve(x, g, lbx, ubx, verbosity=3):
         # "ipopt.output_file": "ipopt.txt"
     }
 
-    solver = nlpsol("solver", "ipopt", nlp, opts)
+    solver = cached_nlpsol(signature, builder, opts=opts, codegen=codegen)
+
+    x0 = ubx / 2 if x0 is None else x0
+    args = dict(x0=x0, lbx=lbx, ubx=ubx, lbg=0.0, ubg=0.0)
+
+    if p is not None:
+        args["p"] = p
 
     with Capturing() as out:
-        results = solver(x0=ubx/2, lbx=lbx, ubx=ubx, lbg=0.0, ubg=0.0)
+        results = solver(**args)
 
     return results, "\n".join(out)
 
 
-def _make_get_stepper_rk4(mix, dz, mdot, areac, perim, kefun, tempw, htcfn):
-    f, x, _ = _formulate_ode_problem(mix)
-
+def _make_get_params(mdot, areac, perim, kefun, tempw, htcfn):
+    """ Create function evaluating ODE parameters at coordinate. """
     def get_params(t):
         """ Compute parameters at current coordinate. """
         A = areac(t)
@@ -892,29 +1026,33 @@ def _make_get_stepper_rk4(mix, dz, mdot, areac, perim, kefun, tempw, htcfn):
         ke = kefun(t)
         return [mdot / A, ke, h, P, A, W]
 
-    def get_stepper_rk4(z):
-        """ Retrieve stepping function for current coordinate. """
-        # Intermediate parameters.
-        p1 = get_params(t=z)
-        p2 = get_params(t=z + dz / 2)
+    return get_params
+
+
+def _make_stepper_rk4(mix):
+    """ Create RK4 stepping function with parameters as inputs. """
+    f, x, _ = _formulate_ode_problem(mix)
 
-        # Evaluate intermediate steps.
-        k0 = 0.0
-        k1 = f(x + k0 * dz / 1, p1)
-        k2 = f(x + k1 * dz / 2, p2)
-        k3 = f(x + k2 * dz / 2, p2)
-        k4 = f(x + k3 * dz / 1, p1)
+    p1 = SX.sym("p1", 6)
+    p2 = SX.sym("p2", 6)
+    dz = SX.sym("dz")
 
-        # # Step towards new solution.
-        dx = (k1 + 2 * k2 + 2 * k3 + k4) * dz / 6
+    # Evaluate intermediate steps.
+    k0 = 0.0
+    k1 = f(x + k0 * dz / 1, p1)
+    k2 = f(x + k1 * dz / 2, p2)
+    k3 = f(x + k2 * dz / 2, p2)
+    k4 = f(x + k3 * dz / 1, p1)
 
-        # XXX: simple Euler debug.
-        # dx = f(x, p1) * dz
+    # # Step towards new solution.
+    dx = (k1 + 2 * k2 + 2 * k3 + k4) * dz / 6
 
-        # Return step integrator.
-        return Function("F", [x], [x + dx], ["x"], ["xf"])
+    # XXX: simple Euler debug.
+    # dx = f(x, p1) * dz
 
-    return get_stepper_rk4
+    # Return step integrator.
+    return Function("F", [x, p1, p2, dz], [x + dx],
+                    ["x", "p1", "p2", "dz"], ["xf"])
 
 
 def _retrieve_solution(results, mix):
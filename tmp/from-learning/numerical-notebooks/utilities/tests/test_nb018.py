@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+casadi = pytest.importorskip("casadi")
+pytest.importorskip("cantera")
+
+from utilities.nb018 import NASA7_CH4_1S
+from utilities.nb018 import Nasa7Database
+from cantera import gas_constant
+
+# Temperatures spanning both ranges of NASA7 polynomials [K].
+TEMPERATURES = np.array([300.0, 800.0, 1000.0, 1500.0, 2000.0])
+
+
+def nasa7(a, T):
+    """ Reference specific heat, enthalpy and entropy of one species. """
+    cp = a[0] + a[1] * T + a[2] * T**2 + a[3] * T**3 + a[4] * T**4
+    h = (a[0] * T + a[1] * T**2 / 2 + a[2] * T**3 / 3 + a[3] * T**4 / 4
+         + a[4] * T**5 / 5 + a[5])
+    s = (a[0] * np.log(T) + a[1] * T + a[2] * T**2 / 2 + a[3] * T**3 / 3
+         + a[4] * T**4 / 4 + a[6])
+    return gas_constant * np.array([cp, h, s])
+
+
+@pytest.mark.parametrize("prop, k", [
+    ("cp_mole", 0),
+    ("enthalpy_mole", 1),
+    ("entropy_mole", 2),
+])
+def test_array_matches_species(prop, k):
+    """ Array evaluation matches species evaluated one at a time. """
+    db = Nasa7Database(NASA7_CH4_1S)
+    values = getattr(db, prop)(TEMPERATURES)
+
+    assert values.shape == (TEMPERATURES.size, len(NASA7_CH4_1S))
+
+    for j, (_, lo, hi) in enumerate(NASA7_CH4_1S.values()):
+        for i, T in enumerate(TEMPERATURES):
+            ref = nasa7(lo if T < 1000.0 else hi, T)[k]
+
+            # Ranges are blended at change temperature.
+            if T == 1000.0:
+                ref = (nasa7(lo, T)[k] + nasa7(hi, T)[k]) / 2
+
+            assert values[i, j] == pytest.approx(ref, rel=1.0e-12)
+            assert getattr(db, prop)(T)[j] == pytest.approx(values[i, j])
+
+
+def test_symbolic_entropy_matches_numeric():
+    """ Symbolic evaluation agrees with numeric one. """
+    db = Nasa7Database(NASA7_CH4_1S)
+    T = casadi.SX.sym("T")
+    f = casadi.Function("s", [T], [db.entropy_mole(T)])
+
+    for Tk in TEMPERATURES[TEMPERATURES != 1000.0]:
+        s = np.asarray(f(Tk)).ravel()
+        assert np.allclose(s, db.entropy_mole(Tk), rtol=1.0e-12)
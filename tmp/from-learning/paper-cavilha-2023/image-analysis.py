@@ -1,17 +1,21 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
 from pathlib import Path
+from tempfile import TemporaryFile
 from typing import Optional
 from networkx import DiGraph
 from networkx import draw
-from scipy.spatial.distance import euclidean
-from skimage.filters import gaussian
+from scipy.ndimage import binary_dilation
+from scipy.ndimage import binary_erosion
+from scipy.ndimage import gaussian_filter
+from scipy.spatial import cKDTree
 from skimage.filters import threshold_otsu
 from skimage.io import imread
 from skimage.measure import find_contours
 from skimage.measure import label
-from skimage.measure import regionprops
 from skimage.measure import regionprops_table
+import hashlib
 import json
 import re
 import numpy as np
@@ -38,6 +42,12 @@ PROPERTIES = (
 )
 """ Selected properties for tabulation of zones. """
 
+BBOX = ("bbox-0", "bbox-1", "bbox-2", "bbox-3")
+""" Bounding box columns (min row, min col, max row, max col). """
+
+CACHE_PATH = ROOT_PATH / "media/outputs/cache"
+""" Path to cached segmentation results. """
+
 LEGEND = {
     "area": "Pore mean area [µm²]",
     "area_ratio": "Ratio of area to bounding box [-]",
@@ -54,45 +64,61 @@ LEGEND = {
 
 
 class WorkflowPorosity:
-    """ Manage quantification of porosity in samples. """
-    def __init__(self, all_files, force=False):
+    """ Manage quantification of porosity in samples.
+
+    Images are segmented in parallel (see `segment_images`) and porosity
+    statistics are computed from cached masks; figures are only rendered
+    if `figures` is set and they do not exist yet (or `force` is set).
+    """
+    def __init__(self, all_files, force=False, sigma=15,
+                 workers=None, figures=True, mode="full"):
         print("\n\nStarting `WorflowPorosity`")
         path_porosity = ROOT_PATH / "media/outputs/porosity"
         path_porosity.mkdir(exist_ok=True, parents=True)
 
-        # To be filled in `__workflow`.
-        self._bias = []
-        self._porosity = []
+        # Segment normal and manual images in a single batch.
+        fnames = [f[0] for f in all_files] + [f[1] for f in all_files]
+        segmented = segment_images(fnames, sigma, workers=workers,
+                                   force=force, mode=mode)
+        segs_n = segmented[:len(all_files)]
+        segs_m = segmented[len(all_files):]
 
-        for k, (file_n, file_m, stem) in enumerate(all_files):
+        for k, (_, _, stem) in enumerate(all_files):
             results = [
                 path_porosity / f"porosity-{stem}-01-compare.png",
                 path_porosity / f"porosity-{stem}-02-publish.png",
                 path_porosity / f"porosity-{stem}-03-check.png",
             ]
 
+            if not figures:
+                continue
+
             if all(r.exists() for r in results) and not force:
                 print(f"Already treated ({k:03d}) {stem}")
                 continue
             
             print(f"Processing ({k:03d}) {stem}")
-            figs = self.__workflow(file_n, file_m, sigma=15)
+            figs = self.__workflow(segs_n[k], segs_m[k])
             figs[0].savefig(results[0], dpi=300)
             figs[1].savefig(results[1], dpi=300)
             figs[2].savefig(results[2], dpi=300)
 
+        porosity_n = np.array([s.porosity for s in segs_n])
+        porosity_m = np.array([s.porosity for s in segs_m])
+
         df = pd.DataFrame({
             "stem": [s[2] for s in all_files],
-            "bias": self._bias,
-            "porosity": self._porosity
+            "bias": porosity_n - porosity_m,
+            "porosity": porosity_m
         })
         df.to_csv(path_porosity / "results.csv", index=False)
         print(df.describe().T)
 
-    def __workflow(self, file_n, file_m, sigma):
+    def __workflow(self, seg_n, seg_m):
         """ Compare raw and patched images in terms of porosity level. """
-        img_n, _, cont_n, porosity_n = _segment(file_n, sigma)
-        img_m, _, cont_m, porosity_m = _segment(file_m, sigma)
+        img_n, img_m = seg_n.image(), seg_m.image()
+        cont_n, cont_m = seg_n.contours(), seg_m.contours()
+        porosity_n, porosity_m = seg_n.porosity, seg_m.porosity
         
         def add_subplot(ax, img, contours, porosity, name=None, lw=1):
             """ Create same format of display for each image. """
@@ -108,9 +134,6 @@ class WorkflowPorosity:
             
             ax.axis("off")
             
-        self._bias.append(porosity_n - porosity_m)
-        self._porosity.append(porosity_m)
-
         plt.close("all")
         fig1, (ax_n, ax_m) = plt.subplots(1, 2, figsize=(12, 5))
         add_subplot(ax_n, img_n, cont_n, porosity_n, name="normal")
@@ -135,12 +158,21 @@ class WorkflowPorosity:
 
 
 class WorkflowRegions:
-    """ Manage quantification of region properties in samples. """
+    """ Manage quantification of region properties in samples.
+
+    Manually edited images are segmented in parallel and cached (see
+    `segment_images`), so that tables and row-wise distances are computed
+    without rendering; `cutoff` only applies to the regions displayed in
+    figures, thus changing it does not require a new segmentation.
+    """
     def __init__(self,
             all_files,
             sigma=10,
             cutoff=100,
-            force=False
+            force=False,
+            workers=None,
+            figures=True,
+            mode="full"
         ):
         print("\n\nStarting `WorflowRegions`")
         path_regions = ROOT_PATH / "media/outputs/regions"
@@ -151,30 +183,40 @@ class WorkflowRegions:
         # self._walls = {}
         dists = {}
 
-        for k, (file_n, file_m, stem) in enumerate(all_files):
+        fnames = [f[1] for f in all_files]
+        segmented = segment_images(fnames, sigma, workers=workers,
+                                   force=force, mode=mode)
+
+        for k, ((file_n, _, stem), seg) in enumerate(zip(all_files,
+                                                         segmented)):
             results = [
                 path_regions / f"regions-{stem}-compare.png",
                 path_regions / f"regions-{stem}-publish.png",
                 path_regions / f"regions-{stem}-check.png",
                 # path_regions / f"regions-{stem}-graph.png",
                 # path_regions / f"regions-{stem}-dists.png",
-                path_regions / f"regions-{stem}.csv"
             ]
+
+            # Accumulate data for computing pore wall statistics.
+            seg.properties.to_csv(path_regions / f"regions-{stem}.csv",
+                                  index=False)
+            dists[stem] = self.__compute_row_wise_data(seg.mask)
+
+            if not figures:
+                continue
  
             if all(r.exists() for r in results) and not force:
                 print(f"Already treated ({k:03d}) {stem}")
                 continue
             
             print(f"Processing ({k}) {stem}")
-            rets = self.__workflow(file_n, file_m, stem, sigma, cutoff)
-            figs, df, dists[stem] = rets
+            figs = self.__workflow(file_n, seg, cutoff)
 
             figs[0].savefig(results[0], dpi=300)
             figs[1].savefig(results[1], dpi=300)
             figs[2].savefig(results[2], dpi=300)
             # figs[2].savefig(results[2], dpi=300)
             # figs[3].savefig(results[3], dpi=300)
-            df.to_csv(results[3], index=False)
 
         with open(path_regions / "distances.json", "w") as fp:
             json.dump(dists, fp)
@@ -182,20 +224,12 @@ class WorkflowRegions:
         # fig = self.__get_dists_publ_fig(self._norms, self._walls,
         #                                 calibration, unit="µm")
 
-    def __exclude_borders(self, img, regions):
+    def __exclude_borders(self, shape, regions):
         """ Filter regions close to the borders of image. """
-        new_regions = []
-        h, w = img.shape
-    
-        for props in regions:
-            minr, minc, maxr, maxc = props.bbox
-            lower_bounds = minr > 0 and minc > 0
-            upper_bounds = maxr < h and maxc < w
-            
-            if lower_bounds and upper_bounds:
-                new_regions.append(props)
-
-        return new_regions
+        h, w = shape
+        lower_bounds = (regions["bbox-0"] > 0) & (regions["bbox-1"] > 0)
+        upper_bounds = (regions["bbox-2"] < h) & (regions["bbox-3"] < w)
+        return regions[lower_bounds & upper_bounds]
 
     def __compute_row_wise_data(self, img, debug=False):
         """ Compute mean length of white regions over rows.
@@ -212,77 +246,34 @@ class WorkflowRegions:
         List[float]
             Mean length of white pixel regions in each row.
         """
-        def color_swap(d):
-            """ Get black/white regions swap points and split array. """
-            return np.split(d, 1 + np.where(abs(np.diff(d)) != 0.0)[0])
-
-        def get_all_segments(d):
-            """ Get length, start index, and values of segments. """
-            segments = color_swap(d)
-            data = []
-
-            for k, s in enumerate(segments):
-                index = (0 if len(data) == 0 else sum(data[k-1][:2]))
-                data.append((index, len(s), s))
-
-            return data
-
-        def get_valid_white_segments(d):
-            """ Get length of white segments over rows. """
-            all_segments = get_all_segments(d)
-            last = len(all_segments) - 1
-            keep = []
-
-            for k, s in enumerate(all_segments):
-                # Not keeping black segments.
-                if sum(s[2]) <= 0.0:
-                    continue
-
-                # Do not keep white on extremities because we are
-                # unaware of the distance to the next black (same
-                # logic used with bounding boxes extraction).
-                if k in [0, last]:
-                    continue
-
-                keep.append(s[:2])
-
-            return keep
-
-        # Convert image into float for computations.
-        tmp_data_s = img.astype("float")
-        tmp_data_t = tmp_data_s.T
-
-        # Get row-/col-wise data.
-        row_data = [get_valid_white_segments(tmp_data_s[row])
-                    for row in range(tmp_data_s.shape[0])]
-        col_data = [get_valid_white_segments(tmp_data_t[row])
-                    for row in range(tmp_data_t.shape[0])]
+        # Do not keep white on extremities because we are unaware of the
+        # distance to the next black (same logic used with bounding boxes
+        # extraction); row-wise segments come before column-wise ones.
+        segments, _ = run_lengths(img)
         
         if debug:
             validate = range(100, 1800+1, 100)
-            vdata = [(k, row_data[k]) for k in validate]
+            rows = segments[(segments.axis == "row") &
+                            segments.line.isin(validate)]
 
             plt.close("all")
             plt.imshow(img, cmap="gray")
 
-            for row, data in vdata:
-                for (start, length) in data:
-                    x = range(start, start + length)
-                    y = np.zeros(length) + row
-                    plt.plot(x, y, c="r")
+            for _, seg in rows.iterrows():
+                plt.plot([seg.start, seg.end - 1], [seg.line, seg.line],
+                         c="r")
 
             plt.tight_layout()
             plt.show()
 
         # Get only the lengths accross all rows/columns.
-        all_data = row_data + col_data
-        return [r[1] for data in all_data for r in data]
+        return segments["length"].tolist()
     
     def __draw_regions(self, regions, ax):
-        """ Draw regions over image on given axis. """
-        for props in regions:
-            y0, x0 = props.centroid
-            minr, minc, maxr, maxc = props.bbox
+        """ Draw regions (rows of properties table) over image on axis. """
+        for _, props in regions.iterrows():
+            y0, x0 = props["centroid-0"], props["centroid-1"]
+            minr, minc, maxr, maxc = props[list(BBOX)]
             orientation = props.orientation
 
             x1 = x0 + np.cos(orientation) * 0.5 * props.axis_minor_length
@@ -298,32 +289,24 @@ class WorkflowRegions:
             by = (minr, minr, maxr, maxr, minr)
             ax.plot(bx, by, "-b", linewidth=1)
                 
-    def __workflow(self, file_n, file_m, stem, sigma, cutoff, pct=[10, 100]):
-        """ Segment image and retrieve region properties. """
+    def __workflow(self, file_n, seg, cutoff, pct=[10, 100]):
+        """ Select regions of segmented image and create figures. """
         img0 = imread(file_n, as_gray=True)
-
-        img1, img2, contours, _ = _segment(file_m, sigma)
-        label_img = label(1 - img2)
-        regions = regionprops(label_img)
+        img1 = seg.image()
+        contours = seg.contours()
 
         # Ensure (if not already) regions are sorted by area.
-        regions = sorted(regions, key=lambda r: r.area)
+        regions = seg.table.sort_values("area", kind="stable")
 
         # Get percentile confidence interval.
-        sm, lg = np.percentile([r.area for r in regions], pct)
-
-        def func_cutoff(r):
-            """ Function to eliminate extreme regions. """
-            return (sm < r.area < lg) and (r.area > cutoff)
+        sm, lg = np.percentile(regions.area, pct)
 
         # Remove those regions outside the confidence interval.
-        regions = list(filter(func_cutoff, regions))
+        area = regions.area
+        regions = regions[(sm < area) & (area < lg) & (area > cutoff)]
 
         # Remove regions crossing borders of image.
-        regions = self.__exclude_borders(img0, regions)
-
-        # Accumulate data for computing pore wall statistics.
-        dists = self.__compute_row_wise_data(img2)
+        regions = self.__exclude_borders(img0.shape, regions)
 
         # Generate graph of connected regions.
         # G, pos, norms, walls = self.__create_distance_graph(regions)
@@ -338,10 +321,7 @@ class WorkflowRegions:
         # figs = (fig1, fig2, fig3, fig4)
         figs = (fig1, fig2, fig3)
 
-        table = regionprops_table(label_img, properties=PROPERTIES)
-        table = pd.DataFrame(table)
-
-        return figs, table, dists
+        return figs
 
     def __get_axes(self, img):
         """ Retrieve properly dimensioned axes for figure plot. """
@@ -439,115 +419,71 @@ class WorkflowRegions:
         """ Create directed graph of coordinate porosity in region. """
         # TODO: compute mean-free-path between N-pores, coordination 8.
 
+        # Get (x, y) pairs instead of (y, x) and equivalent radii.
+        labels = regions["label"].to_numpy()
+        points = regions[["centroid-1", "centroid-0"]].to_numpy()
+        radius = regions["equivalent_diameter_area"].to_numpy() / 2
+
         G = DiGraph()
-        pos = {n.label: n.centroid[::-1] for n in regions}
-        radius = {n.label: n.equivalent_diameter_area/2 for n in regions}
+        pos = dict(zip(labels.tolist(), points))
 
-        for pa, pb in product(regions, regions):
-            # Exclude self loops.
-            if (la := pa.label) == (lb := pb.label):
-                continue
+        if len(regions) < 2:
+            return G, pos, [], []
 
-            # Get (x, y) pairs instead of (y, x).
-            ca = pa.centroid[::-1]
-            cb = pb.centroid[::-1]
+        # Candidate pairs within d_max along both axes (Chebyshev).
+        tree = cKDTree(points)
+        pairs = tree.query_pairs(d_max, p=np.inf, output_type="ndarray")
+        G.add_nodes_from(labels[np.unique(pairs)].tolist())
 
-            # Compute distances and check agains d_max.
-            if abs(ca[1] - cb[1]) > d_max or abs(ca[0] - cb[0]) > d_max:
-                continue
+        if not len(pairs):
+            return G, pos, [], []
 
-            # Compute node properties.
-            # Subtract equivalent radii to get wall thickness.
-            ra = pa.equivalent_diameter_area / 2
-            rb = pb.equivalent_diameter_area / 2
-            norm = euclidean(ca, cb)
-            wall = norm - (ra + rb)
-            G.add_edge(la, lb, norm=norm, wall=wall)
+        ia, ib = pairs.T
+        ab = points[ib] - points[ia]
+        dab = np.hypot(*ab.T)
 
-        to_remove = []
+        # Pores closer than their radius to segment AB hide the edge; only
+        # pores around the segment mid-point can do so (segment distance).
         # https://en.wikipedia.org/wiki/Distance_from_a_point_to_a_line
-        # https://en.wikipedia.org/wiki/Area_of_a_triangle#Using_coordinates
-        # na = 26
-        # nb = 27
-        # nc = 28
-
-        # xa, ya = pos[na]
-        # xb, yb = pos[nb]
-        # xc, yc = pos[nc]
-
-        # dx = xb - xa
-        # dy = yb - ya
-
-        # dab = euclidean([xa, ya], [xb, yb])
-        # dac = euclidean([xa, ya], [xc, yc])
-        # dbc = euclidean([xb, yb], [xc, yc])
-
-        # drc = dx * (yc - ya) - dy * (xc - xa)
-        # drc = dx * (yb - yc) - dy * (xb - xc)
-        # drc = abs(drc) / dab
-        frac = 0.5
-
-        for na, nb in G.edges():
-            xa, ya = pos[na]
-            xb, yb = pos[nb]
-            
-            dx = xb - xa
-            dy = yb - ya
-            dab = euclidean([xa, ya], [xb, yb])
-
-            for nc, (xc, yc) in pos.items():
-                if nc == na or nc == nb:
-                    continue
-
-                if (na, nb) in to_remove:
-                    continue
-
-                dac = euclidean([xa, ya], [xc, yc])
-                dbc = euclidean([xb, yb], [xc, yc])
-
-                if (dac > dab) and (dbc > dac):
-                    continue
-
-                drc = dx * (yb - yc) - dy * (xb - xc)
-                drc = abs(drc) / dab
-
-                if drc < radius[nc]:
-                    to_remove.append((na, nb))
-
-        G.remove_edges_from(to_remove)
-        # from IPython import embed; embed()
-
-        def nearest_neighbors(node):
-            """ Get `num` nearest neighbors of `node` in `G`. """
-            # Access neighbor and "norm" property of edge.
-            v = [(k, v["norm"]) for k, v in G[node].items()]
-
-            # Keep only the `no_max` closest neighbors.
-            return sorted(v, key=lambda p: p[1])[:no_max]
-
-        # Nearest neighbors of all nodes (node: [other, norm]).
-        distances = {n: nearest_neighbors(n) for n in G.nodes}
-
-        # Remove edges not kept in distance dictionary.
-        for node, dists in distances.items():
-            others = [v[0] for v in dists]
-            successors = list(G.successors(node))
-
-            for neighbor in successors:
-                if neighbor not in others:
-                    G.remove_edge(node, neighbor)
+        reach = dab / 2 + radius.max()
+        near = tree.query_ball_point(points[ia] + ab / 2, reach)
+
+        counts = np.fromiter(map(len, near), dtype=int, count=len(near))
+        ip = np.repeat(np.arange(len(pairs)), counts)
+        ic = np.concatenate(near).astype(int)
+
+        ac = points[ic] - points[ia[ip]]
+        t = np.einsum("ij,ij->i", ac, ab[ip])
+        t = np.clip(t / np.maximum(dab[ip]**2, np.finfo(float).tiny), 0, 1)
+        drc = np.hypot(*(ac - t[:, None] * ab[ip]).T)
+
+        hidden = (drc < radius[ic]) & (ic != ia[ip]) & (ic != ib[ip])
+        visible = np.ones(len(pairs), dtype=bool)
+        visible[np.unique(ip[hidden])] = False
+
+        # Directed edges in both senses with node properties: subtract
+        # equivalent radii from centroids distance to get wall thickness.
+        src = np.concatenate((ia[visible], ib[visible]))
+        dst = np.concatenate((ib[visible], ia[visible]))
+        norm = np.tile(dab[visible], 2)
+        wall = norm - (radius[src] + radius[dst])
+
+        # Keep only the `no_max` closest neighbors of each node (ties are
+        # broken by neighbor order as in regions list).
+        order = np.lexsort((dst, norm, src))
+        first = np.searchsorted(src[order], src[order], side="left")
+        keep = order[np.arange(len(order)) - first < no_max]
+        keep = keep[np.lexsort((dst[keep], src[keep]))]
+
+        G.add_edges_from(
+            (la, lb, {"norm": n, "wall": w}) for la, lb, n, w in
+            zip(labels[src[keep]].tolist(), labels[dst[keep]].tolist(),
+                norm[keep].tolist(), wall[keep].tolist()))
 
         # Process distance for compat with histogram plotting.
-        norms = []
-        walls = []
-    
-        for na, nb in G.edges():
-            edge = G[na][nb]
-            norms.append(edge["norm"])
+        norms = norm[keep].tolist()
+        walls = wall[keep][wall[keep] > 0].tolist()
 
-            if (wall := edge["wall"]) > 0:
-                walls.append(wall)
-    
         return G, pos, norms, walls
 
 
@@ -713,14 +649,20 @@ class WorkflowStudy:
             calibration: float,
             force: bool = False,
             sigma: Optional[float] = 10.0,
-            cutoff: Optional[int] = 100
+            cutoff: Optional[int] = 100,
+            workers: Optional[int] = None,
+            figures: bool = True,
+            mode: str = "full"
         ) -> None:
         all_files = self.__get_all_files()
 
-        # WorkflowPorosity(all_files, force=force)
+        # Segmentations are cached, only figures are expensive to redo.
+        # WorkflowPorosity(all_files, force=force, workers=workers,
+        #                  figures=figures, mode=mode)
         # self.__porosity_stats()
 
-        # WorkflowRegions(all_files, sigma=sigma, cutoff=cutoff, force=force)
+        # WorkflowRegions(all_files, sigma=sigma, cutoff=cutoff, force=force,
+        #                 workers=workers, figures=figures, mode=mode)
 
         with open(ROOT_PATH / "media/outputs/regions/distances.json") as fp:
             all_dists = json.load(fp)
@@ -856,16 +798,453 @@ class WorkflowStudy:
         df.to_csv(saveas, index=False)
 
 
-def _segment(fname, sigma):
-    """ Perform image automated thresholding for segmentation. """
-    img0 = imread(fname, as_gray=True)
-    img1 = gaussian(img0, sigma=sigma)
-    img2 = img1 > threshold_otsu(img1)
-    
-    porosity = 100 * (1 - img2.sum() / img2.size)
-    contours = find_contours(img2, 0.99)
+class SegmentedImage:
+    """ Cached results of automated segmentation of an image.
+
+    Binary mask (pores are zero-valued), porosity and table of properties
+    of all pores are stored as compressed NumPy arrays in `CACHE_PATH` under
+    a key computed from file contents and segmentation parameters, thus an
+    image is only segmented again if any of these changes.
+
+    Parameters
+    ----------
+    fname : str | Path
+        Path to segmented image.
+    mask : np.ndarray
+        Boolean mask of segmented image, pores are `False`.
+    porosity : float
+        Percentage of pore pixels in image.
+    table : pd.DataFrame
+        Properties of all labeled pores (`PROPERTIES`, label and bbox).
+    """
+    def __init__(self, fname, mask, porosity, table):
+        self.fname = Path(fname)
+        self.mask = mask
+        self.porosity = porosity
+        self.table = table
+
+    @staticmethod
+    def key(fname, params):
+        """ Cache key from file contents and segmentation parameters. """
+        digest = hashlib.sha1(Path(fname).read_bytes())
+        digest.update(params.encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, fname, cache):
+        """ Load segmentation of `fname` from `cache` file. """
+        with np.load(cache) as data:
+            table = {k[6:]: data[k] for k in data.files
+                     if k.startswith("table_")}
+            return cls(fname, data["mask"], float(data["porosity"]),
+                       pd.DataFrame(table))
+
+    def save(self, cache):
+        """ Store segmentation in `cache` file (written atomically). """
+        cache = Path(cache)
+        temp = cache.with_suffix(".tmp.npz")
+        table = {f"table_{k}": v.to_numpy() for k, v in self.table.items()}
+
+        np.savez_compressed(temp, mask=self.mask, porosity=self.porosity,
+                            **table)
+        temp.replace(cache)
+
+    def image(self):
+        """ Read original image in gray levels. """
+        return imread(self.fname, as_gray=True)
+
+    def contours(self):
+        """ Contours of segmented regions. """
+        return find_contours(self.mask, 0.99)
+
+    @property
+    def properties(self):
+        """ Table of `PROPERTIES` of all pores. """
+        return self.table.drop(columns=["label", *BBOX])
+
+
+def segment_images(fnames, sigma, workers=None, force=False, **options):
+    """ Segment images in parallel reusing cached results.
+
+    Parameters
+    ----------
+    fnames : list[str | Path]
+        Paths to images to segment.
+    sigma : float
+        Standard deviation of Gaussian filter applied before thresholding.
+    workers : Optional[int] = None
+        Number of processes segmenting images, all processors if `None`.
+    force : Optional[bool] = False
+        If `True`, segment all images even if cached.
+    **options
+        Further options of `SegmentationEngine`, *e.g.* `mode`.
+
+    Returns
+    -------
+    list[SegmentedImage]
+        Segmentation results in the same order as `fnames`.
+    """
+    engine = SegmentationEngine(sigma, **options)
+
+    CACHE_PATH.mkdir(exist_ok=True, parents=True)
+    caches = [CACHE_PATH / f"{SegmentedImage.key(f, engine.params)}.npz"
+              for f in fnames]
+
+    results = {}
+    missing = []
+
+    for k, (fname, cache) in enumerate(zip(fnames, caches)):
+        if cache.exists() and not force:
+            results[k] = SegmentedImage.load(fname, cache)
+        else:
+            missing.append(k)
+
+    print(f"Segmenting {len(missing)} of {len(fnames)} images")
+
+    if missing:
+        args = [(fnames[k], engine, caches[k]) for k in missing]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            segmented = executor.map(_segment_cached, *zip(*args))
+            results.update(zip(missing, segmented))
+
+    return [results[k] for k in range(len(fnames))]
+
+
+def run_lengths(mask):
+    """ Run-length encoding of white segments over rows and columns.
+
+    White (nonzero) segments touching the borders of the image are not
+    kept, because the distance to the next black pixel is unknown. All
+    segments are found at once from the transitions of the mask padded
+    with black pixels, which are paired in row-major order.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        Mask image of detected regions, pores are zero-valued.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame]
+        Table of segments (`axis`, `line` index of row or column, `start`,
+        exclusive `end`, and `length`) and table of aggregates per row
+        and column (`count`, `total` and `mean` length).
+    """
+    segments = []
+    aggregates = []
+
+    for axis, data in (("row", mask), ("col", np.transpose(mask))):
+        n, w = data.shape
+
+        padded = np.zeros((n, w + 2), dtype=np.int8)
+        padded[:, 1:-1] = np.asarray(data) != 0
+        swaps = np.diff(padded, axis=1).ravel()
+
+        line, start = np.divmod(np.flatnonzero(swaps == 1), w + 1)
+        end = np.flatnonzero(swaps == -1) % (w + 1)
+
+        keep = (start > 0) & (end < w)
+        line, start, end = line[keep], start[keep], end[keep]
+        length = end - start
+
+        count = np.bincount(line, minlength=n)
+        total = np.bincount(line, weights=length, minlength=n)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+
+        segments.append(pd.DataFrame({
+            "axis": axis, "line": line, "start": start,
+            "end": end, "length": length
+        }))
+        aggregates.append(pd.DataFrame({
+            "axis": axis, "line": np.arange(n), "count": count,
+            "total": total, "mean": mean
+        }))
+
+    return (pd.concat(segments, ignore_index=True),
+            pd.concat(aggregates, ignore_index=True))
+
+
+def _segment_cached(fname, engine, cache):
+    """ Segment image, tabulate pores properties, and store results. """
+    mask, porosity = engine(fname)
+
+    properties = (*PROPERTIES, "label", "bbox")
+    table = regionprops_table(label(1 - mask), properties=properties)
+
+    seg = SegmentedImage(fname, mask, porosity, pd.DataFrame(table))
+    seg.save(cache)
+    return seg
+
+
+class SegmentationEngine:
+    """ Gaussian blur and Otsu thresholding of (large) gray level images.
+
+    Images are converted to gray levels in single precision and blurred with
+    a separable Gaussian filter. Three modes of operation are available:
+
+    - `full`: blur and threshold the whole image at once.
+    - `pyramid`: blur and threshold a block-averaged image reduced by
+      `factor` to locate a band of coarse pixels around pores boundaries;
+      the image is then blurred at full resolution only in tiles covering
+      this band. The threshold is computed from the histogram of full
+      resolution values in the band and coarse values elsewhere. Results
+      differ from `full` mode where this threshold differs (within about
+      one histogram bin) and where coarse pixels away from boundaries are
+      misclassified (features smaller than the band); porosity typically
+      differs by some hundredths of percent.
+    - `tiled`: blur tiles of size `tile` with an overlap of the filter
+      radius, so that the result is the same as in `full` mode; blurred
+      tiles are kept in a temporary memory-mapped file and the threshold is
+      computed from the accumulated histogram. Images stored as `.npy` or
+      uncompressed TIFF are memory-mapped, allowing images larger than the
+      available memory to be blurred.
+
+    Parameters
+    ----------
+    sigma : float
+        Standard deviation of Gaussian filter [pixels].
+    mode : Optional[str] = "full"
+        Mode of operation, one of `full`, `pyramid`, or `tiled`.
+    factor : Optional[int] = 4
+        Reduction factor of image in `pyramid` mode.
+    band : Optional[int] = 2
+        Width of refined band around boundaries in `pyramid` mode [coarse
+        pixels].
+    tile : Optional[int] = 2048
+        Size of tiles (and strips in `pyramid` mode) [pixels].
+    truncate : Optional[float] = 4.0
+        Truncate filter at this many standard deviations.
+    nbins : Optional[int] = 256
+        Number of bins of histogram used for Otsu thresholding.
+    """
+    MODES = ("full", "pyramid", "tiled")
+
+    def __init__(self, sigma, mode="full", factor=4, band=2, tile=2048,
+                 truncate=4.0, nbins=256):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode}, options: {self.MODES}")
+
+        self.sigma = sigma
+        self.mode = mode
+        self.factor = factor
+        self.band = band
+        self.tile = tile
+        self.truncate = truncate
+        self.nbins = nbins
+
+    def __call__(self, fname):
+        """ Segment image file, see `segment`. """
+        return self.segment(_open_image(fname))
+
+    @property
+    def params(self):
+        """ String of parameters affecting segmentation results. """
+        params = (f"sigma={self.sigma},mode={self.mode},float32,"
+                  f"truncate={self.truncate},nbins={self.nbins}")
+
+        if self.mode == "pyramid":
+            params += f",factor={self.factor},band={self.band}"
+
+        return params
+
+    def segment(self, img, out=None):
+        """ Compute mask of image (pores are `False`) and its porosity.
+
+        Parameters
+        ----------
+        img : np.ndarray
+            Gray or RGB(A) image of any type, possibly memory-mapped.
+        out : Optional[np.ndarray] = None
+            Boolean array where to store mask, *e.g.* memory-mapped.
+
+        Returns
+        -------
+        tuple[np.ndarray, float]
+            Mask of segmented image and porosity [%].
+        """
+        if out is None:
+            out = np.empty(img.shape[:2], dtype=bool)
+
+        getattr(self, f"_segment_{self.mode}")(img, out)
+
+        porosity = 100 * (1 - np.count_nonzero(out) / out.size)
+        return out, porosity
+
+    def _blur(self, img, sigma):
+        """ Apply Gaussian filter in single precision. """
+        return gaussian_filter(img, sigma, output=np.float32,
+                               mode="nearest", truncate=self.truncate)
+
+    def _segment_full(self, img, out):
+        """ Blur and threshold image at once. """
+        blur = self._blur(_as_gray32(img), self.sigma)
+        out[...] = blur > threshold_otsu(blur, nbins=self.nbins)
+
+    def _segment_pyramid(self, img, out):
+        """ Blur and threshold reduced image and refine boundaries. """
+        f = self.factor
+        h, w = out.shape
+
+        # Block averaging already smooths with variance f²/12.
+        sigma = np.sqrt(max((self.sigma / f)**2 - 1 / 12, 0))
+        blur = self._blur(self._reduce(img), sigma)
+        coarse = blur > threshold_otsu(blur, nbins=self.nbins)
+
+        # Coarse pixels around boundaries (both sides).
+        band = (binary_dilation(coarse, iterations=self.band) &
+                ~binary_erosion(coarse, iterations=self.band,
+                                border_value=1))
+
+        rows, cols, values = self._blur_band(img, band)
+
+        # Histogram of full resolution values in band and of coarse
+        # values (each standing for f² pixels) elsewhere.
+        outside = blur[~band]
+        lo = min(outside.min(initial=np.inf), values.min(initial=np.inf))
+        hi = max(outside.max(initial=-np.inf), values.max(initial=-np.inf))
+
+        counts = f * f * np.histogram(outside, self.nbins, (lo, hi))[0]
+        counts += np.histogram(values, self.nbins, (lo, hi))[0]
+
+        edges = np.linspace(lo, hi, self.nbins + 1)
+        centers = (edges[:-1] + edges[1:]) / 2
+        threshold = threshold_otsu(hist=(counts, centers))
+
+        coarse = blur > threshold
+
+        for k in range(0, h, f):
+            out[k:k+f] = np.repeat(coarse[k // f], f)[:w]
+
+        out[rows, cols] = values > threshold
+
+    def _blur_band(self, img, band):
+        """ Full resolution blur of pixels under coarse `band`.
+
+        Image is blurred in tiles (with overlap of the filter radius)
+        and only tiles intersecting the band are processed.
+        """
+        f = self.factor
+        h, w = img.shape[:2]
+        t = max(f, self.tile // f * f)
+        halo = int(self.truncate * self.sigma + 0.5)
+
+        rows, cols, values = [], [], []
+
+        for r0, c0 in product(range(0, h, t), range(0, w, t)):
+            r1, c1 = min(r0 + t, h), min(c0 + t, w)
+            sub = band[r0 // f:-(-r1 // f), c0 // f:-(-c1 // f)]
+
+            if not sub.any():
+                continue
+
+            sub = np.repeat(np.repeat(sub, f, axis=0), f, axis=1)
+            i, j = np.nonzero(sub[:r1 - r0, :c1 - c0])
+
+            a0, a1 = max(r0 - halo, 0), min(r1 + halo, h)
+            b0, b1 = max(c0 - halo, 0), min(c1 + halo, w)
+            tile = self._blur(_as_gray32(img[a0:a1, b0:b1]), self.sigma)
+
+            rows.append(r0 + i)
+            cols.append(c0 + j)
+            values.append(tile[r0 - a0 + i, c0 - b0 + j])
+
+        if not values:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0, dtype=np.float32)
+
+        return (np.concatenate(rows), np.concatenate(cols),
+                np.concatenate(values))
+
+    def _reduce(self, img):
+        """ Block-average image by `factor` in strips of rows. """
+        f = self.factor
+        h, w = img.shape[:2]
+        H, W = -(-h // f), -(-w // f)
+
+        reduced = np.empty((H, W), dtype=np.float32)
+        step = max(1, self.tile // f)
+
+        for k in range(0, H, step):
+            n = min(step, H - k)
+            strip = _as_gray32(img[k*f:(k+n)*f])
+            pad = ((0, n * f - strip.shape[0]), (0, W * f - w))
+            strip = np.pad(strip, pad, mode="edge")
+            reduced[k:k+n] = strip.reshape(n, f, W, f).mean(axis=(1, 3))
+
+        return reduced
+
+    def _segment_tiled(self, img, out):
+        """ Blur tiles with overlap and threshold with global histogram. """
+        h, w = out.shape
+        halo = int(self.truncate * self.sigma + 0.5)
+
+        tiles = [(r, min(r + self.tile, h), c, min(c + self.tile, w))
+                 for r, c in product(range(0, h, self.tile),
+                                     range(0, w, self.tile))]
+
+        with TemporaryFile() as fp:
+            blur = np.memmap(fp, dtype=np.float32, mode="w+", shape=(h, w))
+
+            for r0, r1, c0, c1 in tiles:
+                a0, a1 = max(r0 - halo, 0), min(r1 + halo, h)
+                b0, b1 = max(c0 - halo, 0), min(c1 + halo, w)
+
+                tile = self._blur(_as_gray32(img[a0:a1, b0:b1]), self.sigma)
+                blur[r0:r1, c0:c1] = tile[r0-a0:r1-a0, c0-b0:c1-b0]
+
+            # Same histogram as used by `threshold_otsu` over whole image.
+            lo = min(blur[r0:r1, c0:c1].min() for r0, r1, c0, c1 in tiles)
+            hi = max(blur[r0:r1, c0:c1].max() for r0, r1, c0, c1 in tiles)
+            counts = np.zeros(self.nbins, dtype=np.int64)
+
+            for r0, r1, c0, c1 in tiles:
+                counts += np.histogram(blur[r0:r1, c0:c1], self.nbins,
+                                       range=(lo, hi))[0]
+
+            edges = np.linspace(lo, hi, self.nbins + 1)
+            centers = (edges[:-1] + edges[1:]) / 2
+            threshold = threshold_otsu(hist=(counts, centers))
+
+            for r0, r1, c0, c1 in tiles:
+                out[r0:r1, c0:c1] = blur[r0:r1, c0:c1] > threshold
+
+            del blur
+
+
+def _open_image(fname):
+    """ Open image, memory-mapped if stored as `.npy` or plain TIFF. """
+    fname = Path(fname)
+
+    if fname.suffix == ".npy":
+        return np.load(fname, mmap_mode="r")
+
+    if fname.suffix in (".tif", ".tiff"):
+        import tifffile
+
+        try:
+            return tifffile.memmap(fname, mode="r")
+        except ValueError:
+            return tifffile.imread(fname)
+
+    return imread(fname)
+
+
+def _as_gray32(img):
+    """ Convert image to gray levels in [0, 1] as single precision. """
+    img = np.asarray(img)
+    scale = 1.0
+
+    if np.issubdtype(img.dtype, np.integer):
+        scale = 1.0 / np.iinfo(img.dtype).max
+
+    if img.ndim == 3:
+        weights = np.array([0.2125, 0.7154, 0.0721], dtype=np.float32)
+        return (img[..., :3] @ (scale * weights)).astype(np.float32)
 
-    return img0, img2, contours, porosity
+    return np.multiply(img, scale, dtype=np.float32)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from typing import Any
+from typing import Callable
+import importlib
+import sys
+
+
+def lazy_exports(
+        package: str,
+        exports: dict[str, str]
+    ) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """ Create module `__getattr__` and `__dir__` for lazy exports.
+
+    Heavy dependencies (Cantera, CasADi, matplotlib, ...) are only
+    imported when an object requiring them is first accessed, so that
+    importing the package itself (*e.g.* in worker processes) is cheap.
+    Shared with `rotary_kiln`, which builds upon this package.
+
+    Parameters
+    ----------
+    package : str
+        Name of package providing the exports, *i.e.* `__name__`.
+    exports : dict[str, str]
+        Mapping of exported names to (relative) modules defining them.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        Functions to be assigned to `__getattr__` and `__dir__`.
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no "
+                                 f"attribute {name!r}")
+
+        module = importlib.import_module(exports[name], package)
+        value = getattr(module, name)
+
+        # Cache in package namespace to bypass this on next access.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
@@ -1,20 +1,30 @@
 # -*- coding: utf-8 -*-
-from .database import parse_database
-from .database import load_data
-from .database import parse_symbol
-from .models import DataGHSER
-from .models import StepwiseGHSER
-from .plot import plot_molar_gibbs_energy
-from .systems import SystemAl2O3CaO
-from .systems import SystemCaOSiO2
-from .systems import scan_binary
+from .._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CompiledDatabase": ".database",
+    "compile_database": ".database",
+    "parse_database": ".database",
+    "load_data": ".database",
+    "parse_symbol": ".database",
+    "DataGHSER": ".models",
+    "StepwiseGHSER": ".models",
+    "PackedGHSER": ".models",
+    "plot_molar_gibbs_energy": ".plot",
+    "SystemAl2O3CaO": ".systems",
+    "SystemCaOSiO2": ".systems",
+    "scan_binary": ".systems",
+})
 
 __all__ = [
+    "CompiledDatabase",
+    "compile_database",
     "parse_database",
     "load_data",
     "parse_symbol",
     "DataGHSER",
     "StepwiseGHSER",
+    "PackedGHSER",
     "plot_molar_gibbs_energy",
     "SystemAl2O3CaO",
     "SystemCaOSiO2",
@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
 from numbers import Number
 from pathlib import Path
+from typing import Optional
+from casadi import Function
 from casadi import SX
+from casadi import jacobian
+from casadi import vertcat
+import hashlib
+import json
+import os
+import tempfile
 import warnings
 import yaml
 from .models import StepwiseGHSER
@@ -9,6 +17,9 @@ from .models import StepwiseGHSER
 DEFAULT_DATABASE = Path(__file__).resolve().parent / "database.yml"
 """ Path to built-in default thermodynamic database file. """
 
+GAS_CONSTANT = 8.31446261815324
+""" Ideal gas constant [J/(mol.K)]. """
+
 
 class SymbolicExpression:
     """ Represent a symbolic expression in database. """
@@ -17,17 +28,187 @@ class SymbolicExpression:
     parameters: list[dict[str, float]]
 
 
-def parse_database() -> dict[str, SX]:
-    """ Parse whole database in a map of parameters. """
-    data = load_data()
+class CompiledDatabase:
+    """ Gibbs energy functions of a database compiled with CasADi.
+
+    All symbols of a database are gathered in a single CasADi `Function`
+    of temperature evaluating the Gibbs energies `G` and their first and
+    second derivatives `dGdT` and `d2GdT2` as vectors ordered as `names`.
+    Compiled databases are serialized with `save` and reloaded without
+    parsing YAML files nor assembling the stepwise expressions again.
+
+    Parameters
+    ----------
+    function: Function
+        Function of temperature `T` with outputs `G`, `dGdT`, `d2GdT2`.
+    names: list[str]
+        Names of symbols in the order of outputs.
+    """
+    def __init__(self, function: Function, names: list[str]) -> None:
+        self._function = function
+        self._names = list(names)
+        self._index = {name: k for k, name in enumerate(self._names)}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @classmethod
+    def from_data(cls, data: dict) -> "CompiledDatabase":
+        """ Compile database from data loaded with `load_data`. """
+        T = SX.sym("T")
+        known = {}
+
+        for name in data["data"]:
+            _ = parse_symbol(T, data["data"], name, known)
+
+        names = list(known.keys())
+        G = vertcat(*known.values())
+        dGdT = jacobian(G, T)
+        d2GdT2 = jacobian(dGdT, T)
+
+        function = Function("gibbs", [T], [G, dGdT, d2GdT2],
+                            ["T"], ["G", "dGdT", "d2GdT2"])
+        return cls(function, names)
+
+    @classmethod
+    def load(cls, fname: str | Path) -> "CompiledDatabase":
+        """ Load database serialized with `save`. """
+        fname = Path(fname)
+
+        with open(fname.with_suffix(".json")) as fp:
+            names = json.load(fp)
+
+        return cls(Function.load(str(fname.with_suffix(".casadi"))), names)
+
+    def save(self, fname: str | Path) -> None:
+        """ Serialize database functions and names of symbols. """
+        fname = Path(fname)
+
+        for suffix, dump in ((".casadi", self.__dump_function),
+                             (".json", self.__dump_names)):
+            target = fname.with_suffix(suffix)
+            partial = target.with_suffix(f"{suffix}.{os.getpid()}.tmp")
+            dump(partial)
+            partial.replace(target)
+
+    def __dump_function(self, fname):
+        self._function.save(str(fname))
+
+    def __dump_names(self, fname):
+        with open(fname, "w") as fp:
+            json.dump(self._names, fp)
+
+    def index(self, name: str) -> int:
+        """ Index of symbol in outputs of database function. """
+        if name not in self._index:
+            raise KeyError(f"Unknown expression `{name}`")
+
+        return self._index[name]
+
+    def symbols(self, T: Optional[SX] = None) -> dict[str, SX]:
+        """ Map of symbols to Gibbs energy expressions of `T`.
+
+        Expressions are expanded from the compiled function, so they can
+        be used to assemble other symbolic problems as parsed symbols.
+        """
+        T = SX.sym("T") if T is None else T
+        G = self._function(T=T)["G"]
+
+        known = {"T": T, "R": GAS_CONSTANT}
+        known.update({name: G[k] for k, name in enumerate(self._names)})
+        return known
+
+    @property
+    def names(self) -> list[str]:
+        """ Names of symbols in database. """
+        return self._names
+
+    @property
+    def function(self) -> Function:
+        """ Function of temperature returning `G`, `dGdT`, `d2GdT2`. """
+        return self._function
+
+    def gibbs(self, T):
+        """ Gibbs energy of all symbols at temperature `T` [J/mol]. """
+        return self._function(T=T)["G"]
+
+    def gibbs_first_derivative(self, T):
+        """ Derivative of Gibbs energies with respect to temperature. """
+        return self._function(T=T)["dGdT"]
+
+    def gibbs_second_derivative(self, T):
+        """ Second derivative of Gibbs energies in temperature. """
+        return self._function(T=T)["d2GdT2"]
+
+
+def database_digest(database: str | Path = DEFAULT_DATABASE) -> str:
+    """ Hash of a database file and all the files it includes. """
+    database = Path(database).resolve()
+    here = database.parent
+    digest = hashlib.sha1(database.read_bytes())
+
+    with open(database) as fp:
+        data = yaml.safe_load(fp)
+
+    for include in data.get("data", {}).get("include", []):
+        digest.update(include.encode("utf-8"))
+        digest.update((here / include).read_bytes())
+
+    return digest.hexdigest()[:16]
+
+
+def compile_database(
+        database: str | Path = DEFAULT_DATABASE,
+        cache_dir: Optional[str | Path] = None,
+        force: Optional[bool] = False
+    ) -> CompiledDatabase:
+    """ Compile database or load it from cache if already compiled.
+
+    Compiled databases are stored under `cache_dir` with a name given by
+    the hashes of database files, so that any change in data (including
+    the `include` files) leads to a new compilation.
+
+    Parameters
+    ----------
+    database: str | Path = DEFAULT_DATABASE
+        Path to YAML database file.
+    cache_dir: Optional[str | Path] = None
+        Directory for compiled databases. If not provided, directory
+        `majordome-calphad` is created under system temporary directory.
+    force: Optional[bool] = False
+        Compile database even if found in cache.
+    """
+    database = Path(database)
+
+    if cache_dir is None:
+        cache_dir = Path(tempfile.gettempdir()) / "majordome-calphad"
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    fname = cache_dir / f"{database.stem}_{database_digest(database)}"
+
+    if not force and fname.with_suffix(".casadi").exists():
+        try:
+            return CompiledDatabase.load(fname)
+        except (OSError, RuntimeError, ValueError):
+            warnings.warn(f"Compiling again unreadable cache `{fname}`")
+
+    compiled = CompiledDatabase.from_data(load_data(database))
+    compiled.save(fname)
+    return compiled
 
-    T = SX.sym("T")
-    known = {"T": T, "R": 8.31446261815324}
 
-    for name in data["data"]:
-        _ = parse_symbol(T, data["data"], name, known)
+def parse_database(
+        database: str | Path = DEFAULT_DATABASE,
+        cache_dir: Optional[str | Path] = None
+    ) -> dict[str, SX]:
+    """ Parse whole database in a map of parameters.
 
-    return known
+    Database is compiled only once and later loaded from `cache_dir`,
+    see `compile_database`.
+    """
+    return compile_database(database, cache_dir).symbols()
 
 
 def load_data(database=DEFAULT_DATABASE):
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
+from typing import Optional
 from typing import Union
 from casadi import heaviside
 from casadi import log
 from casadi import SX
+import numpy as np
 
 
 @dataclass
@@ -44,3 +46,164 @@ class StepwiseGHSER:
     def value(self) -> SX:
         """ Retrieve symbolic stepwise GHSER function. """
         return self.p
+
+
+class PackedGHSER:
+    """ Numerical GHSER evaluation of several symbols over arrays.
+
+    Start temperatures and coefficients of all intervals of all symbols
+    are packed in arrays of shape `(n_symbols, n_intervals)` (padded with
+    intervals starting at infinity), so that properties are evaluated
+    for all symbols and temperatures at once with NumPy. Intervals are
+    blended as in `StepwiseGHSER` (including the half-step of heaviside
+    function at interval boundaries), so that values agree with those
+    evaluated from the symbolic expressions to machine precision.
+
+    Parameters
+    ----------
+    names: list[str]
+        Names of symbols.
+    T0: np.ndarray
+        Start temperature of intervals of each symbol, sorted by row.
+    coefs: np.ndarray
+        Coefficients `(a, b, c, d, e, f)` of shape `(*T0.shape, 6)`.
+    bases: list[list[tuple[float, int]]]
+        Multipliers and indices of other symbols added to each symbol.
+        Referred symbols must appear before the referring ones.
+    """
+    def __init__(self, names: list[str], T0: np.ndarray,
+                 coefs: np.ndarray, bases: list[list[tuple[float, int]]]
+                 ) -> None:
+        self._names = list(names)
+        self._index = {name: k for k, name in enumerate(self._names)}
+        self._T0 = np.asarray(T0, dtype=float)
+        self._coefs = np.asarray(coefs, dtype=float)
+        self._bases = bases
+
+    @classmethod
+    def from_data(cls, data: dict) -> "PackedGHSER":
+        """ Pack symbols of a database, *i.e.* `load_data()["data"]`. """
+        names = []
+
+        def visit(name, path=()):
+            if name in names:
+                return
+
+            if name not in data:
+                raise KeyError(f"Unknown expression `{name}`")
+
+            if name in path:
+                raise ValueError(f"Circular reference in `{name}`")
+
+            for other in data[name].get("base", []):
+                visit(other["function"], path + (name,))
+
+            names.append(name)
+
+        for name in data:
+            visit(name)
+
+        n_intervals = max(len(data[name]["parameters"]) for name in names)
+        T0 = np.full((len(names), n_intervals), np.inf)
+        coefs = np.zeros((len(names), n_intervals, 6))
+        bases = []
+
+        for i, name in enumerate(names):
+            plist = sorted(data[name]["parameters"], key=lambda x: x["T0"])
+
+            for j, p in enumerate(plist):
+                p = p if isinstance(p, DataGHSER) else DataGHSER(**p)
+                T0[i, j] = p.T0
+                coefs[i, j] = (p.a, p.b, p.c, p.d, p.e, p.f)
+
+            bases.append([(other["multiplier"], names.index(other["function"]))
+                          for other in data[name].get("base", [])])
+
+        return cls(names, T0, coefs, bases)
+
+    def index(self, name: str) -> int:
+        """ Index of symbol in packed arrays. """
+        if name not in self._index:
+            raise KeyError(f"Unknown expression `{name}`")
+
+        return self._index[name]
+
+    def properties(self, T: float | np.ndarray,
+                   names: Optional[list[str]] = None) -> dict[str, np.ndarray]:
+        """ Evaluate Gibbs energy, enthalpy, entropy and specific heat.
+
+        Parameters
+        ----------
+        T: float | np.ndarray
+            Temperatures at which properties are evaluated [K].
+        names: Optional[list[str]] = None
+            Names of symbols to evaluate; all symbols if not provided.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Arrays `G` [J/mol], `H` [J/mol], `S` [J/(mol.K)] and `Cp`
+            [J/(mol.K)] of shape `(len(names), *np.shape(T))`.
+        """
+        T = np.asarray(T, dtype=float)
+        t = T.reshape(1, -1)
+        lnT = np.log(t)
+
+        G = H = S = Cp = None
+
+        for j in range(self._T0.shape[1]):
+            a, b, c, d, e, f = (self._coefs[:, j, k, None] for k in range(6))
+
+            G_j = a + b * t + c * t * lnT + d * t ** 2 + e * t ** 3 + f / t
+            H_j = a - c * t - d * t ** 2 - 2 * e * t ** 3 + 2 * f / t
+            S_j = -b - c * (lnT + 1) - 2 * d * t - 3 * e * t ** 2 + f / t ** 2
+            Cp_j = -c - 2 * d * t - 6 * e * t ** 2 - 2 * f / t ** 2
+
+            if j == 0:
+                G, H, S, Cp = G_j, H_j, S_j, Cp_j
+                continue
+
+            # Same blending as `StepwiseGHSER` with heaviside function.
+            w = np.heaviside(t - self._T0[:, j, None], 0.5)
+            G = G + w * (G_j - G)
+            H = H + w * (H_j - H)
+            S = S + w * (S_j - S)
+            Cp = Cp + w * (Cp_j - Cp)
+
+        for i, bases in enumerate(self._bases):
+            for multiplier, k in bases:
+                G[i] += multiplier * G[k]
+                H[i] += multiplier * H[k]
+                S[i] += multiplier * S[k]
+                Cp[i] += multiplier * Cp[k]
+
+        rows = slice(None) if names is None else [self.index(n) for n in names]
+        shape = (-1, *T.shape)
+
+        return {"G": G[rows].reshape(shape), "H": H[rows].reshape(shape),
+                "S": S[rows].reshape(shape), "Cp": Cp[rows].reshape(shape)}
+
+    def gibbs(self, T: float | np.ndarray,
+              names: Optional[list[str]] = None) -> np.ndarray:
+        """ Gibbs energy minus reference state enthalpy [J/mol]. """
+        return self.properties(T, names)["G"]
+
+    def enthalpy(self, T: float | np.ndarray,
+                 names: Optional[list[str]] = None) -> np.ndarray:
+        """ Enthalpy relative to reference state [J/mol]. """
+        return self.properties(T, names)["H"]
+
+    def entropy(self, T: float | np.ndarray,
+                names: Optional[list[str]] = None) -> np.ndarray:
+        """ Entropy [J/(mol.K)]. """
+        return self.properties(T, names)["S"]
+
+    def specific_heat(self, T: float | np.ndarray,
+                      names: Optional[list[str]] = None) -> np.ndarray:
+        """ Specific heat at constant pressure [J/(mol.K)]. """
+        return self.properties(T, names)["Cp"]
+
+    @property
+    def names(self) -> list[str]:
+        """ Names of packed symbols. """
+        return self._names
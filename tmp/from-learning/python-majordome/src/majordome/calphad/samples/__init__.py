@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
-from .wrappers import simulate_pure_al2o3
-from .wrappers import simulate_pure_cao
-from .wrappers import simulate_pure_sio2
-from .wrappers import simulate_pure_c1a1
-from .wrappers import simulate_pure_c1a2
-from .wrappers import simulate_pure_c12a7
-from .plot import plot_pure_al2o3_gibbs
-from .plot import plot_pure_cao_gibbs
-from .plot import plot_pure_sio2_gibbs
+from ..._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "simulate_pure_al2o3": ".wrappers",
+    "simulate_pure_cao": ".wrappers",
+    "simulate_pure_sio2": ".wrappers",
+    "simulate_pure_c1a1": ".wrappers",
+    "simulate_pure_c1a2": ".wrappers",
+    "simulate_pure_c12a7": ".wrappers",
+    "plot_pure_al2o3_gibbs": ".plot",
+    "plot_pure_cao_gibbs": ".plot",
+    "plot_pure_sio2_gibbs": ".plot",
+})
 
 __all__ = [
     "simulate_pure_al2o3",
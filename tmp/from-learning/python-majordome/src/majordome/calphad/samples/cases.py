@@ -1,41 +1,33 @@
 # -*- coding: utf-8 -*-
-from abc import ABC
-from abc import abstractmethod
 from casadi import DM
 from casadi import SX
 from casadi import log
 from casadi import vertcat
-from casadi import nlpsol
+import numpy as np
 from ...utilities import Capturing
-from ..database import parse_database
+from ..systems.base_system import BaseSystem
 
 
-class SampleCase(ABC):
-    """ Abstract base class for sample cases. """
-    def __init__(self) -> None:
-        self._known = parse_database()
-        self._T = self._known["T"]
-        self._R = self._known["R"]
+class SampleCase(BaseSystem):
+    """ Abstract base class for sample cases.
 
-    def _make_solver(self, x, p, f, g):
-        """ Create solver for current case. """
-        opts = {"ipopt": {"print_level": 0}}
-        nlpt = {"x": x, "p": p, "f": f, "g": g}
-        self._solver = nlpsol("solver", "ipopt", nlpt, opts)
+    Sample cases are systems of pure substances (or stoichiometric
+    compounds) whose phase balance is an equality constraint. Unless
+    overridden, variables are the amounts of each phase.
+    """
+    def _bounds(self, tol: float) -> dict[str, float]:
+        """ Bounds of variables and constraints of equilibrium problem. """
+        return {"lbx": 0.0, "ubx": 1.0, "lbg": -tol, "ubg": tol}
 
-    @abstractmethod
-    def compute_equilibrium(
-        self,
-        p: list[float],
-        guess: list[float],
-        tol: float = 1.0e-15
-    ) -> tuple[dict[str, DM], Capturing]:
-        """ Evaluate phase equilibrium at given temperature. """
-        with Capturing() as output:
-            solution = self._solver(x0=guess, p=p,
-                                    lbx=0.0, ubx=1.0,
-                                    lbg=-tol, ubg=tol)
-        return solution, output
+    @property
+    def variables(self):
+        """ Names of problem variables. """
+        return self.phases
+
+    @property
+    def guess(self):
+        """ Initialize properly sized initial guess. """
+        return np.ones(len(self.variables))
 
 
 class PureAL2O3(SampleCase):
@@ -63,6 +55,11 @@ class PureAL2O3(SampleCase):
         """ Evaluate phase equilibrium at given temperature. """
         return super().compute_equilibrium([T], guess=guess, tol=tol)
 
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["ALPHA", "LIQUID"]
+
 
 class PureCAO(SampleCase):
     """ Compute equilibrium in pure CAO system. """
@@ -89,6 +86,11 @@ class PureCAO(SampleCase):
         """ Evaluate phase equilibrium at given temperature. """
         return super().compute_equilibrium([T], guess=guess, tol=tol)
 
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["CAO", "LIQUID"]
+
 
 class PureSIO2(SampleCase):
     """ Compute equilibrium in pure SIO2 system. """
@@ -120,6 +122,11 @@ class PureSIO2(SampleCase):
         """ Evaluate phase equilibrium at given temperature. """
         return super().compute_equilibrium([T], guess=guess, tol=tol)
 
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["QUARTZ", "TRIDYMITE", "CRISTOBALITE", "LIQUID"]
+
 
 class PureC1A1(SampleCase):
     """ Compute equilibrium in pure (CAO.AL2O3) system.
@@ -150,6 +157,9 @@ class PureC1A1(SampleCase):
     elements, only two are necessary (quasi-binary system modeled in
     terms of oxides), thus one of then is redundant.
     """
+    x0 = 0.5
+    """ Amount of Al2O3 in system [mol]. """
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -203,7 +213,17 @@ class PureC1A1(SampleCase):
         tol: float = 1.0e-15
     ) -> tuple[dict[str, DM], Capturing]:
         """ Evaluate phase equilibrium at given temperature. """
-        return super().compute_equilibrium([T, 0.5], guess=guess, tol=tol)
+        return super().compute_equilibrium([T, self.x0], guess=guess, tol=tol)
+
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["C1A1", "LIQUID"]
+
+    @property
+    def variables(self):
+        """ Names of problem variables. """
+        return [*self.phases, "y(LIQUID,AL3+)", "y(LIQUID,CA2+)"]
 
 
 class PureC1A2(SampleCase):
@@ -213,6 +233,9 @@ class PureC1A2(SampleCase):
     --------
     See comments for C1A1.
     """
+    x0 = 2 / 3
+    """ Amount of Al2O3 in system [mol]. """
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -266,7 +289,17 @@ class PureC1A2(SampleCase):
         tol: float = 1.0e-15
     ) -> tuple[dict[str, DM], Capturing]:
         """ Evaluate phase equilibrium at given temperature. """
-        return super().compute_equilibrium([T, 2 / 3], guess=guess, tol=tol)
+        return super().compute_equilibrium([T, self.x0], guess=guess, tol=tol)
+
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["C1A2", "LIQUID"]
+
+    @property
+    def variables(self):
+        """ Names of problem variables. """
+        return [*self.phases, "y(LIQUID,AL3+)", "y(LIQUID,CA2+)"]
 
 
 class PureC12A7(SampleCase):
@@ -276,6 +309,9 @@ class PureC12A7(SampleCase):
     --------
     See comments for C1A1.
     """
+    x0 = 7 / 19
+    """ Amount of Al2O3 in system [mol]. """
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -329,4 +365,14 @@ class PureC12A7(SampleCase):
         tol: float = 1.0e-15
     ) -> tuple[dict[str, DM], Capturing]:
         """ Evaluate phase equilibrium at given temperature. """
-        return super().compute_equilibrium([T, 7 / 19], guess=guess, tol=tol)
+        return super().compute_equilibrium([T, self.x0], guess=guess, tol=tol)
+
+    @property
+    def phases(self):
+        """ Names of phases in system. """
+        return ["C12A7", "LIQUID"]
+
+    @property
+    def variables(self):
+        """ Names of problem variables. """
+        return [*self.phases, "y(LIQUID,AL3+)", "y(LIQUID,CA2+)"]
@@ -1,56 +1,49 @@
 # -*- coding: utf-8 -*-
-from casadi import Function
 import matplotlib.pyplot as plt
 import numpy as np
-from ..database import parse_database
+from ..database import load_data
+from ..models import PackedGHSER
 from ..plot import plot_molar_gibbs_energy
 
 
-def plot_pure_al2o3_gibbs():
-    """ Wrapper to eliminate global symbols. """
-    known = parse_database()
+def _molar_gibbs_energies(T_num, labels):
+    """ Evaluate energies of labeled symbols in mega-joules per mole. """
+    ghser = PackedGHSER.from_data(load_data()["data"])
+    G = ghser.gibbs(T_num, list(labels.values())) / 1_000_000
+    return dict(zip(labels.keys(), G))
 
-    T = known["T"]
-    G0 = Function("G0", [T], [known["G(ALPHA_AL2O3,AL2O3)"]])
-    G1 = Function("G1", [T], [known["G(LIQUID,AL2O3)"]])
 
+def plot_pure_al2o3_gibbs():
+    """ Wrapper to eliminate global symbols. """
     T_num = np.linspace(300.0, 4000.0, 1000)
-    plots = {"$\\alpha$": G0(T_num) / 1_000_000,
-             "Liquid": G1(T_num) / 1_000_000}
+    plots = _molar_gibbs_energies(T_num, {
+        "$\\alpha$": "G(ALPHA_AL2O3,AL2O3)",
+        "Liquid": "G(LIQUID,AL2O3)"
+    })
 
     plot_molar_gibbs_energy(T_num, plots)
 
 
 def plot_pure_cao_gibbs():
     """ Wrapper to eliminate global symbols. """
-    known = parse_database()
-
-    T = known["T"]
-    G0 = Function("G0", [T], [known["G(CA1O1,CA1O1)"]])
-    G1 = Function("G1", [T], [known["G(LIQUID,CA1O1)"]])
-
     T_num = np.linspace(300.0, 4000.0, 1000)
-    plots = {"$CaO$": G0(T_num) / 1_000_000,
-             "Liquid": G1(T_num) / 1_000_000}
+    plots = _molar_gibbs_energies(T_num, {
+        "$CaO$": "G(CA1O1,CA1O1)",
+        "Liquid": "G(LIQUID,CA1O1)"
+    })
 
     plot_molar_gibbs_energy(T_num, plots)
 
 
 def plot_pure_sio2_gibbs():
     """ Wrapper to eliminate global symbols. """
-    known = parse_database()
-
-    T = known["T"]
-    G0 = Function("G0", [T], [known["G(QUARTZ,SI1O2)"]])
-    G1 = Function("G1", [T], [known["G(TRIDYMITE,SI1O2)"]])
-    G2 = Function("G2", [T], [known["G(CRISTOBALITE,SI1O2)"]])
-    G3 = Function("G3", [T], [known["G(LIQUID,SI1O2)"]])
-
     T_num = np.linspace(300.0, 4000.0, 1000)
-    plots = {"Quartz": G0(T_num) / 1_000_000,
-             "Tridymite": G1(T_num) / 1_000_000,
-             "Cristobalite": G2(T_num) / 1_000_000,
-             "Liquid": G3(T_num) / 1_000_000}
+    plots = _molar_gibbs_energies(T_num, {
+        "Quartz": "G(QUARTZ,SI1O2)",
+        "Tridymite": "G(TRIDYMITE,SI1O2)",
+        "Cristobalite": "G(CRISTOBALITE,SI1O2)",
+        "Liquid": "G(LIQUID,SI1O2)"
+    })
 
     plot_molar_gibbs_energy(T_num, plots)
 
@@ -14,13 +14,14 @@ from .plot import plot_liquid_and_residual
 def simulate_pure_al2o3():
     """ Wrapper to eliminate global symbols. """
     ce = PureAL2O3()
-    guess = [1.0, 1.0]
-    table = pd.DataFrame(columns=["T", "X(LIQ)", "res"])
+    temp = np.linspace(2300.0, 2350.0, 100)
+    x = ce.sweep(temp)["x"]
 
-    for k, temp in enumerate(np.linspace(2300.0, 2350.0, 100)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, guess[1], sum(guess) - 1.0]
+    table = pd.DataFrame({
+        "T": temp,
+        "X(LIQ)": x[:, 1],
+        "res": x.sum(axis=1) - 1.0
+    })
 
     plot_liquid_and_residual(table, (2300.0, 2350.0))
 
@@ -28,13 +29,14 @@ def simulate_pure_al2o3():
 def simulate_pure_cao():
     """ Wrapper to eliminate global symbols. """
     ce = PureCAO()
-    guess = [1.0, 1.0]
-    table = pd.DataFrame(columns=["T", "X(LIQ)", "res"])
+    temp = np.linspace(3150.0, 3200.0, 100)
+    x = ce.sweep(temp)["x"]
 
-    for k, temp in enumerate(np.linspace(3150.0, 3200.0, 100)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, guess[1], sum(guess) - 1.0]
+    table = pd.DataFrame({
+        "T": temp,
+        "X(LIQ)": x[:, 1],
+        "res": x.sum(axis=1) - 1.0
+    })
 
     plot_liquid_and_residual(table, (3150.0, 3200.0))
 
@@ -42,14 +44,15 @@ def simulate_pure_cao():
 def simulate_pure_sio2():
     """ Wrapper to eliminate global symbols. """
     ce = PureSIO2()
-    guess = [1.0, 1.0, 1.0, 1.0]
-    phases = ["QUARTZ", "TRIDYMITE", "CRISTOBALITE", "LIQUID"]
-    table = pd.DataFrame(columns=["T", *phases, "res"])
+    phases = ce.phases
+    temp = np.linspace(1000.0, 2200.0, 1000)
+    x = ce.sweep(temp)["x"]
 
-    for k, temp in enumerate(np.linspace(1000.0, 2200.0, 1000)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, *guess, sum(guess) - 1.0]
+    table = pd.DataFrame({
+        "T": temp,
+        **dict(zip(phases, x.T)),
+        "res": x.sum(axis=1) - 1.0
+    })
 
     x = table["T"].to_numpy()
     y0 = table[phases[0]].to_numpy()
@@ -79,13 +82,15 @@ def simulate_pure_sio2():
 def simulate_pure_c1a1():
     """ Wrapper to eliminate global symbols. """
     ce = PureC1A1()
-    guess = [1.0, 1.0, 1.0, 1.0]
-    table = pd.DataFrame(columns=["T", "N(C1A1)", "N(LIQ)", "res"])
+    temp = np.linspace(1870.0, 1880.0, 100)
+    x = ce.sweep(np.column_stack((temp, np.full_like(temp, ce.x0))))["x"]
 
-    for k, temp in enumerate(np.linspace(1870.0, 1880.0, 100)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, *guess[:2], sum(guess[2:]) - 1]
+    table = pd.DataFrame({
+        "T": temp,
+        "N(C1A1)": x[:, 0],
+        "N(LIQ)": x[:, 1],
+        "res": x[:, 2:].sum(axis=1) - 1
+    })
 
     # Since we are working with amounts of phase, in this case we
     # need to perform some post-processing.
@@ -99,13 +104,15 @@ def simulate_pure_c1a1():
 def simulate_pure_c1a2():
     """ Wrapper to eliminate global symbols. """
     ce = PureC1A2()
-    guess = [1.0, 1.0, 1.0, 1.0]
-    table = pd.DataFrame(columns=["T", "N(C1A2)", "N(LIQ)", "res"])
+    temp = np.linspace(2040.0, 2060.0, 200)
+    x = ce.sweep(np.column_stack((temp, np.full_like(temp, ce.x0))))["x"]
 
-    for k, temp in enumerate(np.linspace(2040.0, 2060.0, 200)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, *guess[:2], sum(guess[2:]) - 1]
+    table = pd.DataFrame({
+        "T": temp,
+        "N(C1A2)": x[:, 0],
+        "N(LIQ)": x[:, 1],
+        "res": x[:, 2:].sum(axis=1) - 1
+    })
 
     # Since we are working with amounts of phase, in this case we
     # need to perform some post-processing.
@@ -119,14 +126,16 @@ def simulate_pure_c1a2():
 def simulate_pure_c12a7():
     """ Wrapper to eliminate global symbols. """
     ce = PureC12A7()
-    guess = [1.0, 1.0, 1.0, 1.0]
-    table = pd.DataFrame(columns=["T", "N(C12A7)", "N(LIQ)", "res"])
     rng = (1715.0, 1735.0)
-
-    for k, temp in enumerate(np.linspace(*rng, 100)):
-        solution, _ = ce.compute_equilibrium(temp, guess=guess)
-        guess = solution["x"].full().ravel()
-        table.loc[k] = [temp, *guess[:2], sum(guess[2:]) - 1]
+    temp = np.linspace(*rng, 100)
+    x = ce.sweep(np.column_stack((temp, np.full_like(temp, ce.x0))))["x"]
+
+    table = pd.DataFrame({
+        "T": temp,
+        "N(C12A7)": x[:, 0],
+        "N(LIQ)": x[:, 1],
+        "res": x[:, 2:].sum(axis=1) - 1
+    })
 
     # Since we are working with amounts of phase, in this case we
     # need to perform some post-processing.
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
-from .system_al2o3_cao import SystemAl2O3CaO
-from .system_cao_sio2 import SystemCaOSiO2
-from .utilities import scan_binary
+from ..._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "PhaseBoundary": ".base_system",
+    "SystemAl2O3CaO": ".system_al2o3_cao",
+    "SystemCaOSiO2": ".system_cao_sio2",
+    "scan_binary": ".utilities",
+})
 
 __all__ = [
+    "PhaseBoundary",
     "SystemAl2O3CaO",
     "SystemCaOSiO2",
     "scan_binary"
@@ -2,13 +2,35 @@
 from abc import ABC
 from abc import abstractmethod
 from abc import abstractproperty
+from dataclasses import dataclass
+import inspect
 from typing import Optional
 from casadi import DM
 from casadi import SX
+from casadi import Function
 from casadi import nlpsol
+import numpy as np
 from ...utilities import Capturing
 from ..database import parse_database
 
+WARM_START_OPTIONS = {
+    "warm_start_init_point": "yes",
+    "warm_start_bound_push": 1.0e-12,
+    "warm_start_slack_bound_push": 1.0e-12,
+    "warm_start_mult_bound_push": 1.0e-12,
+    "mu_init": 1.0e-09,
+}
+""" IPOPT options for restarting from a neighbor primal-dual solution. """
+
+
+@dataclass
+class PhaseBoundary:
+    """ Temperature of a change of stable phases at fixed composition. """
+    T: float
+    below: tuple[str, ...]
+    above: tuple[str, ...]
+    width: float
+
 
 class BaseSystem(ABC):
     """ Abstract base class for sample cases. """
@@ -28,6 +50,39 @@ class BaseSystem(ABC):
         nlpt = {"x": x, "p": p, "f": f, "g": g}
         self._solver = nlpsol("solver", "ipopt", nlpt, opts)
 
+        # Quiet solvers for batches, created upon first use.
+        self._nlp = nlpt
+        self._ipopt = opts["ipopt"]
+        self._batch_solvers = {}
+
+    def _batch_solver(self, warm_start: bool) -> Function:
+        """ Quiet solver, possibly restarting from a given solution. """
+        if warm_start not in self._batch_solvers:
+            ipopt = {**self._ipopt, "sb": "yes"}
+
+            if warm_start:
+                ipopt |= WARM_START_OPTIONS
+
+            opts = {"ipopt": ipopt, "print_time": False}
+            name = "warm" if warm_start else "cold"
+            solver = nlpsol(f"solver_{name}", "ipopt", self._nlp, opts)
+            self._batch_solvers[warm_start] = solver
+
+        return self._batch_solvers[warm_start]
+
+    def _bounds(self, tol: float) -> dict[str, float]:
+        """ Bounds of variables and constraints of equilibrium problem. """
+        # TODO lbx and ubx should not be constant because for mineral
+        # systems it is usually worth modeling in terms of phase contents
+        # and not phase/compound fractions, generalize it!
+        return {"lbx": 0.0, "ubx": 1.0, "lbg": 0.0, "ubg": tol}
+
+    @property
+    def _default_tol(self) -> float:
+        """ Default tolerance of `compute_equilibrium` of the system. """
+        signature = inspect.signature(self.compute_equilibrium)
+        return signature.parameters["tol"].default
+
     @abstractmethod
     def compute_equilibrium(
         self,
@@ -36,15 +91,413 @@ class BaseSystem(ABC):
         tol: float = 1.0e-15
     ) -> tuple[dict[str, DM], Capturing]:
         """ Evaluate phase equilibrium at given temperature. """
-        # TODO lbx and ubx should not be constant because for mineral
-        # systems it is usually worth modeling in terms of phase contents
-        # and not phase/compound fractions, generalize it!
         with Capturing() as output:
-            solution = self._solver(x0=guess, p=p,
-                                    lbx=0.0, ubx=1.0,
-                                    lbg=0.0, ubg=tol)
+            solution = self._solver(x0=guess, p=p, **self._bounds(tol))
         return solution, output
 
+    def sweep(
+        self,
+        p: list[float] | np.ndarray,
+        guess: Optional[list[float]] = None,
+        tol: Optional[float] = None,
+        warm_start: bool = False,
+        parallelization: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> dict[str, np.ndarray]:
+        """ Evaluate phase equilibrium over a batch of parameters.
+
+        By default points are solved in sequence (chained), each one
+        starting from the solution of the previous point; this is the
+        method of choice for fine grids, *e.g.* in temperature. With
+        `warm_start` the IPOPT multipliers are also reused with a small
+        barrier parameter, what may reduce the number of iterations by a
+        factor 2-10. Because the problem is not convex, warm starts may
+        remain trapped in the previous phase assemblage (mostly with
+        solution phases whose amount vanishes, *e.g.* `PureC1A1` at the
+        default tolerance), so compare against a cold sweep before
+        enabling it for a system. Failed warm starts are repeated from
+        the primal solution.
+
+        If `parallelization` is provided (`serial`, `thread`, `openmp`),
+        the solver is instead mapped over all points, which are solved
+        independently from the same `guess`.
+
+        Parameters
+        ----------
+        p: list[float] | np.ndarray
+            Parameters of each point as array of shape `(n_points,)` if
+            the system has a single parameter (temperature) or as rows of
+            shape `(n_points, n_params)`, *e.g.* temperature and
+            composition, in the same order as `compute_equilibrium`.
+        guess: Optional[list[float]] = None
+            Initial guess for first (or all, if mapped) points. If not
+            provided, the default `guess` of the system is used.
+        tol: Optional[float] = None
+            Tolerance over constraints satisfaction; by default the same
+            as in `compute_equilibrium` of the system.
+        warm_start: bool = False
+            Reuse multipliers of previous point in chained sweeps.
+        parallelization: Optional[str] = None
+            Map the solver over points with this CasADi parallelization.
+        workers: Optional[int] = None
+            Maximum number of threads in `thread` parallelization.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Arrays with one row per point: variables `x`, objective `f`,
+            constraints `g`, multipliers `lam_x` and `lam_g`, and the
+            `success` flag (in mapped sweeps only finiteness is checked).
+        """
+        p = np.asarray(p, dtype=float)
+        p = p.reshape(len(p), -1)
+
+        tol = self._default_tol if tol is None else tol
+
+        guess = self.guess if guess is None else guess
+        bounds = self._bounds(tol)
+
+        if parallelization is not None:
+            return self.__sweep_mapped(p, guess, bounds,
+                                       parallelization, workers)
+
+        return self.__sweep_chained(p, guess, bounds, warm_start)
+
+    def __sweep_chained(self, p, guess, bounds, warm_start):
+        """ Solve points in sequence, starting from previous solution. """
+        cold = self._batch_solver(False)
+        warm = self._batch_solver(True) if warm_start else None
+
+        nx = self._nlp["x"].numel()
+        ng = self._nlp["g"].numel()
+        n_points = p.shape[0]
+
+        results = {
+            "x": np.empty((n_points, nx)),
+            "f": np.empty(n_points),
+            "g": np.empty((n_points, ng)),
+            "lam_x": np.empty((n_points, nx)),
+            "lam_g": np.empty((n_points, ng)),
+            "success": np.empty(n_points, dtype=bool),
+        }
+
+        solution = None
+
+        for k, pk in enumerate(p):
+            if solution is None:
+                solution = cold(x0=guess, p=pk, **bounds)
+                success = cold.stats()["success"]
+            elif warm is not None:
+                solution = warm(x0=solution["x"], p=pk,
+                                lam_x0=solution["lam_x"],
+                                lam_g0=solution["lam_g"], **bounds)
+                success = warm.stats()["success"]
+
+                if not success:
+                    solution = cold(x0=results["x"][k-1], p=pk, **bounds)
+                    success = cold.stats()["success"]
+            else:
+                solution = cold(x0=solution["x"], p=pk, **bounds)
+                success = cold.stats()["success"]
+
+            for name in ("x", "f", "g", "lam_x", "lam_g"):
+                results[name][k] = np.squeeze(solution[name].full())
+
+            results["success"][k] = success
+
+        return results
+
+    def __sweep_mapped(self, p, guess, bounds, parallelization, workers):
+        """ Solve points independently with mapped solver. """
+        n_points = p.shape[0]
+        cold = self._batch_solver(False)
+
+        if parallelization == "thread" and workers is not None:
+            solver = cold.map(n_points, parallelization, workers)
+        else:
+            solver = cold.map(n_points, parallelization)
+
+        x0 = np.tile(np.reshape(guess, (-1, 1)), (1, n_points))
+        solution = solver(x0=x0, p=p.T, **bounds)
+
+        results = {name: solution[name].full().T
+                   for name in ("x", "g", "lam_x", "lam_g")}
+        results["f"] = solution["f"].full().ravel()
+        results["success"] = np.isfinite(results["x"]).all(axis=1)
+
+        return results
+
+    def assemblage(self, x: np.ndarray, threshold: float = 1.0e-04
+                   ) -> tuple[str, ...]:
+        """ Names of phases present in solution `x` of equilibrium.
+
+        Phases amounts are the leading variables of the problem; a phase
+        is present if its amount is above `threshold` times the largest
+        amount (absent phases are only approached by the solver).
+        """
+        amounts = np.asarray(x, dtype=float).ravel()[:len(self.phases)]
+        present = amounts > threshold * amounts.max()
+        return tuple(name for name, p in zip(self.phases, present) if p)
+
+    def find_transitions(
+        self,
+        T: list[float] | np.ndarray,
+        *args: float,
+        guess: Optional[list[float]] = None,
+        tol: Optional[float] = None,
+        xtol: float = 0.01,
+        threshold: float = 1.0e-04
+    ) -> list[PhaseBoundary]:
+        """ Locate changes of stable phases in a temperature range.
+
+        Equilibrium is first computed over the coarse grid `T`; every
+        interval across which the assemblage changes is then refined by
+        bisection until narrower than `xtol`. If the end of the refined
+        bracket does not match the coarse point (several transitions in
+        one interval), the remaining interval is refined in turn.
+
+        Because the problem is not convex, every point is solved from its
+        neighbors (previous coarse point or bracket ends) and from the
+        default guess of the system, keeping the lowest Gibbs energy;
+        points where no solution succeeds are skipped. With a coarse grid
+        spacing of `dT` each transition takes about `3 log2(dT / xtol)`
+        solves.
+
+        Parameters
+        ----------
+        T: list[float] | np.ndarray
+            Coarse and increasing temperature grid [K].
+        *args: float
+            Other parameters of the system, *e.g.* composition, in the
+            same order as in `compute_equilibrium`.
+        guess: Optional[list[float]] = None
+            Initial guess for first point of coarse grid.
+        tol: Optional[float] = None
+            Tolerance over constraints satisfaction; by default the same
+            as in `compute_equilibrium` of the system.
+        xtol: float = 0.01
+            Width of temperature bracket of transitions [K].
+        threshold: float = 1.0e-04
+            Relative amount of present phases, see `assemblage`.
+
+        Returns
+        -------
+        list[PhaseBoundary]
+            Transitions sorted by temperature.
+        """
+        T = np.asarray(T, dtype=float)
+        p = np.column_stack((T, *(np.full_like(T, a) for a in args)))
+        tol = self._default_tol if tol is None else tol
+
+        # Chained solutions are checked against solutions from default
+        # guess, which may find another (lower) local minimum.
+        chained = self.sweep(p, guess=guess, tol=tol)
+        coarse = []
+
+        for k, Tk in enumerate(T):
+            guesses = [chained["x"][k]] if chained["success"][k] else []
+            point = self.__solve_point(Tk, args, guesses, tol, threshold)
+
+            if point is not None:
+                coarse.append(point)
+
+        found = []
+
+        for lo, hi in zip(coarse[:-1], coarse[1:]):
+            while lo[2] != hi[2]:
+                boundary, lo = self.__bisect(lo, hi, args, tol,
+                                             xtol, threshold)
+                found.append(boundary)
+
+        return found
+
+    def trace_boundary(
+        self,
+        phase: str,
+        compositions: list[float] | np.ndarray,
+        T_range: tuple[float, float],
+        n_coarse: int = 21,
+        step: float = 20.0,
+        tol: Optional[float] = None,
+        xtol: float = 0.01,
+        threshold: float = 1.0e-04
+    ) -> np.ndarray:
+        """ Follow the temperature at which `phase` (dis)appears.
+
+        The boundary is located at the first composition with a coarse
+        scan of `T_range` (if `phase` changes presence several times the
+        highest temperature transition is followed). The liquidus of a
+        primary phase is traced by following the disappearance of that
+        solid phase, *e.g.* `CaO` at low alumina contents; following
+        `LIQUID` traces the solidus and eutectic or peritectic plateaus.
+        For the next compositions the temperature is predicted from the
+        previous points (linear extrapolation) and bracketed within
+        `step` around this prediction, expanding it if required, before
+        refinement by bisection. A point where the boundary cannot be
+        bracketed is set to `NaN` and the next one is scanned again.
+
+        Parameters
+        ----------
+        phase: str
+            Name of phase whose stability boundary is traced.
+        compositions: list[float] | np.ndarray
+            Composition parameter of the system, in continuation order.
+        T_range: tuple[float, float]
+            Temperature range where the boundary is searched [K].
+        n_coarse: int = 21
+            Number of points of coarse scans over `T_range`.
+        step: float = 20.0
+            Half width of initial brackets around predictions [K].
+        tol, xtol, threshold
+            See `find_transitions`.
+
+        Returns
+        -------
+        np.ndarray
+            Boundary temperature for each composition [K].
+        """
+        T_min, T_max = T_range
+        tol = self._default_tol if tol is None else tol
+        boundary = np.full(len(compositions), np.nan)
+        previous = []
+
+        for i, x0 in enumerate(compositions):
+            if not previous:
+                T = np.linspace(T_min, T_max, n_coarse)
+                transitions = self.find_transitions(
+                    T, x0, tol=tol, xtol=xtol, threshold=threshold)
+                transitions = [b for b in transitions
+                               if (phase in b.below) != (phase in b.above)]
+
+                if transitions:
+                    boundary[i] = transitions[-1].T
+                    present_above = phase in transitions[-1].above
+                    previous = [(x0, boundary[i])]
+
+                continue
+
+            if len(previous) == 1:
+                T_pred = previous[-1][1]
+            else:
+                (xa, Ta), (xb, Tb) = previous[-2:]
+                T_pred = Tb + (Tb - Ta) * (x0 - xb) / (xb - xa)
+
+            T_pred = min(max(T_pred, T_min), T_max)
+            bracket = self.__bracket(phase, present_above, T_pred, x0,
+                                     T_range, step, tol, threshold)
+
+            if bracket is None:
+                previous = []
+                continue
+
+            while True:
+                found, lo = self.__bisect(*bracket, (x0,), tol,
+                                          xtol, threshold)
+
+                if (phase in found.below) != (phase in found.above):
+                    break
+
+                bracket = (lo, bracket[1])
+
+            boundary[i] = found.T
+            present_above = phase in found.above
+            previous.append((x0, found.T))
+
+        return boundary
+
+    def __solve_point(self, T, args, guesses, tol, threshold):
+        """ Solve at a point, returning `(T, x, assemblage, f)`.
+
+        The problem is solved from all `guesses` and from the default
+        guess of the system, keeping the successful solution of lowest
+        objective (thus avoiding local minima); if all solutions fail,
+        `None` is returned.
+        """
+        solver = self._batch_solver(False)
+        bounds = self._bounds(tol)
+        best = None
+
+        for guess in [*guesses, self.guess]:
+            solution = solver(x0=guess, p=[T, *args], **bounds)
+
+            if not solver.stats()["success"]:
+                continue
+
+            f = float(solution["f"])
+
+            if best is None or f < best[3]:
+                x = solution["x"].full().ravel()
+                best = (T, x, self.assemblage(x, threshold), f)
+
+        return best
+
+    def __bisect(self, lo, hi, args, tol, xtol, threshold):
+        """ Shrink bracket to first change of assemblage after `lo`.
+
+        Midpoints are solved starting from both ends of the bracket. If
+        a midpoint cannot be solved, refinement stops with the current
+        bracket width.
+        """
+        hi_end = hi
+
+        while hi[0] - lo[0] > xtol:
+            T_mid = (lo[0] + hi[0]) / 2
+            mid = self.__solve_point(T_mid, args, [lo[1], hi[1]],
+                                     tol, threshold)
+
+            if mid is None:
+                break
+
+            if mid[2] == lo[2]:
+                lo = mid
+            else:
+                hi = mid
+
+        boundary = PhaseBoundary(T=(lo[0] + hi[0]) / 2, below=lo[2],
+                                 above=hi[2], width=hi[0] - lo[0])
+
+        # Restart after transition if more follow in original bracket.
+        return boundary, hi if hi[2] != hi_end[2] else hi_end
+
+    def __bracket(self, phase, present_above, T_pred, x0, T_range, step,
+                  tol, threshold):
+        """ Bracket change of presence of `phase` around prediction. """
+        T_min, T_max = T_range
+
+        lo = self.__solve_point(max(T_pred - step, T_min), (x0,),
+                                [], tol, threshold)
+        hi = self.__solve_point(min(T_pred + step, T_max), (x0,),
+                                [] if lo is None else [lo[1]],
+                                tol, threshold)
+
+        if lo is None or hi is None:
+            return None
+
+        while (phase in lo[2]) == (phase in hi[2]):
+            step *= 2
+
+            # Boundary is below bracket if both ends look like above it,
+            # then previous end becomes other end of narrower bracket.
+            if (phase in lo[2]) == present_above:
+                if lo[0] <= T_min:
+                    return None
+
+                T_new = max(T_pred - step, T_min)
+                hi, lo = lo, self.__solve_point(T_new, (x0,), [lo[1]],
+                                                tol, threshold)
+            else:
+                if hi[0] >= T_max:
+                    return None
+
+                T_new = min(T_pred + step, T_max)
+                lo, hi = hi, self.__solve_point(T_new, (x0,), [hi[1]],
+                                                tol, threshold)
+
+            if lo is None or hi is None:
+                return None
+
+        return lo, hi
+
     @abstractproperty
     def phases(self):
         """ Initialize properly sized initial guess. """
@@ -2,6 +2,7 @@
 from typing import Optional
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from ...definitions import FigSize
 from .base_system import BaseSystem
@@ -28,14 +29,18 @@ def scan_binary(
                             sharex=True, sharey=True)
 
     for i, xi in enumerate(x):
-        column = []
         ax = axs[i // ncols, i % ncols]
 
-        for Tj in T:
-            row, guess, _ = ce_at_point(sim, Tj, xi, guess)
-            column.append(row)
+        # Sweep temperatures chaining solutions (also to next column),
+        # with the same tolerance as `ce_at_point`.
+        p = np.column_stack((T, np.full_like(T, xi, dtype=float)))
+        solution = sim.sweep(p, guess=guess, tol=1.0e-12)
+        guess = solution["x"][-1]
 
-        frames[i] = pd.DataFrame(column)
+        frames[i] = pd.DataFrame({
+            "T": T,
+            **dict(zip(sim.variables, solution["x"].T))
+        })
 
         if post:
             # Convert moles to phase fraction.
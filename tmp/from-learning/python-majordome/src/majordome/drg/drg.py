@@ -1,16 +1,14 @@
 # -*- coding: utf-8 -*-
 from itertools import product
-from majordome.drg.graph import analyse_graph
-from majordome.drg.graph import DirectedGraph
 import os
 import csv
 import glob
 import time
 import cantera as ct
-import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
-import pandas as pd
+
+# NetworkX (with the graph module based on it), matplotlib, and pandas
+# are imported by the methods using them to keep module import cheap.
 
 
 MECH = """\
@@ -228,6 +226,7 @@ class SimplifyDRG(object):
 
     def _tag_species(self):
         """ Perform DFS with species tagging. """
+        import networkx as nx
 
         h = nx.DiGraph()
 
@@ -278,6 +277,7 @@ class SimplifyDRG(object):
         list
             List of species retained with use of given threshold.
         """
+        import pandas as pd
 
         keep_species = []
         for T, P, X, path in cond_list:
@@ -442,6 +442,9 @@ class SimplifyDRGManager(object):
         setup : SimplifySetup
             Structure containing simplification setup.
         """
+        from majordome.drg.graph import analyse_graph
+        from majordome.drg.graph import DirectedGraph
+        import matplotlib.pyplot as plt
 
         t0 = time.time()
         setup.validate()
@@ -531,6 +534,8 @@ class SimplifyDRGManager(object):
         Parameters
         ----------
         """
+        import matplotlib.pyplot as plt
+        import pandas as pd
 
         times = np.linspace(0, setup.integ, n_samples)
         outdir = os.path.join(setup.dir_name, "test")
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+from glob import glob
+from pathlib import Path
+from queue import Full
+from queue import Queue
+from threading import Event
+from threading import Thread
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+import abc
+import numpy as np
+
+
+class FrameSource(abc.ABC):
+    """ Lazy sequence of frames (images) from some storage.
+
+    Frames are only decoded when accessed, either randomly with `read` or
+    sequentially with `iter_frames`. Sources only keep references to the
+    underlying storage, so that they can be sent to worker processes, and
+    files are opened on first access.
+
+    Parameters
+    ----------
+    every: Optional[int] = 1
+        Only expose every n-th frame of storage; skipped frames are not
+        decoded (unless the storage format requires it, *e.g.* video).
+    gray: Optional[bool] = True
+        If `True`, convert color frames to gray levels as OpenPIV does.
+    """
+    def __init__(
+            self,
+            every: Optional[int] = 1,
+            gray: Optional[bool] = True
+        ) -> None:
+        self._every = every
+        self._gray = gray
+
+    def __len__(self) -> int:
+        """ Number of exposed frames. """
+        return -(-self._size() // self._every)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return self.iter_frames()
+
+    def __getstate__(self) -> dict:
+        """ Drop open file handles when pickling. """
+        return {k: v for k, v in vars(self).items() if k != "_handle"}
+
+    def read(self, k: int) -> np.ndarray:
+        """ Decode exposed frame `k`. """
+        if not 0 <= k < len(self):
+            raise IndexError(f"Frame {k} out of source range")
+
+        return self._convert(self._read(k * self._every))
+
+    def iter_frames(
+            self,
+            start: Optional[int] = 0,
+            stop: Optional[int] = None
+        ) -> Iterator[np.ndarray]:
+        """ Decode exposed frames in range `[start, stop)` in order. """
+        stop = len(self) if stop is None else min(stop, len(self))
+        indices = range(start * self._every, stop * self._every, self._every)
+
+        for frame in self._iter(indices):
+            yield self._convert(frame)
+
+    def _convert(self, frame: np.ndarray) -> np.ndarray:
+        """ Apply conversions to a decoded frame. """
+        if self._gray and np.ndim(frame) > 2:
+            frame = np.dot(frame[..., :3], [0.299, 0.587, 0.144])
+
+        return frame
+
+    def _iter(self, indices: range) -> Iterator[np.ndarray]:
+        """ Decode frames of storage in given range. """
+        for k in indices:
+            yield self._read(k)
+
+    @abc.abstractmethod
+    def _size(self) -> int:
+        """ Number of frames in storage. """
+        pass
+
+    @abc.abstractmethod
+    def _read(self, k: int) -> np.ndarray:
+        """ Decode frame `k` of storage. """
+        pass
+
+
+class ImageSequence(FrameSource):
+    """ Frames stored as individual image files.
+
+    Parameters
+    ----------
+    images: str | list[str | Path]
+        Glob pattern or list of paths of images. Paths matching a pattern
+        are sorted by name.
+    **kwargs
+        See `FrameSource`.
+    """
+    def __init__(self, images: str | list[str | Path], **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        if isinstance(images, (str, Path)):
+            images = sorted(glob(str(images)))
+
+        self._images = [Path(f) for f in images]
+
+    def _size(self) -> int:
+        return len(self._images)
+
+    def _read(self, k: int) -> np.ndarray:
+        import imageio.v3 as iio
+        return iio.imread(self._images[k])
+
+    def path(self, k: int) -> Path:
+        """ Path to file of exposed frame `k`. """
+        return self._images[k * self._every]
+
+
+class TiffStack(FrameSource):
+    """ Frames stored as pages of a multi-page TIFF file.
+
+    Parameters
+    ----------
+    fname: PathLike
+        Path to TIFF file, read with `tifffile`.
+    **kwargs
+        See `FrameSource`.
+    """
+    def __init__(self, fname: str | Path, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._fname = Path(fname)
+        self._handle = None
+
+    @property
+    def _file(self):
+        """ Open TIFF file upon first access. """
+        if getattr(self, "_handle", None) is None:
+            import tifffile
+            self._handle = tifffile.TiffFile(self._fname)
+
+        return self._handle
+
+    def _size(self) -> int:
+        return len(self._file.pages)
+
+    def _read(self, k: int) -> np.ndarray:
+        return self._file.pages[k].asarray()
+
+
+class VideoSource(FrameSource):
+    """ Frames stored in a video container (or animated image).
+
+    Frames are decoded with `imageio` (video formats require one of its
+    video plugins, such as `pyav`). Sequential access decodes the stream
+    once; notice that most codecs require decoding skipped frames too.
+
+    Parameters
+    ----------
+    fname: PathLike
+        Path to video file.
+    plugin: Optional[str] = None
+        Name of `imageio` plugin to use, selected by imageio if omitted.
+    **kwargs
+        See `FrameSource`.
+    """
+    def __init__(
+            self,
+            fname: str | Path,
+            plugin: Optional[str] = None,
+            **kwargs
+        ) -> None:
+        super().__init__(**kwargs)
+        self._fname = Path(fname)
+        self._plugin = plugin
+        self._handle = None
+        self._n_frames = None
+
+    @property
+    def _file(self):
+        """ Open video file upon first access. """
+        if getattr(self, "_handle", None) is None:
+            import imageio.v3 as iio
+            self._handle = iio.imopen(self._fname, "r", plugin=self._plugin)
+
+        return self._handle
+
+    def _size(self) -> int:
+        if self._n_frames is None:
+            n = self._file.properties(index=...).shape[0]
+            self._n_frames = int(n)
+
+        return self._n_frames
+
+    def _read(self, k: int) -> np.ndarray:
+        return self._file.read(index=k)
+
+    def _iter(self, indices: range) -> Iterator[np.ndarray]:
+        wanted = iter(indices)
+        k = next(wanted, None)
+
+        for i, frame in enumerate(self._file.iter()):
+            if k is None:
+                break
+
+            if i == k:
+                yield frame
+                k = next(wanted, None)
+
+
+def as_frame_source(images: FrameSource | str | list[str | Path],
+                    **kwargs) -> FrameSource:
+    """ Wrap glob pattern or list of image paths as a frame source. """
+    if isinstance(images, FrameSource):
+        return images
+
+    return ImageSequence(images, **kwargs)
+
+
+def prefetch(iterable: Iterable, size: Optional[int] = 8) -> Iterator:
+    """ Iterate over `iterable` consumed by a background thread.
+
+    Up to `size` items are produced in advance into a bounded queue, so
+    that loading (*e.g.* frames decoding) overlaps with the processing
+    of the items while memory remains bounded. Exceptions raised while
+    producing items are re-raised in the consumer.
+
+    Parameters
+    ----------
+    iterable: Iterable
+        Items to be produced in the background.
+    size: Optional[int] = 8
+        Maximum number of items waiting in queue.
+
+    Yields
+    ------
+    Any
+        Items of `iterable` in order.
+    """
+    queue = Queue(maxsize=size)
+    done = object()
+    stop = Event()
+
+    def put(item):
+        """ Put item in queue unless consumer has stopped. """
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def producer():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as err:
+            put((done, err))
+            return
+
+        put((done, None))
+
+    thread = Thread(target=producer, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, err = queue.get()
+
+            if item is done:
+                if err is not None:
+                    raise err
+                break
+
+            yield item
+    finally:
+        stop.set()
+        thread.join()
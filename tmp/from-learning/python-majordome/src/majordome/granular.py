@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
-from casadi import SX
-from casadi import vertcat
-from casadi import nlpsol
-from matplotlib.figure import Figure
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from scipy.integrate import solve_ivp
-from scipy.integrate import trapz
-import casadi as cs
+from scipy.integrate import trapezoid
 import numpy as np
-import matplotlib.pyplot as plt
+
+from majordome.integrate import solve_ivp_batch
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class KramerModel:
@@ -72,7 +73,7 @@ class KramerModel:
         """ Post-process results for hold-up computation. """
         phi = 2 * np.arccos(1 - h / self._R)
         Xr = (phi - np.sin(phi)) / (2 * np.pi)
-        Xr_bar = trapz(Xr, z) / self._L
+        Xr_bar = trapezoid(Xr, z) / self._L
         return Xr, Xr_bar
 
     def simulate(self, hl, n, phim, n_points=300, method="LSODA"):
@@ -111,6 +112,88 @@ class KramerModel:
 
         return z, h, Xr, Xr_bar
     
+    @staticmethod
+    def _analytical_newton(tl, rhs, tol=1.0e-12, max_iter=100):
+        """ Solve implicit analytical relation with vectorized Newton.
+
+        Finds `tx` such that `tl - tx + C log((tl-C)/(tx-C)) = rhs` for
+        all right-hand side values at once. The left-hand side is convex
+        and decreasing over `tx > C`, so that starting at `tl` iterates
+        converge monotonically after the first step; steps leaving the
+        domain are halved towards its lower bound.
+        """
+        C = 3 / (1.24 * 4 * np.pi)
+
+        if np.any(np.asarray(tl) <= C):
+            raise ValueError("Outlet bed height below analytical limit.")
+
+        tx = np.broadcast_to(tl, np.shape(rhs)).astype(float)
+        lt = np.log(tl - C)
+
+        for _ in range(max_iter):
+            f = tl - tx + C * (lt - np.log(tx - C)) - rhs
+            df = -1.0 - C / (tx - C)
+
+            step = f / df
+            tn = tx - step
+            tx = np.where(tn > C, tn, C + 0.5 * (tx - C))
+
+            if np.all(np.abs(step) <= tol * np.abs(tx)):
+                break
+
+        return tx
+
+    def simulate_batch(self, hl, n, phim, n_points=300, rtol=1.0e-03,
+                       atol=1.0e-06):
+        """ Simulate bed depth profiles for many operating points.
+
+        All arguments `hl`, `n`, and `phim` may be arrays, broadcast
+        against each other. Profiles are integrated in lock-step with
+        `majordome.integrate.solve_ivp_batch`, which controls the error
+        of each operating point against its own tolerance.
+
+        Parameters
+        ----------
+        hl : float | np.ndarray
+            Height of bed at product outlet [m].
+        n : float | np.ndarray
+            Kiln Rotation speed [rev/s].
+        phim : float | np.ndarray
+            Kiln feed rate [kg/s].
+        n_points : Optional[int] = 300
+            Number of points to discretize space domain.
+        rtol : Optional[float] = 1.0e-03
+            Relative tolerance of each operating point.
+        atol : Optional[float] = 1.0e-06
+            Absolute tolerance of each operating point [m].
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            Positions, bed heights, loading and mean loading, with one
+            row per operating point for all but the positions.
+        """
+        hl, n, phim = np.broadcast_arrays(*map(np.atleast_1d, (hl, n, phim)))
+
+        t_span = (0.0, self._L)
+        t_eval = np.linspace(*t_span, n_points)
+        y0 = np.maximum(hl, 1.0e-08 * self._R).astype(float)
+
+        mult = (4 / 3) * np.pi * n * self._R3
+        coef = (phim / self._rho) / mult
+
+        def rhs(_, h):
+            """ Right-hand side of Kramer's equation for all points. """
+            ratio = h / self._R
+            term1 = coef / (ratio * (2 - ratio))**1.5
+            return (term1 - self._C1) / self._C2
+
+        z, h = solve_ivp_batch(rhs, t_span, y0, t_eval=t_eval, rtol=rtol,
+                               atol=atol)
+        Xr, Xr_bar = self._postprocess(z, h)
+
+        return z, h, Xr, Xr_bar
+
     def analytical(self, hl, n, phim, n_points=300, x_max=None):
         """ Simulate bed depth profile along the kiln.
         
@@ -132,44 +215,18 @@ class KramerModel:
         Tuple[list[float], list[float], list[float], float]
         
         """
-        C = 3 / (1.24 * 4 * cs.pi)
         den = self._R * self.n_phi(phim, n)
         prod = self.prod_dimensionles(phim, n)
 
-        hx = SX.sym("hx", n_points)
-        
         if x_max is None:
-            xs = SX.sym("xs", n_points)
             z = np.linspace(0.0, self._L, n_points)
+            rhs = (self._L - z) / (self._L * prod)
         else:
-            xs = cs.linspace(x_max, 0.0, n_points)
             z = np.linspace(0.0, x_max, n_points)
+            rhs = z[::-1]
 
-        g = []
-
-        for i in range(n_points):
-            tl = hl / den
-            tx = hx[i] / den
-    
-            lhs = tl - tx  + C * cs.log((tl - C) / (tx - C))
-
-            if x_max is None:
-                rhs = (self._L - xs[i]) / (self._L * prod)
-            else:
-                rhs = xs[i]
-
-            g.append(lhs - rhs)
-        
-        if x_max is None:
-            nlp = {"x": hx, "f": 1, "g": vertcat(*g), "p": xs}
-            solver = nlpsol("solver", "ipopt", nlp)
-            sol = solver(x0=hl, p=z, lbx=0, lbg=0, ubg=0)
-        else:
-            nlp = {"x": hx, "f": 1, "g": vertcat(*g)}
-            solver = nlpsol("solver", "ipopt", nlp)
-            sol = solver(x0=hl, lbx=0, lbg=0, ubg=0)
-            
-        h = sol["x"].full().ravel()
+        tx = self._analytical_newton(hl / den, rhs)
+        h = tx * den
         Xr, Xr_bar = self._postprocess(z, h)
 
         return z, h, Xr, Xr_bar
@@ -226,6 +283,8 @@ def kramer_simulate(
     Figure
         Figure for additional manipulation or display.
     """
+    import matplotlib.pyplot as plt
+
     eqn = KramerModel(alpha, beta, diam, length, rho)
     
     plt.close("all")
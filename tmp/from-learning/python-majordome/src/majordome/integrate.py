@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+from typing import Callable
+from typing import Optional
+import numpy as np
+
+# Dormand-Prince 5(4) tableau (first-same-as-last).
+_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1])
+_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+]
+_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])
+_E = np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200, -22/525,
+               1/40])
+
+# Coefficients of fourth order continuous extension (Shampine, 1986).
+_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608,
+     -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933,
+     87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304,
+     -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408,
+     701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883,
+     -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+def _error_ratio(err, y_old, y_new, rtol, atol):
+    """ Largest error of batch members relative to their tolerance. """
+    scale = atol + rtol * np.maximum(np.abs(y_old), np.abs(y_new))
+    return np.max(np.abs(err) / scale)
+
+
+def _initial_step(fun, t0, y0, f0, rtol, atol):
+    """ Initial step size following Hairer et al. (1993), II.4. """
+    scale = atol + rtol * np.abs(y0)
+    d0 = np.max(np.abs(y0) / scale)
+    d1 = np.max(np.abs(f0) / scale)
+
+    h0 = 1.0e-06 if d0 < 1.0e-05 or d1 < 1.0e-05 else 0.01 * d0 / d1
+    f1 = fun(t0 + h0, y0 + h0 * f0)
+    d2 = np.max(np.abs(f1 - f0) / scale) / h0
+
+    if max(d1, d2) <= 1.0e-15:
+        h1 = max(1.0e-06, 1.0e-03 * h0)
+    else:
+        h1 = (0.01 / max(d1, d2))**(1 / 5)
+
+    return min(100 * h0, h1)
+
+
+def _dense(t, t0, h, y0, K):
+    """ Interpolate states over a step with continuous extension. """
+    s = (np.asarray(t) - t0) / h
+    S = np.power.outer(s, np.arange(1, 5))
+    return y0[:, None] + h * (K.T @ _P) @ S.T
+
+
+def solve_ivp_batch(
+        fun: Callable[[float, np.ndarray], np.ndarray],
+        t_span: tuple[float, float],
+        y0: np.ndarray,
+        t_eval: Optional[np.ndarray] = None,
+        rtol: Optional[float] = 1.0e-03,
+        atol: Optional[float] = 1.0e-06,
+        max_step: Optional[float] = np.inf,
+        max_steps: Optional[int] = 100_000
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """ Integrate a batch of decoupled scalar ODEs in lock-step.
+
+    All members of the batch are stored in a single state array and
+    advanced together by an explicit Dormand-Prince 5(4) scheme, so that
+    the right-hand side is evaluated once per stage for the whole batch.
+    The step size is shared but the error is measured per member: a step
+    is accepted only if the local error of every member is within its
+    own tolerance. Each profile is thus as accurate as if integrated
+    alone, the batch simply advancing at the pace of its most demanding
+    member. Solutions are interpolated at `t_eval` with the fourth order
+    continuous extension of the scheme over each step.
+
+    Parameters
+    ----------
+    fun : Callable[[float, np.ndarray], np.ndarray]
+        Right-hand side `fun(t, y)` evaluated for all members at once.
+    t_span : tuple[float, float]
+        Integration interval, with `t_span[0] < t_span[1]`.
+    y0 : np.ndarray
+        Initial state of each member of the batch.
+    t_eval : Optional[np.ndarray] = None
+        Sorted times at which to store the solution. If not provided,
+        states at the end of every accepted step are returned.
+    rtol : Optional[float] = 1.0e-03
+        Relative tolerance of each member.
+    atol : Optional[float] = 1.0e-06
+        Absolute tolerance of each member.
+    max_step : Optional[float] = np.inf
+        Maximum allowed step size.
+    max_steps : Optional[int] = 100_000
+        Maximum number of attempted steps.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Times and states, with one row per member of the batch.
+
+    Raises
+    ------
+    RuntimeError
+        Step size became too small or too many steps were attempted.
+    ValueError
+        Invalid integration interval or evaluation times.
+    """
+    t0, tf = map(float, t_span)
+
+    if tf <= t0:
+        raise ValueError("Integration interval must be increasing.")
+
+    y = np.array(y0, dtype=float).reshape(-1)
+    f = np.asarray(fun(t0, y), dtype=float)
+
+    if t_eval is None:
+        ts, ys = [t0], [y]
+    else:
+        t_eval = np.asarray(t_eval, dtype=float)
+
+        if np.any(np.diff(t_eval) < 0):
+            raise ValueError("Evaluation times must be sorted.")
+
+        if t_eval.size and (t_eval[0] < t0 or t_eval[-1] > tf):
+            raise ValueError("Evaluation times outside of `t_span`.")
+
+        out = np.empty((y.size, t_eval.size))
+        done = np.searchsorted(t_eval, t0, side="right")
+        out[:, :done] = y[:, None]
+
+    t = t0
+    h = min(max_step, _initial_step(fun, t0, y, f, rtol, atol))
+    K = np.empty((7, y.size))
+
+    # Steps leaving the domain of right-hand side (NaN) are rejected.
+    with np.errstate(invalid="ignore"):
+        for _ in range(max_steps):
+            if t >= tf:
+                break
+
+            h = min(h, max_step, tf - t)
+
+            if h < 10 * np.spacing(t):
+                raise RuntimeError("Step size became too small.")
+
+            K[0] = f
+
+            for s in range(1, 6):
+                dy = h * np.dot(_A[s], K[:s])
+                K[s] = fun(t + _C[s] * h, y + dy)
+
+            t_new = t + h if t + h < tf else tf
+            y_new = y + h * np.dot(_B, K[:6])
+            K[6] = f_new = fun(t_new, y_new)
+
+            err = h * np.dot(_E, K)
+            ratio = _error_ratio(err, y, y_new, rtol, atol)
+
+            if not ratio <= 1.0:
+                h *= max(0.2, 0.9 * ratio**(-1 / 5)) if ratio > 1.0 else 0.2
+                continue
+
+            if t_eval is None:
+                ts.append(t_new)
+                ys.append(y_new)
+            else:
+                stop = np.searchsorted(t_eval, t_new, side="right")
+                te = t_eval[done:stop]
+                out[:, done:stop] = _dense(te, t, h, y, K)
+                done = stop
+
+            grow = 10.0 if ratio == 0.0 else min(10.0, 0.9 * ratio**(-1 / 5))
+            t, y, f, h = t_new, y_new, f_new, h * grow
+        else:
+            raise RuntimeError("Maximum number of steps reached.")
+
+    if t_eval is None:
+        return np.array(ts), np.column_stack(ys)
+
+    return t_eval, out
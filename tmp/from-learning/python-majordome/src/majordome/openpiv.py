@@ -1,24 +1,30 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Iterator
 from typing import Optional
-from imageio.core.util import Array
-from matplotlib.figure import Figure
-from openpiv.tools import imread
-from openpiv.tools import negative
-from openpiv.tools import save as txtsave
-from openpiv.tools import transform_coordinates
-from openpiv.pyprocess import extended_search_area_piv
-from openpiv.pyprocess import get_coordinates
-from openpiv.validation import sig2noise_val
-from openpiv.filters import replace_outliers
-from openpiv.scaling import uniform
+import json
+from scipy.fft import irfft2
+from scipy.fft import next_fast_len
+from scipy.fft import rfft2
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 
+from majordome.frames import FrameSource
+from majordome.frames import as_frame_source
+from majordome.frames import prefetch
 from majordome.utilities import progress_bar
 
+# OpenPIV, pandas, and matplotlib are imported where used, so that
+# importing this module (*e.g.* in worker processes) remains cheap.
+if TYPE_CHECKING:
+    from imageio.core.util import Array
+    from matplotlib.figure import Figure
+    import pandas as pd
+
 
 @dataclass
 class PivConfig:
@@ -86,110 +92,863 @@ class PivConfig:
         return max(self.min_sr, np.percentile(s2n, self.percentile))
 
 
+@dataclass
+class PivField:
+    """ Velocity field extracted from a pair of frames.
+
+    Attributes
+    ----------
+    x: np.ndarray
+        Horizontal coordinates of interrogation windows centers.
+    y: np.ndarray
+        Vertical coordinates of interrogation windows centers.
+    u: np.ndarray
+        Horizontal velocity component at windows centers.
+    v: np.ndarray
+        Vertical velocity component at windows centers.
+    mask: np.ndarray
+        Flags of vectors invalidated by signal-to-noise validation.
+    s2n: np.ndarray
+        Signal-to-noise ratio of correlation peaks.
+    threshold: float
+        Signal-to-noise threshold used in validation.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    u: np.ndarray
+    v: np.ndarray
+    mask: np.ndarray
+    s2n: np.ndarray
+    threshold: float
+
+    @property
+    def speed(self) -> np.ndarray:
+        """ Magnitude of projected velocity. """
+        return np.sqrt(pow(self.u, 2) + pow(self.v, 2))
+
+    def statistics(self) -> list[float]:
+        """ Mean and standard deviation of velocity components and speed. """
+        return [f(q) for q in (self.u, self.v, self.speed)
+                for f in (np.mean, lambda a: np.std(a, ddof=1))]
+
+    def save(self, datafile: str | Path) -> None:
+        """ Dump field to a tab-separated text file as OpenPIV does. """
+        from openpiv.tools import save as txtsave
+        txtsave(self.x, self.y, self.u, self.v, self.mask, datafile)
+
+
+class PivEngine:
+    """ Batched FFT cross-correlation for a configuration and image shape.
+
+    Reproduces OpenPIV's `extended_search_area_piv` with normalized
+    correlation, but gather indices of all interrogation windows, the
+    interrogation mask, FFT sizes, and the spectral phase centering the
+    correlation maps are computed only once, so that repeated shapes also
+    hit the FFT plan cache of `scipy.fft`. Linear correlation is padded to
+    the next fast (even) FFT length instead of the next power of two. All
+    windows of one or several pairs are correlated in a single batched
+    transform and intensities are handled in `float32`. Peak search,
+    sub-pixel estimation, and signal-to-noise ratios are vectorized over
+    windows.
+
+    Results match OpenPIV (to `float32` round-off) for even search area
+    sizes only. For odd sizes the zero lag of OpenPIV's linear maps is
+    off by one pixel, while the engine centers maps exactly; velocities
+    then differ from OpenPIV by one pixel over the time step.
+
+    Parameters
+    ----------
+    conf: PivConfig
+        Configuration object with OpenPIV parameters.
+    shape: tuple[int, int]
+        Shape of frames to be processed.
+    workers: Optional[int] = None
+        Number of threads used by `scipy.fft` transforms.
+    """
+    EPS = 1.0e-07
+
+    def __init__(
+            self,
+            conf: PivConfig,
+            shape: tuple[int, int],
+            workers: Optional[int] = None
+        ) -> None:
+        from openpiv.pyprocess import get_field_shape
+        from openpiv.pyprocess import sliding_window_array
+
+        sa = conf.search_area_size
+        ws = conf.window_size
+
+        if conf.overlap >= ws:
+            raise ValueError("Overlap has to be smaller than the window_size")
+
+        if sa < ws:
+            raise ValueError("Search size cannot be smaller than "
+                             "the window_size")
+
+        if conf.correlation_method not in ("linear", "circular"):
+            raise ValueError(f"Unknown method {conf.correlation_method}")
+
+        self._conf = conf
+        self._shape = tuple(shape)
+        self._workers = workers
+
+        self._field_shape = tuple(get_field_shape(shape, sa, conf.overlap))
+
+        # Flat indices of pixels of all (search area) windows.
+        index = np.arange(np.prod(shape)).reshape(shape)
+        self._index = sliding_window_array(index, sa, conf.overlap)
+
+        # Mask interrogation window in first frame for extended search.
+        self._mask = None
+
+        if sa > ws:
+            pad = (sa - ws) // 2
+            self._mask = np.zeros((sa, sa), dtype=np.float32)
+            self._mask[pad:sa-pad, pad:sa-pad] = 1
+
+        # FFT size (zero-padded for linear correlation, must be even).
+        n = sa
+
+        if conf.correlation_method == "linear":
+            n = next_fast_len(2 * sa - 1, real=True)
+
+            while n % 2:
+                n = next_fast_len(n + 1, real=True)
+
+        self._fsize = [n, n]
+
+        # Phase shifting zero lag to the center of the first `sa` elements
+        # of inverse transform (replaces `fftshift` and slicing).
+        self._center = sa // 2
+        k0 = np.arange(n)
+        k1 = np.arange(n // 2 + 1)
+        shift = lambda k: np.exp(-2j * np.pi * k * self._center / n)
+        self._phase = np.outer(shift(k0), shift(k1)).astype(np.complex64)
+
+    def __call__(
+            self,
+            frames_a: np.ndarray,
+            frames_b: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Compute velocities and S/N ratios of a pair or stack of pairs.
+
+        Parameters
+        ----------
+        frames_a: np.ndarray
+            First frame of pairs, shaped `(H, W)` or `(n_pairs, H, W)`.
+        frames_b: np.ndarray
+            Second frame of pairs, shaped as `frames_a`.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Velocities `u` and `v`, and S/N ratio of all windows shaped
+            `(n_rows, n_cols)` or `(n_pairs, n_rows, n_cols)`.
+        """
+        single = np.ndim(frames_a) == 2
+        frames_a = np.reshape(frames_a, (-1, *self._shape))
+        frames_b = np.reshape(frames_b, (-1, *self._shape))
+
+        corr = self.correlate(frames_a, frames_b)
+        u, v, valid = self._displacements(corr)
+        s2n = self._sig2noise(corr, valid)
+
+        shape = (len(frames_a), *self._field_shape)
+        dt = self._conf.time_step
+
+        u, v, s2n = (q.reshape(shape) for q in (u / dt, v / dt, s2n))
+        return (u[0], v[0], s2n[0]) if single else (u, v, s2n)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """ Shape of frames processed by engine. """
+        return self._shape
+
+    @property
+    def field_shape(self) -> tuple[int, int]:
+        """ Number of rows and columns of velocity fields. """
+        return self._field_shape
+
+    def windows(self, frames: np.ndarray) -> np.ndarray:
+        """ Gather search area windows of a stack of frames. """
+        flat = np.reshape(frames, (len(frames), -1)).astype(np.float32)
+        return flat[:, self._index].reshape((-1, *self._index.shape[1:]))
+
+    @staticmethod
+    def _normalize(windows: np.ndarray) -> np.ndarray:
+        """ Same as OpenPIV `normalize_intensity` in `float32`. """
+        windows = windows - windows.mean(axis=(-2, -1), keepdims=True,
+                                         dtype=np.float32)
+        std = windows.std(axis=(-2, -1), keepdims=True)
+        windows = np.divide(windows, std, out=np.zeros_like(windows),
+                            where=(std != 0))
+        return np.clip(windows, 0, windows.max())
+
+    def correlate(
+            self,
+            frames_a: np.ndarray,
+            frames_b: np.ndarray
+        ) -> np.ndarray:
+        """ Normalized correlation maps of all windows of all pairs. """
+        aa = self.windows(frames_a)
+        bb = self.windows(frames_b)
+
+        # Windows are normalized before masking for extended search and
+        # then once more as part of correlation, as OpenPIV does.
+        if self._mask is not None:
+            aa = self._normalize(aa) * self._mask
+            bb = self._normalize(bb)
+
+        aa = self._normalize(aa)
+        bb = self._normalize(bb)
+
+        axes = (-2, -1)
+        fa = rfft2(aa, self._fsize, axes=axes, workers=self._workers)
+        fb = rfft2(bb, self._fsize, axes=axes, workers=self._workers)
+
+        corr = irfft2(np.conj(fa) * fb * self._phase, self._fsize,
+                      axes=axes, workers=self._workers)
+
+        sa = self._conf.search_area_size
+        return np.clip(corr[:, :sa, :sa] / sa**2, 0, 1)
+
+    def _displacements(
+            self,
+            corr: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Sub-pixel displacements of correlation peaks of all windows.
+
+        Windows whose peak lies over the border of the correlation map
+        are invalid and receive NaN displacements.
+        """
+        n, rows, cols = corr.shape
+        i, j = np.unravel_index(corr.reshape(n, -1).argmax(-1), (rows, cols))
+        valid = (i > 0) & (i < rows - 1) & (j > 0) & (j < cols - 1)
+
+        # OpenPIV shifts (in place) maps of valid peaks for sub-pixel fit.
+        corr[valid] += self.EPS
+
+        k = np.arange(n)
+        ic, jc = np.clip(i, 1, rows - 2), np.clip(j, 1, cols - 2)
+
+        c = corr[k, ic, jc]
+        cl = corr[k, ic - 1, jc]
+        cr = corr[k, ic + 1, jc]
+        cd = corr[k, ic, jc - 1]
+        cu = corr[k, ic, jc + 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            di, dj = self._subpixel(c, cl, cr, cd, cu, ic, jc)
+
+        u = np.where(valid, dj - self._center, np.nan)
+        v = np.where(valid, di - self._center, np.nan)
+
+        return u, v, valid
+
+    def _subpixel(self, c, cl, cr, cd, cu, i, j):
+        """ Sub-pixel peak position with configured method. """
+        method = self._conf.subpixel_method
+
+        def parabolic():
+            return (i + (cl - cr) / (2 * cl - 4 * c + 2 * cr),
+                    j + (cd - cu) / (2 * cd - 4 * c + 2 * cu))
+
+        if method == "parabolic":
+            return parabolic()
+
+        if method == "centroid":
+            return (((i - 1) * cl + i * c + (i + 1) * cr) / (cl + c + cr),
+                    ((j - 1) * cd + j * c + (j + 1) * cu) / (cd + c + cu))
+
+        if method != "gaussian":
+            raise ValueError(f"Method not implemented {method}")
+
+        lc, ll, lr, ld, lu = (np.log(q) for q in (c, cl, cr, cd, cu))
+        den1 = 2 * ll - 4 * lc + 2 * lr
+        den2 = 2 * ld - 4 * lc + 2 * lu
+
+        di = np.divide(ll - lr, den1, out=np.zeros_like(den1),
+                       where=(den1 != 0.0))
+        dj = np.divide(ld - lu, den2, out=np.zeros_like(den2),
+                       where=(den2 != 0.0))
+
+        # Fallback to parabolic fit if any value is negative.
+        negative = np.min([c, cl, cr, cd, cu], axis=0) < 0
+        pi, pj = parabolic()
+
+        return (np.where(negative, pi, i + di),
+                np.where(negative, pj, j + dj))
+
+    def _sig2noise(self, corr: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """ Signal-to-noise ratio of correlation peaks of all windows. """
+        method = self._conf.sig2noise_method
+        n, rows, cols = corr.shape
+
+        flat = corr.reshape(n, -1)
+        peak1 = flat.max(-1)
+        valid = valid & (peak1 >= 1e-3)
+
+        if method == "peak2mean":
+            peak2 = np.abs(flat.mean(-1))
+        elif method == "peak2peak":
+            # Mask neighborhood of first peak to find the second one.
+            w = self._conf.peak_width_ignore
+            i, j = np.unravel_index(flat.argmax(-1), (rows, cols))
+            ii, jj = np.arange(rows), np.arange(cols)
+
+            near = ((np.abs(ii[None, :, None] - i[:, None, None]) <= w) &
+                    (np.abs(jj[None, None, :] - j[:, None, None]) <= w))
+
+            masked = np.where(near, -np.inf, corr).reshape(n, -1)
+            i2, j2 = np.unravel_index(masked.argmax(-1), (rows, cols))
+            peak2 = masked.max(-1)
+
+            border = ((i2 == 0) | (i2 == rows - 1) |
+                      (j2 == 0) | (j2 == cols - 1))
+            peak2 = np.where(border, 0.0, peak2)
+        else:
+            raise ValueError("wrong sig2noise_method")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s2n = np.where(valid & (peak2 != 0), peak1 / peak2, 0.0)
+
+        return s2n
+
+
+class StreamingStatistics:
+    """ Online statistics of a sequence of equally shaped arrays.
+
+    Mean and variance are accumulated with Welford's algorithm and the
+    percentiles with the P² algorithm (Jain and Chlamtac, 1985), both
+    element-wise, so that memory does not depend on sequence length.
+
+    Parameters
+    ----------
+    shape: tuple[int, ...]
+        Shape of arrays in the sequence.
+    percentiles: Optional[tuple[float, ...]] = (5.0, 50.0, 95.0)
+        Percentiles to estimate, in range [0, 100].
+    """
+    def __init__(
+            self,
+            shape: tuple[int, ...],
+            percentiles: Optional[tuple[float, ...]] = (5.0, 50.0, 95.0)
+        ) -> None:
+        self._shape = tuple(shape)
+        self._percentiles = tuple(percentiles)
+
+        self._count = 0
+        self._mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+
+        # P² markers heights and positions per percentile and element.
+        p = np.array(self._percentiles)[:, None] / 100
+        self._dn = np.hstack([0 * p, p / 2, p, (1 + p) / 2, 1 + 0 * p])
+        self._dn = self._dn.reshape((len(p), 5, *len(shape) * (1,)))
+
+        self._q = np.zeros((len(p), 5, *shape))
+        self._n = np.broadcast_to(np.arange(5.0).reshape(
+            (1, 5, *len(shape) * (1,))), self._q.shape).copy()
+        self._nd = 4 * self._dn + 0 * self._q
+
+    def update(self, a: np.ndarray) -> None:
+        """ Add an array to the statistics. """
+        a = np.asarray(a, dtype=float)
+        self._count += 1
+
+        delta = a - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (a - self._mean)
+
+        if self._count <= 5:
+            self._q[:, self._count - 1] = a
+
+            if self._count == 5:
+                self._q.sort(axis=1)
+
+            return
+
+        self.__update_markers(a)
+
+    def __update_markers(self, a):
+        """ Update P² markers with a new observation. """
+        q, n = self._q, self._n
+
+        # Extend extreme markers and find cell of observation.
+        q[:, 0] = np.minimum(q[:, 0], a)
+        q[:, 4] = np.maximum(q[:, 4], a)
+        k = np.clip((a >= q[:, 1:4]).sum(axis=1), 0, 3)
+
+        n += np.arange(5).reshape(self._dn.shape[1:]) > k[:, None]
+        self._nd += self._dn
+
+        for i in (1, 2, 3):
+            d = self._nd[:, i] - n[:, i]
+            up = (d >= 1) & (n[:, i+1] - n[:, i] > 1)
+            dw = (d <= -1) & (n[:, i-1] - n[:, i] < -1)
+            s = np.where(up, 1.0, np.where(dw, -1.0, 0.0))
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                qp = q[:, i] + s / (n[:, i+1] - n[:, i-1]) * (
+                    (n[:, i] - n[:, i-1] + s) * (q[:, i+1] - q[:, i])
+                    / (n[:, i+1] - n[:, i]) +
+                    (n[:, i+1] - n[:, i] - s) * (q[:, i] - q[:, i-1])
+                    / (n[:, i] - n[:, i-1]))
+
+                qn = np.where(s > 0, q[:, i+1], q[:, i-1])
+                nn = np.where(s > 0, n[:, i+1], n[:, i-1])
+                ql = q[:, i] + s * (qn - q[:, i]) / (nn - n[:, i])
+
+            ok = (q[:, i-1] < qp) & (qp < q[:, i+1])
+            q[:, i] = np.where(s == 0, q[:, i], np.where(ok, qp, ql))
+            n[:, i] += s
+
+    @property
+    def count(self) -> int:
+        """ Number of arrays added to statistics. """
+        return self._count
+
+    @property
+    def mean(self) -> np.ndarray:
+        """ Element-wise mean of arrays. """
+        return self._mean
+
+    @property
+    def variance(self) -> np.ndarray:
+        """ Element-wise (sample) variance of arrays. """
+        return self._m2 / max(self._count - 1, 1)
+
+    @property
+    def std(self) -> np.ndarray:
+        """ Element-wise (sample) standard deviation of arrays. """
+        return np.sqrt(self.variance)
+
+    @property
+    def percentiles(self) -> dict[float, np.ndarray]:
+        """ Element-wise estimates of percentiles of arrays.
+
+        Up to five arrays the markers hold the exact (sorted) sample and
+        percentiles are interpolated from it; P² estimates are only used
+        once markers have been adjusted by further observations.
+        """
+        if self._count > 5:
+            values = self._q[:, 2]
+        else:
+            values = np.percentile(self._q[0, :self._count],
+                                   self._percentiles, axis=0)
+
+        return dict(zip(self._percentiles, values))
+
+
+class PivStore:
+    """ Chunked binary storage of a sequence of PIV fields.
+
+    Fields are appended to in-memory buffers of `chunk_size` pairs which
+    are dumped to NumPy `.npy` files (one per quantity and chunk) under a
+    directory, together with the (shared) coordinates grid. Chunks are
+    memory-mapped when reading, so that averaging over fields does not
+    require loading the whole sequence. Streaming statistics of `u`, `v`,
+    and speed `s` are updated upon `append` and stored when closing.
+
+    Parameters
+    ----------
+    path: PathLike
+        Directory holding the store.
+    mode: Optional[str] = "r"
+        Use `"w"` to create a new store (requires `x` and `y`) or `"r"`
+        to read an existing one.
+    x: Optional[np.ndarray] = None
+        Horizontal coordinates of interrogation windows centers.
+    y: Optional[np.ndarray] = None
+        Vertical coordinates of interrogation windows centers.
+    chunk_size: Optional[int] = 256
+        Number of pairs per chunk file.
+    percentiles: Optional[tuple[float, ...]] = (5.0, 50.0, 95.0)
+        Percentiles estimated by streaming statistics.
+    """
+    QUANTITIES = ("u", "v", "mask")
+
+    def __init__(
+            self,
+            path: str | Path,
+            mode: Optional[str] = "r",
+            x: Optional[np.ndarray] = None,
+            y: Optional[np.ndarray] = None,
+            chunk_size: Optional[int] = 256,
+            percentiles: Optional[tuple[float, ...]] = (5.0, 50.0, 95.0)
+        ) -> None:
+        self._path = Path(path)
+        self._mode = mode
+
+        if mode == "r":
+            with open(self._path / "meta.json") as fp:
+                meta = json.load(fp)
+
+            self._count = meta["count"]
+            self._chunk_size = meta["chunk_size"]
+            self._n_chunks = meta["n_chunks"]
+
+            with np.load(self._path / "grid.npz") as data:
+                self._x, self._y = data["x"], data["y"]
+
+            return
+
+        if mode != "w" or x is None or y is None:
+            raise ValueError("Writing a store requires mode `w`, x, and y")
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        np.savez(self._path / "grid.npz", x=x, y=y)
+
+        self._x, self._y = np.asarray(x), np.asarray(y)
+        self._count = 0
+        self._chunk_size = chunk_size
+        self._n_chunks = 0
+
+        shape = (chunk_size, *self._x.shape)
+        self._buffer = {"u": np.empty(shape, dtype=np.float32),
+                        "v": np.empty(shape, dtype=np.float32),
+                        "mask": np.empty(shape, dtype=bool)}
+
+        self._stats = {name: StreamingStatistics(self._x.shape, percentiles)
+                       for name in ("u", "v", "s")}
+
+    def __enter__(self) -> "PivStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, k: int) -> tuple[np.ndarray, ...]:
+        """ Memory-mapped `u`, `v`, and `mask` of pair `k`. """
+        if not 0 <= k < self._count:
+            raise IndexError(f"Pair {k} out of store range")
+
+        c, i = divmod(k, self._chunk_size)
+        return tuple(self._chunk(name, c)[i] for name in self.QUANTITIES)
+
+    def _fname(self, name: str, chunk: int) -> Path:
+        """ Path to chunk file of a quantity. """
+        return self._path / f"{name}_{chunk:06d}.npy"
+
+    def _chunk(self, name: str, chunk: int) -> np.ndarray:
+        """ Memory-mapped chunk of a quantity. """
+        return np.load(self._fname(name, chunk), mmap_mode="r")
+
+    def append(self, field: PivField) -> None:
+        """ Add a field to the store and its statistics. """
+        i = self._count - self._n_chunks * self._chunk_size
+
+        self._buffer["u"][i] = field.u
+        self._buffer["v"][i] = field.v
+        self._buffer["mask"][i] = field.mask
+        self._count += 1
+
+        self._stats["u"].update(field.u)
+        self._stats["v"].update(field.v)
+        self._stats["s"].update(field.speed)
+
+        if i + 1 == self._chunk_size:
+            self.__flush()
+
+    def __flush(self):
+        """ Dump filled part of buffers as a new chunk. """
+        size = self._count - self._n_chunks * self._chunk_size
+
+        if size == 0:
+            return
+
+        for name, buffer in self._buffer.items():
+            np.save(self._fname(name, self._n_chunks), buffer[:size])
+
+        self._n_chunks += 1
+
+    def close(self) -> None:
+        """ Dump remaining data, statistics, and metadata of store. """
+        if self._mode != "w":
+            return
+
+        self.__flush()
+
+        stats = {}
+
+        for name, st in self._stats.items():
+            stats[f"{name}_mean"] = st.mean
+            stats[f"{name}_std"] = st.std
+
+            for p, value in st.percentiles.items():
+                stats[f"{name}_p{p:g}"] = value
+
+        np.savez(self._path / "statistics.npz", **stats)
+
+        meta = {"count": self._count, "chunk_size": self._chunk_size,
+                "n_chunks": self._n_chunks}
+
+        with open(self._path / "meta.json", "w") as fp:
+            json.dump(meta, fp, indent=2)
+
+        self._mode = "r"
+
+    def chunks(self, name: str) -> Iterator[np.ndarray]:
+        """ Iterate over memory-mapped chunks of `u`, `v`, or `mask`. """
+        for c in range(self._n_chunks):
+            yield self._chunk(name, c)
+
+    def array(self, name: str) -> np.ndarray:
+        """ Load quantity of all pairs as `(n_pairs, n_rows, n_cols)`. """
+        return np.concatenate(list(self.chunks(name)))
+
+    def mean(self, name: str) -> np.ndarray:
+        """ Average of `u` or `v` over all pairs, chunk by chunk. """
+        total = sum(chunk.sum(axis=0, dtype=float)
+                    for chunk in self.chunks(name))
+        return total / self._count
+
+    @property
+    def statistics(self) -> dict[str, np.ndarray]:
+        """ Streaming statistics stored when closing the store. """
+        with np.load(self._path / "statistics.npz") as data:
+            return dict(data)
+
+    @property
+    def x(self) -> np.ndarray:
+        """ Horizontal coordinates of interrogation windows centers. """
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        """ Vertical coordinates of interrogation windows centers. """
+        return self._y
+
+
 def piv_workflow(
     conf: PivConfig,
-    images: list[str | Path],
+    images: list[str | Path] | FrameSource,
     output_dir: str | Path,
-    every: Optional[int] = 1
+    every: Optional[int] = 1,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = 32,
+    batch: Optional[int] = 1,
+    plots: Optional[bool] = True,
+    save_data: Optional[bool] = True,
+    store: Optional[str | Path] = None
 ) -> pd.DataFrame:
     """ Process a batch of sequential images provided in list.
 
+    Velocity fields are kept in memory and statistics are computed from
+    them directly. Frames are streamed from source (decoded in background
+    while correlating) and each frame is read once and shared by the two
+    pairs it belongs to, so that memory does not depend on the number of
+    frames. Correlations are computed by a `PivEngine` built once per
+    image shape. If `workers` is provided, contiguous chunks of pairs are
+    distributed over a process pool, at most twice as many chunks as
+    workers being in flight, and results are collected in order; figures
+    (if any) are only rendered afterwards in the main process from the
+    frames already loaded for correlation (returned by workers).
+
     Parameters
     ----------
     conf: PivConfig
         Configuration object with OpenPIV parameters.
-    images: list[PathLike]
-        List of sorted images to run in batch mode.
+    images: list[PathLike] | FrameSource
+        List of sorted images to run in batch mode or any frame source,
+        *e.g.* a `TiffStack` or `VideoSource` from `majordome.frames`.
     output_dir: PathLike
         Path to directory to generate output files.
     every: Optional[int] = 1
         Step between consecutive files in list to compute velocities.
+    workers: Optional[int] = None
+        Number of worker processes. If not provided, run serially.
+    chunksize: Optional[int] = 32
+        Number of consecutive pairs processed per worker task.
+    batch: Optional[int] = 1
+        Number of pairs stacked in a single correlation call.
+    plots: Optional[bool] = True
+        If `True`, save S/N histogram and frames figures of each pair.
+    save_data: Optional[bool] = True
+        If `True`, dump each velocity field to a text data file.
+    store: Optional[PathLike] = None
+        If provided, directory of a `PivStore` receiving all fields (and
+        their streaming statistics), a compact alternative to text data.
 
     Returns
     -------
     pd.DataFrame
         Data frame with time, mean velocities and standard deviations.
     """
-    df = pd.DataFrame(columns=["t", "u_mean", "u_std", "v_mean",
-                               "v_std",  "s_mean", "s_std"])
-    names = ["x", "y", "u", "v", "mask"]
+    import pandas as pd
+
+    output_dir = Path(output_dir)
+    source = as_frame_source(images)
+    n_pairs = len(source) - every
 
-    pairs = zip(images[:-every], images[every:])
-    pbar = progress_bar(pairs, size=len(images)-1, enum=True)
+    fields = _fields_process(conf, source, every, workers,
+                             chunksize, batch, frames=plots)
+    rows = []
+    writer = None
 
-    for count, (file_a, file_b) in pbar:
-        savehist = output_dir / f"transition_{count:04d}_hist.png"
-        saveimgs = output_dir / f"transition_{count:04d}_imgs.png"
+    for count, (field, frame_a, frame_b) in progress_bar(
+            fields, size=n_pairs, enum=True):
         datafile = output_dir / f"transition_{count:04d}_data.dat"
+        t = (count / every) * conf.time_step
 
-        _pair_process(conf, file_a, file_b, datafile,
-                      savehist=savehist, saveimgs=saveimgs,
-                      counter=count)
+        rows.append([t, *field.statistics()])
 
-        data = pd.read_csv(datafile, sep="\t", skiprows=1, names=names)
-        data["s"] = np.sqrt(pow(data["u"], 2) + pow(data["v"], 2))
+        if save_data:
+            field.save(datafile)
 
-        t = (count / every) * conf.time_step
-        row = data.describe().T[["mean", "std"]].loc[["u", "v", "s"]]
-        df.loc[count] = t, *row.to_numpy().flatten()
+        if store is not None:
+            if writer is None:
+                writer = PivStore(store, "w", x=field.x, y=field.y)
+
+            writer.append(field)
+
+        if plots:
+            _pair_render(conf, field, frame_a, frame_b, frame_a,
+                         output_dir, count, every)
+
+    if writer is not None:
+        writer.close()
 
+    df = pd.DataFrame(rows, columns=["t", "u_mean", "u_std", "v_mean",
+                                     "v_std",  "s_mean", "s_std"])
     df.to_csv(output_dir / "results.csv", index=False)
 
     return df
 
 
-def _pair_process(
+def _fields_process(
     conf: PivConfig,
-    file_a: str | Path,
-    file_b: str | Path,
-    datafile: str | Path,
-    savehist: Optional[str | Path] = None,
-    saveimgs: Optional[str | Path] = None,
-    counter: Optional[int] = 0,
-    every: Optional[int] = 1,
-    figsize: Optional[tuple[float, float]] = (12, 12),
-    dpi: Optional[int] = 150
-) -> None:
-    """ Process a pair of images and generates velocity table.
+    source: FrameSource,
+    every: int,
+    workers: Optional[int],
+    chunksize: int,
+    batch: int,
+    frames: Optional[bool] = False
+) -> Iterator[tuple[PivField, np.ndarray, np.ndarray]]:
+    """ Yield fields of all pairs in order (with frames, if `frames`).
+
+    In parallel, chunks are submitted through a bounded window of
+    futures so that results waiting to be consumed (and the frames they
+    hold) do not accumulate for long sequences.
+    """
+    if workers is None:
+        for field, a, b in _pairs_process(conf, source, every, batch):
+            yield (field, a, b) if frames else (field, None, None)
+        return
+
+    n_pairs = len(source) - every
+    starts = range(0, n_pairs, chunksize)
+    stops = [k + chunksize + every for k in starts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        for start, stop in zip(starts, stops):
+            pending.append(executor.submit(_chunk_process, conf, source,
+                                           every, batch, start, stop,
+                                           frames))
+
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _pairs_process(
+    conf: PivConfig,
+    source: FrameSource,
+    every: int,
+    batch: Optional[int] = 1,
+    start: Optional[int] = 0,
+    stop: Optional[int] = None
+) -> Iterator[tuple[PivField, np.ndarray, np.ndarray]]:
+    """ Process consecutive pairs streaming each frame only once. """
+    engine = None
+
+    def process(pairs):
+        frames_a = np.stack([a for a, _ in pairs])
+        frames_b = np.stack([b for _, b in pairs])
+        results = zip(*engine(frames_a, frames_b))
+
+        for (a, b), (u, v, s2n) in zip(pairs, results):
+            yield _pair_field(conf, engine.shape, u, v, s2n), a, b
+
+    # Only the last `every + 1` frames are kept alive.
+    window = deque(maxlen=every + 1)
+    pairs = []
+
+    for frame in prefetch(source.iter_frames(start, stop)):
+        window.append(frame.astype(np.float32))
+
+        if engine is None:
+            engine = PivEngine(conf, frame.shape)
+
+        if len(window) == every + 1:
+            pairs.append((window[0], window[-1]))
+
+        if len(pairs) == batch:
+            yield from process(pairs)
+            pairs = []
+
+    if pairs:
+        yield from process(pairs)
+
+
+def _chunk_process(
+    conf: PivConfig,
+    source: FrameSource,
+    every: int,
+    batch: int,
+    start: int,
+    stop: int,
+    frames: Optional[bool] = False
+) -> list[tuple[PivField, np.ndarray, np.ndarray]]:
+    """ Worker processing all pairs of a contiguous chunk of frames.
+
+    Frames are only sent back (for rendering figures) if `frames` is
+    `True`, otherwise they are replaced by `None`.
+    """
+    pairs = _pairs_process(conf, source, every, batch, start, stop)
+    return [(f, a, b) if frames else (f, None, None) for f, a, b in pairs]
+
+
+def _pair_field(
+    conf: PivConfig,
+    shape: tuple[int, int],
+    u: np.ndarray,
+    v: np.ndarray,
+    s2n: np.ndarray
+) -> PivField:
+    """ Validate and scale velocities extracted from a pair of frames.
 
     Parameters
     ----------
     conf: PivConfig
         Configuration object with OpenPIV parameters.
-    file_a: PathLike
-        Path to first file in the frame series.
-    file_b: PathLike
-        Path to second file in the frame series.
-    datafile: PathLike
-        Path to dump extracted data file.
-    savehist: Optional[PathLike] = None
-        If provided, save S/N ratio histogram to this file.
-    saveimgs: Optional[PathLike] = None
-        If provided, save sequence of images to this file.
-    counter: Optional[int] = 0
-        If provided, index first image in the series with this value.
-    every: Optional[int] = 1
-        Step between consecutive files in list to compute velocities.
-    figsize: Optional[FigSize] = (12, 12)
-        Figure size to be provided to `matplotlib.
-    dpi: Optional[int] = 150
-        Figure pixel density to be provided to `matplotlib.
+    shape: tuple[int, int]
+        Shape of frames in the series.
+    u: np.ndarray
+        Raw horizontal velocity component.
+    v: np.ndarray
+        Raw vertical velocity component.
+    s2n: np.ndarray
+        Signal-to-noise ratio of correlation peaks.
+
+    Returns
+    -------
+    PivField
+        Validated and scaled velocity field.
     """
-    frame_a = imread(file_a).astype(np.int32)
-    frame_b = imread(file_b).astype(np.int32)
-
-    u, v, s2n = extended_search_area_piv(
-        frame_a, frame_b,
-        window_size=conf.window_size,
-        overlap=conf.overlap,
-        dt=conf.time_step,
-        correlation_method=conf.correlation_method,
-        subpixel_method=conf.subpixel_method,
-        sig2noise_method=conf.sig2noise_method,
-        width=conf.peak_width_ignore,
-        search_area_size=conf.search_area_size,
-        normalized_correlation=True
-    )
+    from openpiv.filters import replace_outliers
+    from openpiv.pyprocess import get_coordinates
+    from openpiv.scaling import uniform
+    from openpiv.tools import transform_coordinates
+    from openpiv.validation import sig2noise_val
 
     threshold = conf.threshold(s2n)
 
@@ -202,23 +961,40 @@ def _pair_process(
                             tol=conf.outlier_tol,
                             kernel_size=conf.outlier_kernel_size)
 
-    x, y = get_coordinates(image_size=frame_a.shape,
+    x, y = get_coordinates(image_size=shape,
                            search_area_size=conf.search_area_size,
                            overlap=conf.overlap)
 
     x, y, u, v = uniform(x, y, u, v, scaling_factor=conf.scaling_factor)
     x, y, u, v = transform_coordinates(x, y, u, v)
 
-    txtsave(x, y, u, v, mask, datafile)
+    return PivField(x, y, u, v, mask, s2n, threshold)
+
+
+def _pair_render(
+    conf: PivConfig,
+    field: PivField,
+    frame_a: np.ndarray,
+    frame_b: np.ndarray,
+    file_a: str | Path,
+    output_dir: str | Path,
+    counter: int,
+    every: int,
+    figsize: Optional[tuple[float, float]] = (12, 12),
+    dpi: Optional[int] = 150
+) -> None:
+    """ Save S/N histogram and frames figures of a processed pair. """
+    import matplotlib.pyplot as plt
+
+    savehist = Path(output_dir) / f"transition_{counter:04d}_hist.png"
+    saveimgs = Path(output_dir) / f"transition_{counter:04d}_imgs.png"
 
-    if savehist is not None:
-        plot_histogram(s2n, threshold).savefig(savehist, dpi=dpi)
+    plot_histogram(field.s2n, field.threshold).savefig(savehist, dpi=dpi)
 
-    if saveimgs is not None:
-        plot_images(frame_a, frame_b, datafile, file_a, counter, every,
-                    conf.scaling_factor, conf.window_size,
-                    conf.arrow_scale, conf.arrow_width,
-                    figsize=figsize).savefig(saveimgs, dpi=dpi)
+    plot_images(frame_a, frame_b, field, file_a, counter, every,
+                conf.scaling_factor, conf.window_size,
+                conf.arrow_scale, conf.arrow_width,
+                figsize=figsize).savefig(saveimgs, dpi=dpi)
 
     plt.close("all")
 
@@ -247,6 +1023,8 @@ def plot_mean_speed(
     Figure
         A `matplotlib` figure for further manipulation/dumping.
     """
+    import matplotlib.pyplot as plt
+
     t = 1000 * df["t"].to_numpy()
     s_mean = df["s_mean"].to_numpy()
     s_std = df["s_std"].to_numpy()
@@ -294,6 +1072,8 @@ def plot_histogram(
     Figure
         A `matplotlib` figure for further manipulation/dumping.
     """
+    import matplotlib.pyplot as plt
+
     plt.close("all")
     plt.style.use("seaborn-white")
     fig, ax = plt.subplots(figsize=figsize)
@@ -311,8 +1091,8 @@ def plot_histogram(
 def plot_images(
     frame_a: Array,
     frame_b: Array,
-    txtfile: str | Path,
-    file_a: str | Path,
+    txtfile: str | Path | PivField,
+    file_a: str | Path | np.ndarray,
     counter: int,
     every: int,
     scaling_factor: float,
@@ -329,10 +1109,10 @@ def plot_images(
         First frame in the series.
     frame_b: Array
         Second frame in the series.
-    txtfile: PathLike
-        Path to data file with velocity profiles.
-    file_a: PathLike
-        Path to image file originating `frame_a`.
+    txtfile: PathLike | PivField
+        Path to data file with velocity profiles or field itself.
+    file_a: PathLike | np.ndarray
+        Path to image file originating `frame_a` (or the frame itself).
     counter: int
         Step number used to provide titles to the consecutive images.
     every: int
@@ -353,6 +1133,8 @@ def plot_images(
     Figure
         A `matplotlib` figure for further manipulation/dumping.
     """
+    import matplotlib.pyplot as plt
+
     # Compute difference between frames for speed intuitive view.
     frame_c = pow(frame_a, 2) - pow(frame_b, 2)
 
@@ -385,20 +1167,29 @@ def plot_images(
 
 
 def _display_vector_field(
-        filename: str | Path, 
+        filename: str | Path | PivField,
         window_size: int,
         ax: object,
-        image_name: Optional[str | Path] = None,
+        image_name: Optional[str | Path | np.ndarray] = None,
         scaling_factor: Optional[int] = 1,
         width: Optional[float] = 0.0025, 
         scale: Optional[float] = 1.0
     ):
     """ Alternative to `openpiv.tools.display_vector_field`. """
-    a = np.loadtxt(filename)
-    x, y, u, v, mask = a[:, 0], a[:, 1], a[:, 2], a[:, 3], a[:, 4]
+    from openpiv.tools import imread
+    from openpiv.tools import negative
+
+    if isinstance(filename, PivField):
+        f = filename
+        x, y, u, v, mask = (np.ravel(a) for a in (f.x, f.y, f.u, f.v, f.mask))
+    else:
+        a = np.loadtxt(filename)
+        x, y, u, v, mask = a[:, 0], a[:, 1], a[:, 2], a[:, 3], a[:, 4]
 
     if image_name is not None:
-        im = negative(imread(image_name))
+        im = image_name if isinstance(image_name, np.ndarray) \
+            else imread(image_name)
+        im = negative(im)
         xmax = np.amax(x) + window_size / (2 * scaling_factor)
         ymax = np.amax(y) + window_size / (2 * scaling_factor)
         ax.imshow(im, cmap="Greys_r", extent=[0.0, xmax, 0.0, ymax])
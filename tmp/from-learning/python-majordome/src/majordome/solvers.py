@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from casadi import CodeGenerator
+from casadi import Function
+from casadi import nlpsol
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+
+
+DEFAULT_OPTIONS = {
+    "ipopt.print_level": 0,
+    "print_time": False,
+}
+""" Default options for quiet IPOPT solvers. """
+
+
+class SolverCache:
+    """ Cache of parametric CasADi NLP solvers indexed by signature.
+
+    Building the symbolic graph of a nonlinear program and setting up the
+    underlying solver is often more expensive than solving it for small
+    problems. This cache holds solvers whose changing inputs are provided
+    as CasADi parameters so that each problem structure (its *signature*)
+    is built only once. Optionally solvers are code-generated and compiled
+    to shared libraries under `build_dir`, which are then reloaded by any
+    other process using the same signature without symbolic construction.
+
+    Parameters
+    ----------
+    build_dir : Optional[str | Path] = None
+        Directory for generated sources and shared libraries. If not
+        provided, a `majordome-solvers` directory is created under the
+        system temporary directory upon first compilation.
+    compiler : Optional[str] = "gcc"
+        C compiler used to build generated code.
+    flags : Optional[tuple[str, ...]] = ("-fPIC", "-shared", "-O3")
+        Flags provided to the compiler.
+    """
+    def __init__(
+            self,
+            build_dir: Optional[str | Path] = None,
+            compiler: Optional[str] = "gcc",
+            flags: Optional[tuple[str, ...]] = ("-fPIC", "-shared", "-O3")
+        ) -> None:
+        self._build_dir = None if build_dir is None else Path(build_dir)
+        self._compiler = compiler
+        self._flags = list(flags)
+        self._solvers = {}
+
+    def __contains__(self, signature: Hashable) -> bool:
+        """ Check whether a solver with given signature was built. """
+        return any(key[0] == signature for key in self._solvers)
+
+    def __len__(self) -> int:
+        """ Number of solvers currently held in cache. """
+        return len(self._solvers)
+
+    @property
+    def build_dir(self) -> Path:
+        """ Directory where compiled solvers are stored. """
+        if self._build_dir is None:
+            root = Path(tempfile.gettempdir())
+            self._build_dir = root / "majordome-solvers"
+
+        self._build_dir.mkdir(parents=True, exist_ok=True)
+        return self._build_dir
+
+    @staticmethod
+    def digest(
+            signature: Hashable,
+            solver: Optional[str] = "ipopt",
+            opts: Optional[dict[str, Any]] = None
+        ) -> str:
+        """ Stable name for a signature, solver and options.
+
+        Used both as cache key and for generated files, so that the same
+        problem requested with different options gets its own solver.
+        """
+        opts = json.dumps(opts, sort_keys=True, default=repr)
+        text = repr((signature, solver, opts)).encode("utf-8")
+        return "nlp_" + hashlib.sha1(text).hexdigest()[:16]
+
+    def clear(self) -> None:
+        """ Drop all solvers from memory (compiled libraries are kept). """
+        self._solvers.clear()
+
+    def get(
+            self,
+            signature: Hashable,
+            builder: Callable[[], dict[str, Any]],
+            solver: Optional[str] = "ipopt",
+            opts: Optional[dict[str, Any]] = None,
+            codegen: Optional[bool] = False
+        ) -> Function:
+        """ Retrieve solver for signature, building it only if required.
+
+        Parameters
+        ----------
+        signature : Hashable
+            Any hashable object fully identifying the structure of the
+            problem, *e.g.* its name and discretization size. Its `repr`
+            must be stable across processes if `codegen` is used.
+        builder : Callable[[], dict[str, Any]]
+            Function returning the NLP dictionary with keys `x`, `f`, `g`,
+            and optionally `p`. It is only called upon cache miss.
+        solver : Optional[str] = "ipopt"
+            Name of CasADi NLP plugin to use.
+        opts : Optional[dict[str, Any]] = None
+            Solver options. Defaults to `DEFAULT_OPTIONS`.
+        codegen : Optional[bool] = False
+            If true, generate and compile the problem to a shared library
+            and load the solver from it.
+
+        Returns
+        -------
+        Function
+            CasADi NLP solver function.
+        """
+        opts = DEFAULT_OPTIONS if opts is None else opts
+        name = self.digest(signature, solver, opts)
+        key = (signature, name, codegen)
+
+        if key in self._solvers:
+            return self._solvers[key]
+
+        if not codegen:
+            self._solvers[key] = nlpsol(name, solver, builder(), opts)
+            return self._solvers[key]
+
+        library = self.build_dir / f"{name}.so"
+
+        if not library.exists():
+            self.__compile(name, builder(), solver, opts)
+
+        self._solvers[key] = nlpsol(name, solver, str(library), opts)
+        return self._solvers[key]
+
+    def __compile(self, name, nlp, solver, opts):
+        """ Generate C code for NLP dependencies and build library. """
+        # Generate under process-specific names and move at the end to
+        # avoid concurrent processes loading a partially written library.
+        stem = f"{name}_{os.getpid()}"
+        source = self.build_dir / f"{stem}.c"
+        partial = self.build_dir / f"{stem}.so"
+        target = self.build_dir / f"{name}.so"
+
+        # Same functions as `generate_dependencies`, which can only write
+        # to the working directory, but generated inside `build_dir`.
+        function = nlpsol(name, solver, nlp, opts)
+        codegen = CodeGenerator(f"{stem}.c")
+        codegen.add(function.oracle())
+
+        for dependency in function.get_function():
+            codegen.add(function.get_function(dependency))
+
+        codegen.generate(f"{self.build_dir}{os.sep}")
+
+        command = [self._compiler, *self._flags, str(source),
+                   "-o", str(partial)]
+        subprocess.run(command, check=True, capture_output=True)
+        partial.replace(target)
+
+
+SOLVER_CACHE = SolverCache()
+""" Process-wide default solver cache. """
+
+
+def cached_nlpsol(
+        signature: Hashable,
+        builder: Callable[[], dict[str, Any]],
+        solver: Optional[str] = "ipopt",
+        opts: Optional[dict[str, Any]] = None,
+        codegen: Optional[bool] = False
+    ) -> Function:
+    """ Retrieve parametric solver from process-wide cache.
+
+    See `SolverCache.get` for the description of parameters.
+    """
+    return SOLVER_CACHE.get(signature, builder, solver=solver,
+                            opts=opts, codegen=codegen)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from majordome.calphad.database import DEFAULT_DATABASE
+from majordome.calphad.database import compile_database
+from majordome.calphad.database import database_digest
+from majordome.calphad.database import load_data
+from majordome.calphad.models import PackedGHSER
+import shutil
+import numpy as np
+import pytest
+
+
+def test_compiled_database_cache(tmp_path):
+    """ Compiled database is reloaded with same values and derivatives. """
+    compiled = compile_database(cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.casadi"))) == 1
+
+    loaded = compile_database(cache_dir=tmp_path)
+    assert loaded.names == compiled.names
+
+    T = np.linspace(300.0, 3000.0, 11).reshape(1, -1)
+    k = loaded.index("G(LIQUID,SI1O2)")
+
+    for name in ("G", "dGdT", "d2GdT2"):
+        expected = compiled.function(T=T)[name].full()
+        assert np.array_equal(loaded.function(T=T)[name].full(), expected)
+
+    # Derivative against centered finite differences.
+    h = 1.0e-03
+    dG = (loaded.gibbs(T + h) - loaded.gibbs(T - h)).full()[k] / (2 * h)
+    assert np.allclose(loaded.gibbs_first_derivative(T).full()[k], dG,
+                       rtol=1.0e-06)
+
+    with pytest.raises(KeyError):
+        loaded.index("G(UNKNOWN,PHASE)")
+
+
+def test_database_digest_includes(tmp_path):
+    """ Changing an included file changes the database digest. """
+    source = DEFAULT_DATABASE.parent
+    shutil.copy(DEFAULT_DATABASE, tmp_path / DEFAULT_DATABASE.name)
+    shutil.copytree(source / "database", tmp_path / "database")
+
+    database = tmp_path / DEFAULT_DATABASE.name
+    before = database_digest(database)
+
+    with open(tmp_path / "database" / "solid.yml", "a") as fp:
+        fp.write("\n# Modified.\n")
+
+    assert database_digest(database) != before
+
+
+def test_packed_ghser_matches_compiled(tmp_path):
+    """ NumPy evaluation agrees with compiled symbolic expressions. """
+    compiled = compile_database(cache_dir=tmp_path)
+    packed = PackedGHSER.from_data(load_data()["data"])
+
+    # Include interval boundaries where heaviside function is halved.
+    T = np.array([250.0, 298.15, 600.0, 848.0, 1500.0, 2345.6, 4000.0])
+    values = compiled.function(T=T.reshape(1, -1))
+    G, dGdT, d2GdT2 = (values[k].full() for k in ("G", "dGdT", "d2GdT2"))
+
+    props = packed.properties(T, compiled.names)
+    scale = np.maximum(np.abs(G), 1.0)
+
+    assert np.array_equal(props["G"], G)
+    assert np.allclose(props["S"], -dGdT, rtol=1.0e-12)
+    assert np.all(np.abs(props["H"] - (G - T * dGdT)) <= 1.0e-12 * scale)
+    assert np.allclose(props["Cp"], -T * d2GdT2, rtol=1.0e-12)
+    G = packed.gibbs(np.ones((2, 3)), ["G(LIQUID,SI1O2)"])
+    assert G.shape == (1, 2, 3)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from majordome.calphad.systems import SystemAl2O3CaO
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def system():
+    """ Binary system with liquid solution (non-convex problem). """
+    return SystemAl2O3CaO()
+
+
+def dense_transitions(system, T, x0):
+    """ Reference transitions over dense grid, avoiding local minima. """
+    p = np.column_stack((T, np.full_like(T, x0)))
+    chained = system.sweep(p)
+    mapped = system.sweep(p, parallelization="serial")
+
+    f = np.where(chained["success"], chained["f"], np.inf)
+    x = np.where((mapped["f"] < f)[:, None], mapped["x"], chained["x"])
+    phases = [system.assemblage(xk) for xk in x]
+
+    return [k for k in range(len(T) - 1) if phases[k] != phases[k+1]]
+
+
+@pytest.mark.parametrize("x0", [0.05, 0.2, 0.3])
+def test_find_transitions_dense_reference(system, x0):
+    """ Refined transitions match those of a dense sweep. """
+    T = np.linspace(1500.0, 3000.0, 1501)
+    reference = dense_transitions(system, T, x0)
+
+    coarse = np.linspace(1500.0, 3000.0, 151)
+    found = system.find_transitions(coarse, x0, xtol=0.01)
+
+    assert found, "No transitions found"
+    assert all(b.width <= 0.01 for b in found)
+
+    intervals = sorted({int(np.searchsorted(T, b.T)) - 1 for b in found})
+    assert intervals == reference
+
+
+def test_trace_boundary_liquidus(system):
+    """ Continuation agrees with independent scans of CaO liquidus.
+
+    Amounts of the vanishing phase are tiny close to the boundary, thus
+    assemblages within some hundredths of kelvin depend on the guess.
+    """
+    compositions = np.linspace(0.05, 0.20, 4)
+    traced = system.trace_boundary("CaO", compositions, (1900.0, 3200.0))
+
+    for x0, T_trace in zip(compositions, traced):
+        found = system.find_transitions(np.linspace(1900, 3200, 27), x0)
+        found = [b for b in found
+                 if ("CaO" in b.below) != ("CaO" in b.above)]
+        assert T_trace == pytest.approx(found[-1].T, abs=0.1)
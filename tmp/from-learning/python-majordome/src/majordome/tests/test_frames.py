@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from majordome.frames import ImageSequence
+from majordome.frames import TiffStack
+from majordome.frames import prefetch
+import pickle
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def frames():
+    """ Sequence of small random frames. """
+    rng = np.random.default_rng(42)
+    return rng.integers(0, 255, size=(7, 16, 24), dtype=np.uint8)
+
+
+def test_image_sequence_every(tmp_path, frames):
+    """ Only every n-th image is exposed by sequence. """
+    iio = pytest.importorskip("imageio.v3")
+
+    for k, frame in enumerate(frames):
+        iio.imwrite(tmp_path / f"frame_{k:02d}.png", frame)
+
+    source = ImageSequence(str(tmp_path / "*.png"), every=3)
+
+    assert len(source) == 3
+    assert source.path(1).name == "frame_03.png"
+
+    for k, frame in enumerate(source):
+        assert np.array_equal(frame, frames[3 * k])
+
+
+def test_tiff_stack_range(tmp_path, frames):
+    """ Read pages of a multi-page TIFF in range and after pickling. """
+    tifffile = pytest.importorskip("tifffile")
+    tifffile.imwrite(tmp_path / "stack.tif", frames)
+
+    source = TiffStack(tmp_path / "stack.tif")
+    assert np.array_equal(source.read(6), frames[6])
+
+    source = pickle.loads(pickle.dumps(source))
+    read = list(source.iter_frames(2, 5))
+
+    assert len(read) == 3
+    assert all(np.array_equal(a, b) for a, b in zip(read, frames[2:5]))
+
+
+def test_prefetch_order_and_errors():
+    """ Background production keeps order and re-raises errors. """
+    assert list(prefetch(range(100), size=3)) == list(range(100))
+
+    def failing():
+        yield 1
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        list(prefetch(failing()))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from majordome.granular import KramerModel
+from scipy.integrate import solve_ivp
+import numpy as np
+
+# Kiln length [m] of reference model.
+LENGTH = 20.0
+
+
+def test_simulate_batch_matches_per_point():
+    """ Batch profiles match operating points integrated separately. """
+    model = KramerModel(2.0, 35.0, 2.0, LENGTH, 1500.0)
+    n = np.linspace(0.02, 0.08, 5)
+    phim = np.linspace(1.0, 5.0, 5)
+
+    z, h, Xr, Xr_bar = model.simulate_batch(0.05, n, phim, rtol=1.0e-08,
+                                            atol=1.0e-10)
+    assert h.shape == Xr.shape == (5, z.size)
+    assert Xr_bar.shape == (5,)
+
+    for k, (nk, pk) in enumerate(zip(n, phim)):
+        # Scalar simulation sets operating point of right-hand side.
+        model.simulate(0.05, nk, pk)
+        ref = solve_ivp(model, (0.0, LENGTH), [0.05], t_eval=z,
+                        rtol=1.0e-10, atol=1.0e-12)
+        assert np.allclose(h[k], ref.y[0], rtol=1.0e-06)
+
+
+def test_simulate_batch_default_tolerance():
+    """ Default tolerances agree with scalar simulation. """
+    model = KramerModel(2.0, 35.0, 2.0, LENGTH, 1500.0)
+    n = np.array([0.02, 0.05])
+
+    _, h, _, Xr_bar = model.simulate_batch(0.05, n, 3.0)
+
+    for k, nk in enumerate(n):
+        _, hk, _, Xk_bar = model.simulate(0.05, nk, 3.0)
+        assert np.allclose(h[k], hk, rtol=1.0e-02)
+        assert np.isclose(Xr_bar[k], Xk_bar, rtol=1.0e-02)
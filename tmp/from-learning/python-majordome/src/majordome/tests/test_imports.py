@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from textwrap import dedent
+import os
+import subprocess
+import sys
+import pytest
+
+HEAVY_MODULES = ["casadi", "matplotlib", "networkx", "openpiv", "pandas"]
+""" Backends that must not be loaded by a bare package import. """
+
+IMPORT_BUDGET = float(os.environ.get("MAJORDOME_IMPORT_BUDGET", "1.0"))
+""" Maximum cold import time [s], override for slow machines. """
+
+
+def cold_import(module, repeats=3):
+    """ Import module in fresh interpreters, return time and backends. """
+    code = dedent(f"""\
+        import sys, time
+        t0 = time.perf_counter()
+        import {module}
+        print(time.perf_counter() - t0)
+        print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+    """)
+
+    times = []
+
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             capture_output=True, text=True).stdout
+        elapsed, loaded = out.splitlines()
+        times.append(float(elapsed))
+
+    return min(times), [m for m in loaded.split(",") if m]
+
+
+@pytest.mark.parametrize("module", [
+    "majordome.calphad",
+    "majordome.calphad.systems",
+    "majordome.calphad.samples",
+    "majordome.granular",
+])
+def test_cold_import_is_lazy(module):
+    """ Importing package must not load heavy backends. """
+    _, loaded = cold_import(module, repeats=1)
+    assert not loaded, f"{module} loaded {loaded} at import"
+
+
+
+@pytest.mark.parametrize("module, backend", [
+    ("majordome.openpiv", "openpiv"),
+    ("majordome.drg.drg", "cantera"),
+])
+def test_cold_import_defers_backends(module, backend):
+    """ Wrappers only load their backends and plotting when used. """
+    pytest.importorskip(backend)
+    _, loaded = cold_import(module, repeats=1)
+    assert not loaded, f"{module} loaded {loaded} at import"
+
+
+def test_cold_import_time():
+    """ Cold start of lazily loaded packages within budget. """
+    elapsed, _ = cold_import("majordome.calphad")
+    assert elapsed < IMPORT_BUDGET, f"cold import took {elapsed:.3f} s"
+
+
+def test_lazy_export_resolution():
+    """ Lazy exports resolve to the objects of defining modules. """
+    from majordome import calphad
+    from majordome.calphad.models import DataGHSER
+
+    assert "DataGHSER" in dir(calphad)
+    assert calphad.DataGHSER is DataGHSER
+
+    with pytest.raises(AttributeError):
+        calphad.NotAnExport
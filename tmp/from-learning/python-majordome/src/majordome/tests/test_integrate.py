@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from majordome.integrate import solve_ivp_batch
+from scipy.integrate import solve_ivp
+import numpy as np
+import pytest
+
+# Rates of batch members spanning a few orders of magnitude.
+RATES = np.array([0.1, 1.0, 10.0, 50.0])
+
+
+def logistic(_, y):
+    """ Decoupled logistic growth of all batch members. """
+    return RATES * y * (1 - y)
+
+
+def test_batch_matches_per_member():
+    """ Lock-step batch reproduces members integrated separately. """
+    y0 = np.full(RATES.size, 0.01)
+    t_eval = np.linspace(0.0, 5.0, 51)
+
+    t, y = solve_ivp_batch(logistic, (0.0, 5.0), y0, t_eval=t_eval,
+                           rtol=1.0e-08, atol=1.0e-10)
+
+    for k, rate in enumerate(RATES):
+        ref = solve_ivp(lambda _, u: rate * u * (1 - u), (0.0, 5.0),
+                        [0.01], t_eval=t_eval, rtol=1.0e-10, atol=1.0e-12)
+        assert np.allclose(y[k], ref.y[0], rtol=1.0e-06, atol=1.0e-08)
+
+    assert np.array_equal(t, t_eval)
+
+
+def test_batch_member_independent_of_others():
+    """ Slowest member is not degraded by the stiffest one. """
+    y0 = np.full(RATES.size, 0.01)
+
+    _, alone = solve_ivp_batch(logistic, (0.0, 5.0), y0, t_eval=[5.0])
+    exact = 1 / (1 + 99 * np.exp(-RATES * 5.0))
+
+    assert np.allclose(alone[:, -1], exact, rtol=1.0e-03)
+
+
+def test_batch_invalid_arguments():
+    """ Decreasing intervals and outside evaluation times fail. """
+    with pytest.raises(ValueError):
+        solve_ivp_batch(logistic, (1.0, 0.0), np.ones(4))
+
+    with pytest.raises(ValueError):
+        solve_ivp_batch(logistic, (0.0, 1.0), np.ones(4), t_eval=[0, 2])
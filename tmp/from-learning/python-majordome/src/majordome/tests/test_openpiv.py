@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+pytest.importorskip("openpiv")
+
+from majordome.frames import TiffStack
+from majordome.openpiv import PivConfig
+from majordome.openpiv import PivEngine
+from majordome.openpiv import PivField
+from majordome.openpiv import PivStore
+from majordome.openpiv import StreamingStatistics
+from majordome.openpiv import piv_workflow
+from openpiv.pyprocess import extended_search_area_piv
+from scipy.ndimage import gaussian_filter
+from scipy.ndimage import shift
+
+# Displacement (rows, columns) imposed between frames [px].
+SHIFT = (1.3, -2.4)
+
+
+@pytest.fixture(scope="module")
+def pair():
+    """ Synthetic particle image and its (sub-pixel) shifted copy. """
+    rng = np.random.default_rng(0)
+    frame_a = gaussian_filter(255.0 * (rng.random((96, 128)) > 0.95), 1.0)
+    frame_a = 10 * frame_a
+    frame_b = shift(frame_a, SHIFT, order=3)
+    return frame_a, frame_b
+
+
+def config(ws, sa, overlap, correlation, subpixel, sig2noise):
+    """ Configuration for the engine with unit time step and scale. """
+    return PivConfig(time_step=1.0, scaling_factor=1.0, window_size=ws,
+                     search_area_size=sa, overlap=overlap,
+                     correlation_method=correlation,
+                     subpixel_method=subpixel, sig2noise_method=sig2noise)
+
+
+@pytest.mark.parametrize("ws, sa, overlap, correlation, subpixel, s2n", [
+    (16, 24, 8, "linear", "parabolic", "peak2mean"),
+    (16, 24, 8, "circular", "gaussian", "peak2peak"),
+    (16, 16, 8, "linear", "gaussian", "peak2peak"),
+    (16, 16, 8, "circular", "centroid", "peak2mean"),
+    (15, 22, 7, "linear", "centroid", "peak2mean"),
+])
+def test_engine_parity_even(pair, ws, sa, overlap, correlation,
+                            subpixel, s2n):
+    """ Engine reproduces OpenPIV for even search area sizes. """
+    conf = config(ws, sa, overlap, correlation, subpixel, s2n)
+    frame_a, frame_b = pair
+
+    u, v, s2n_ref = extended_search_area_piv(
+        frame_a.astype(np.int32), frame_b.astype(np.int32),
+        window_size=ws, overlap=overlap, dt=1.0, search_area_size=sa,
+        correlation_method=correlation, subpixel_method=subpixel,
+        sig2noise_method=s2n, width=1, normalized_correlation=True)
+
+    uu, vv, ss = PivEngine(conf, frame_a.shape)(frame_a, frame_b)
+
+    assert np.array_equal(np.isnan(u), np.isnan(uu))
+    assert np.allclose(uu, u, atol=0.01, equal_nan=True)
+    assert np.allclose(vv, v, atol=0.01, equal_nan=True)
+    assert np.allclose(ss, s2n_ref, rtol=0.01)
+
+
+@pytest.mark.parametrize("ws, sa, overlap", [(15, 21, 7), (16, 23, 8)])
+def test_engine_odd_search_area(pair, ws, sa, overlap):
+    """ Odd search areas recover imposed displacement (no parity). """
+    conf = config(ws, sa, overlap, "linear", "parabolic", "peak2mean")
+    frame_a, frame_b = pair
+
+    u, v, _ = PivEngine(conf, frame_a.shape)(frame_a, frame_b)
+
+    # Raw components follow columns and rows of frames.
+    assert np.nanmedian(u) == pytest.approx(SHIFT[1], abs=0.1)
+    assert np.nanmedian(v) == pytest.approx(SHIFT[0], abs=0.1)
+
+
+def test_engine_batch(pair):
+    """ Stacked pairs give the same results as separate calls. """
+    conf = config(16, 24, 8, "linear", "parabolic", "peak2mean")
+    frame_a, frame_b = pair
+
+    engine = PivEngine(conf, frame_a.shape)
+    stack = engine(np.stack([frame_a, frame_b]),
+                   np.stack([frame_b, frame_a]))
+
+    for k, (a, b) in enumerate([(frame_a, frame_b), (frame_b, frame_a)]):
+        for batched, single in zip(stack, engine(a, b)):
+            assert np.allclose(batched[k], single, equal_nan=True)
+
+
+def test_workflow_parallel(tmp_path, pair):
+    """ Parallel chunks give the same results in the same order. """
+    tifffile = pytest.importorskip("tifffile")
+
+    # Accelerated motion so that every pair has its own displacement.
+    frames = [shift(pair[0], (k * SHIFT[0] + 0.2 * k**2, k * SHIFT[1]),
+                    order=3) for k in range(7)]
+
+    stack = tmp_path / "stack.tif"
+    tifffile.imwrite(stack, np.clip(frames, 0, 65535).astype(np.uint16))
+    source = TiffStack(stack)
+
+    conf = config(16, 24, 8, "linear", "parabolic", "peak2mean")
+    args = dict(plots=False, save_data=False)
+
+    serial = piv_workflow(conf, source, tmp_path, **args)
+    parallel = piv_workflow(conf, source, tmp_path, workers=2,
+                            chunksize=1, **args)
+
+    assert len(serial) == 6
+    assert np.all(np.diff(serial["v_mean"]) != 0)
+    assert np.allclose(serial.to_numpy(), parallel.to_numpy())
+
+
+@pytest.mark.parametrize("count", [1, 3, 5])
+def test_percentiles_exact_small_samples(count):
+    """ Up to five arrays percentiles are exact interpolations. """
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(count, 3, 4))
+
+    stats = StreamingStatistics((3, 4), percentiles=(5.0, 50.0, 95.0))
+
+    for a in data:
+        stats.update(a)
+
+    expected = np.percentile(data, (5.0, 50.0, 95.0), axis=0)
+
+    for p, values in zip((5.0, 50.0, 95.0), expected):
+        assert np.allclose(stats.percentiles[p], values)
+
+
+def test_streaming_moments():
+    """ Streaming mean and variance match sample moments. """
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(200, 3, 4))
+
+    stats = StreamingStatistics((3, 4))
+
+    for a in data:
+        stats.update(a)
+
+    assert stats.count == 200
+    assert np.allclose(stats.mean, data.mean(axis=0))
+    assert np.allclose(stats.variance, data.var(axis=0, ddof=1))
+    assert np.allclose(stats.percentiles[50.0], np.median(data, axis=0),
+                       atol=0.25)
+
+
+def test_store_statistics(tmp_path):
+    """ Stored fields and statistics match in-memory reference. """
+    rng = np.random.default_rng(42)
+    shape = (3, 4)
+    x, y = np.meshgrid(np.arange(4.0), np.arange(3.0))
+
+    u = rng.normal(size=(11, *shape))
+    v = rng.normal(size=(11, *shape))
+    mask = rng.random((11, *shape)) > 0.5
+
+    with PivStore(tmp_path, "w", x=x, y=y, chunk_size=4) as store:
+        for uk, vk, mk in zip(u, v, mask):
+            store.append(PivField(x, y, uk, vk, mk, None, 1.0))
+
+    store = PivStore(tmp_path)
+    s = np.hypot(u, v)
+
+    assert len(store) == 11
+    assert np.array_equal(store.x, x)
+    assert np.allclose(store.array("u"), u.astype(np.float32))
+    assert np.array_equal(store.array("mask"), mask)
+    assert np.allclose(store.mean("v"), v.astype(np.float32).mean(axis=0))
+
+    for q, name in zip(store[5], PivStore.QUANTITIES):
+        assert np.allclose(q, dict(u=u, v=v, mask=mask)[name][5])
+
+    stats = store.statistics
+    assert np.allclose(stats["u_mean"], u.mean(axis=0))
+    assert np.allclose(stats["s_std"], s.std(axis=0, ddof=1))
+    assert np.all(stats["v_p5"] <= stats["v_p50"])
+    assert np.all(stats["v_p50"] <= stats["v_p95"])
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from majordome.solvers import SolverCache
+import shutil
+import pytest
+
+casadi = pytest.importorskip("casadi")
+
+
+def quadratic():
+    """ Parametric problem with minimum at `x = p`. """
+    x = casadi.SX.sym("x")
+    p = casadi.SX.sym("p")
+    return {"x": x, "p": p, "f": (x - p) ** 2}
+
+
+def test_cache_key_includes_options():
+    """ Same signature with other options builds another solver. """
+    cache = SolverCache()
+    quiet = {"ipopt.print_level": 0, "print_time": False}
+    capped = {**quiet, "ipopt.max_iter": 1}
+
+    first = cache.get("quadratic", quadratic, opts=quiet)
+    assert cache.get("quadratic", quadratic, opts=dict(quiet)) is first
+
+    other = cache.get("quadratic", quadratic, opts=capped)
+    assert other is not first
+    assert len(cache) == 2
+    assert "quadratic" in cache
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="requires gcc")
+def test_codegen_in_build_dir(tmp_path, monkeypatch):
+    """ Generated sources and libraries are written to build directory. """
+    workdir = tmp_path / "cwd"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    cache = SolverCache(build_dir=tmp_path / "build")
+    solver = cache.get("quadratic", quadratic, codegen=True)
+
+    assert float(solver(x0=0.0, p=2.0)["x"]) == pytest.approx(2.0)
+    assert list((tmp_path / "build").glob("nlp_*.so"))
+    assert not list(workdir.iterdir())
@@ -10,18 +10,23 @@ biomatter pyrolysis, to pharmaceutical applications. For this, base
 classes are provided and used-defined implementations required to
 solve the specific kiln problem.
 """
-from .kiln import RotaryKilnModel
-from .kiln import solve_custom_silica_kiln
-from .models import RadcalWrapper
-from .phases import FreeboardCantera
-from .phases import FreeboardMethane1S
-from .phases import SilicaBasedBed
+from majordome._lazy import lazy_exports
 from .version import version
 from .version import author
 
 __version__ = version
 __author__ = author
 
+# Heavy backends (Cantera, CasADi, ...) load on first access of exports.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "RotaryKilnModel": ".kiln",
+    "RadcalWrapper": ".models",
+    "FreeboardCantera": ".phases",
+    "FreeboardMethane1S": ".phases",
+    "SilicaBasedBed": ".phases",
+    "solve_custom_silica_kiln": ".kiln",
+})
+
 __all__ = [
     "RotaryKilnModel",
     "RadcalWrapper",
@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
-from .custom_silica_kiln import solve_custom_silica_kiln
-from .rotary_kiln import RotaryKilnModel
+from majordome._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "RotaryKilnModel": ".rotary_kiln",
+    "SimulationProfiler": ".profiling",
+    "StateStore": ".state_store",
+    "solve_custom_silica_kiln": ".custom_silica_kiln",
+})
 
 __all__ = [
     "RotaryKilnModel",
+    "SimulationProfiler",
+    "StateStore",
     "solve_custom_silica_kiln"
 ]
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Import Python built-in modules.
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+from typing import Optional
+import json
+
+# Import external modules.
+import pandas as pd
+
+# Own imports.
+from ..types import PathLike
+
+
+class SimulationProfiler:
+    """ Per-iteration phase timings and solver statistics of a kiln.
+
+    Each iteration of a kiln simulation opens a record with `start_step`
+    to which phase wall times (accumulated over repeated entries of the
+    same phase) and solver counters are added. Phases may be nested, in
+    which case the outer one includes the time of the inner ones. Calls
+    made outside of an open record are not tracked. Records are exported
+    as a DataFrame or JSON for identifying which stage to target in slow
+    cases.
+    """
+    def __init__(self) -> None:
+        self._records = []
+        self._current = None
+
+    def start_step(self, step: int) -> None:
+        """ Open a new iteration record. """
+        self.end_step()
+        self._current = {"step": step}
+
+    def end_step(self) -> None:
+        """ Close current iteration record, if any. """
+        if self._current is not None:
+            self._records.append(self._current)
+            self._current = None
+
+    def add(self, key: str, value: float) -> None:
+        """ Accumulate a counter in current record. """
+        if self._current is not None:
+            self._current[key] = self._current.get(key, 0) + value
+
+    def set(self, key: str, value: Any) -> None:
+        """ Set (overwrite) a value in current record. """
+        if self._current is not None:
+            self._current[key] = value
+
+    @contextmanager
+    def phase(self, name: str):
+        """ Context accumulating wall time of a phase [s]. """
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(f"time_{name}", perf_counter() - t0)
+
+    def record_ivp(self, name: str, sol: Any) -> None:
+        """ Store statistics of a `scipy.integrate.solve_ivp` result. """
+        self.add(f"{name}_nfev", sol.nfev)
+        self.add(f"{name}_njev", sol.njev)
+        self.add(f"{name}_nlu", sol.nlu)
+        self.set(f"{name}_status", sol.status)
+
+    def record_root(self, name: str, sol: Any) -> None:
+        """ Store statistics of a `scipy.optimize.root` result. """
+        self.add(f"{name}_nfev", sol.get("nfev", 0))
+        self.add(f"{name}_njev", sol.get("njev", 0))
+        self.set(f"{name}_status", sol.status)
+
+    def record_nlpsol(self, name: str, stats: dict[str, Any]) -> None:
+        """ Store statistics of a CasADi `nlpsol` solver call. """
+        self.add(f"{name}_iters", stats.get("iter_count", 0))
+        self.set(f"{name}_status", stats.get("return_status", ""))
+
+    @property
+    def records(self) -> list[dict[str, Any]]:
+        """ List of closed iteration records. """
+        return self._records
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Iteration records as a table indexed by step. """
+        df = pd.DataFrame(self._records)
+        return df.set_index("step") if not df.empty else df
+
+    def to_json(self, fname: Optional[PathLike] = None) -> str:
+        """ Iteration records as JSON, optionally dumped to file. """
+        text = json.dumps(self._records, indent=2, default=str)
+
+        if fname is not None:
+            with open(fname, "w") as fp:
+                fp.write(text)
+
+        return text
+
+    def summary(self) -> pd.Series:
+        """ Totals of timings and counters over all iterations. """
+        df = self.to_dataframe().select_dtypes("number")
+        return df.loc[:, ~df.columns.str.endswith("_status")].sum()
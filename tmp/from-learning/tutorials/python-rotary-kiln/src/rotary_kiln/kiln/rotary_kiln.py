@@ -1,22 +1,21 @@
 # -*- coding: utf-8 -*-
 
+# Postpone runtime parsing of annotations.
+from __future__ import annotations
+
 # Import Python built-in modules.
 from time import perf_counter
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Optional
+import hashlib
 
 # Import external modules.
-from casadi import MX
-from casadi import nlpsol
-from casadi import vertcat
-from majordome.utilities import Capturing
-from matplotlib.figure import Figure
 from scipy.integrate import cumtrapz
 from scipy.integrate import simpson
 from scipy.integrate import solve_ivp
 from scipy.interpolate import interp1d
 from scipy.optimize import root
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
@@ -32,6 +31,12 @@ from ..models import radiation
 from ..models import effective_thermal_conductivity
 from ..types import Matrix
 from ..types import Vector
+from .profiling import SimulationProfiler
+from .state_store import StateStore
+
+# CasADi and matplotlib are only loaded by features requiring them.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class RotaryKilnModel:
@@ -102,6 +107,7 @@ class RotaryKilnModel:
         self._root_method = root_method
         self._Tmin = 200.0
         self._Tmax = 5000.0
+        self._profiler = SimulationProfiler()
         self.__discretization(nz)
 
     ###############################################################
@@ -134,18 +140,18 @@ class RotaryKilnModel:
     @property
     def _mass_flow_rate_gas(self) -> Matrix:
         """ Access to gas mass flow rate [kg/s]. """
-        return self._solution_gas[:, 0]
+        return self._state["mdot_gas"]
 
     @property
     def _mass_flow_rate_bed(self) -> Matrix:
         """ Access to bed mass flow rate [kg/s]. """
         # TODO check this when enabling gas-solid exchanges.
-        return self._solution_bed[:, 0][::-1]
+        return self._state["mdot_bed"][::-1]
 
     @property
     def _mass_fractions_gas(self) -> Matrix:
         """ Access to gas composition in mass fractions [-]. """
-        return self._solution_gas[:, 2:]
+        return self._state["Y_gas"]
 
     @property
     def _mole_fractions_gas(self) -> Matrix:
@@ -155,12 +161,12 @@ class RotaryKilnModel:
     @property
     def _temperature_gas(self) -> Vector:
         """ Access to gas temperature in solution [K]. """
-        return self._solution_gas[:, 1][::+1]
+        return self._state["temp_gas"][::+1]
 
     @property
     def _temperature_bed(self) -> Vector:
         """ Access to bed temperature in solution [K]. """
-        return self._solution_bed[:, 1][::-1]
+        return self._state["temp_bed"][::-1]
 
     ###############################################################
     # Internal simple helper functions
@@ -208,6 +214,7 @@ class RotaryKilnModel:
             model: BaseODESystem,
             fn_qdot: interp1d,
             solution: Matrix,
+            label: str,
             method: Optional[str] = "LSODA",
             max_step: Optional[float] = 0.1
         ):
@@ -217,6 +224,8 @@ class RotaryKilnModel:
                         args=(fn_qdot,), t_eval=self._z,
                         max_step=max_step)
 
+        self._profiler.record_ivp(label, sol)
+
         if not sol.success:
             name = model.__class__.__name__
             raise RuntimeError(f"Failed to integrate {name}.")
@@ -225,11 +234,13 @@ class RotaryKilnModel:
 
     def __integrate_gas(self):
         """ Integrate system of gas equations with proper arguments. """
-        self.__integrate(self._tfm, self._gas_balance1d, self._solution_gas)
+        self.__integrate(self._tfm, self._gas_balance1d,
+                         self._solution_gas, "gas")
         
     def __integrate_bed(self):
         """ Integrate system of bed equations with proper arguments. """
-        self.__integrate(self._tbm, self._bed_balance1d, self._solution_bed)
+        self.__integrate(self._tbm, self._bed_balance1d,
+                         self._solution_bed, "bed")
         
     def __solve_scipy_root(self, T_g, T_b, e_g, a_g):
         """ Solve constrained problem with `scipy.optimize.root`. """
@@ -237,24 +248,76 @@ class RotaryKilnModel:
         sol = root(self.__steady_constraints, self._guess,
                    method=self._root_method, args=args)
 
+        self._profiler.record_root("constraints", sol)
+
         if not sol.success:
             raise ValueError("Rootfinding failed!")
         
         return sol.x
 
+    def __build_casadi_ipopt(self):
+        """ Build parametric constraints problem for CasADi/ipopt. """
+        from casadi import MX
+        from casadi import vertcat
+
+        # NOTE: all inputs changing between iterations are declared as
+        # parameters so that the solver is built only once per problem
+        # signature (see `__nlp_signature`), shared by similar models.
+        n = self._n_cells
+        T = MX.sym("T", 4 * n)
+        T_g = MX.sym("T_g", n)
+        T_b = MX.sym("T_b", n)
+        e_g = MX.sym("e_g", n)
+        a_g = MX.sym("a_g", n)
+        h_cgw = MX.sym("h_cgw", n + 2)
+        h_cwb = MX.sym("h_cwb", n + 2)
+
+        g = self.__steady_constraints(T, T_g, T_b, e_g, a_g,
+                                      self._eps_bed, self._eps_ref,
+                                      h_cgw=h_cgw, h_cwb=h_cwb)
+
+        p = vertcat(T_g, T_b, e_g, a_g, h_cgw, h_cwb)
+        return {"x": T, "p": p, "f": 1, "g": g}
+
+    def __nlp_signature(self):
+        """ Identify constraints problem by grid and embedded data. """
+        # Geometry and material data are constants of the symbolic
+        # graph, thus a digest of their values is part of signature.
+        data = np.hstack((self._cell_centers, self._R_wg, self._R_cr,
+                          self._R_rs, self._R_sh, self._A_cgw, self._A_rgw,
+                          self._A_cwb, self._A_rwb, self._A_env, self._omega,
+                          self._cell_length, self._eps_bed, self._eps_ref,
+                          self._e_env, self._h_env, self._T_env))
+        digest = hashlib.sha1(data.tobytes()).hexdigest()
+
+        return (type(self).__name__, "constraints", self._n_cells,
+                digest, *self._k_funcs)
+
     def __solve_casadi_ipopt(self, T_g, T_b, e_g, a_g):
         """ Solve constrained problem with CasADi interface to ipopt. """
-        g = self.__steady_constraints(self._T_sym, T_g, T_b, e_g, a_g, 
-                                      self._eps_bed, self._eps_ref)
+        from majordome.solvers import cached_nlpsol
+        from majordome.utilities import Capturing
+
+        # Keep default (verbose) output, only reported upon failure.
+        if self._nlp_solver is None:
+            self._nlp_solver = cached_nlpsol(self.__nlp_signature(),
+                                             self.__build_casadi_ipopt,
+                                             opts={})
 
-        nlp = {"x": self._T_sym, "f": 1, "g": g}
-        solver = nlpsol("solver", "ipopt", nlp)
+        shape = (self._n_cells,)
+        p = np.hstack((T_g, T_b,
+                       np.broadcast_to(e_g, shape),
+                       np.broadcast_to(a_g, shape),
+                       self._h_cgw, self._h_cwb))
 
         with Capturing() as solver_output:
-            result = solver(x0=self._guess,
-                            lbx=self._Tmin,
-                            ubx=self._Tmax,
-                            lbg=0.0, ubg=0.0)
+            result = self._nlp_solver(x0=self._guess, p=p,
+                                      lbx=self._Tmin,
+                                      ubx=self._Tmax,
+                                      lbg=0.0, ubg=0.0)
+
+        self._profiler.record_nlpsol("constraints",
+                                     self._nlp_solver.stats())
 
         constrain_violation = abs(result["g"].full()).max()
         if constrain_violation > self._nlptol:
@@ -308,7 +371,7 @@ class RotaryKilnModel:
     def __tabulate_solution(self, tabs: dict[str, Vector]) -> None:
         """ Compile model results in a tabular format. """
         def wrap_cell_based_results(arr):
-            return [float("nan"), *arr, float("nan")]
+            return np.pad(arr, 1, constant_values=np.nan)
 
         X_g = self._mole_fractions_gas
         Y_g = self._mass_fractions_gas
@@ -322,7 +385,7 @@ class RotaryKilnModel:
         tau_bed *= self._cell_length / self._mass_flow_rate_bed
         tau_bed = cumtrapz(tau_bed, initial=0) / 60.0
 
-        df = pd.DataFrame()
+        df = {}
 
         df["z"] = self._z
         df["t"] = tau_bed[::-1]
@@ -392,10 +455,12 @@ class RotaryKilnModel:
         bs = df["q_env"]
         df["balance_residual"] = bs - bg
 
-        self._table = df
+        self._results = StateStore.from_columns(df)
+        self._table = None
 
-        self._q_loss = simpson(df.q_env[1:-1], df.z[1:-1]) / 1000
-        self._q_bed = simpson(df.q_bed[1:-1], df.z[1:-1]) / 1000
+        z = df["z"][1:-1]
+        self._q_loss = simpson(df["q_env"][1:-1], z) / 1000
+        self._q_bed = simpson(df["q_bed"][1:-1], z) / 1000
 
         print(f"Environment losses ... {self._q_loss:.2f} kW")
         print(f"Bed total heat flux .. {self._q_bed:.2f} kW")
@@ -522,6 +587,7 @@ class RotaryKilnModel:
         self._fn_k_coat  = lambda T: k_coat(self._cell_centers, T)
         self._fn_k_refr  = lambda T: k_refr(self._cell_centers, T)
         self._fn_k_shell = lambda T: k_shell(self._cell_centers, T)
+        self._k_funcs = (k_coat, k_refr, k_shell)
 
         self._eps_bed = kwargs.get("eps_bed", 0.8)
         self._eps_ref = kwargs.get("eps_ref", 0.8)
@@ -557,8 +623,14 @@ class RotaryKilnModel:
         self._Tg_last = np.zeros((self._n_cells+2,))
         self._Tb_last = np.zeros((self._n_cells+2,))
 
-        self._solution_gas = np.zeros((self._n_cells+2, self._tfm.n_vars))
-        self._solution_bed = np.zeros((self._n_cells+2, self._tbm.n_vars))
+        # Both phases states in a single store, bed in reversed order.
+        self._state = StateStore(self._n_cells+2, {
+            "mdot_gas": 1, "temp_gas": 1, "Y_gas": self._tfm.n_vars - 2,
+            "mdot_bed": 1, "temp_bed": 1, "Y_bed": self._tbm.n_vars - 2,
+        })
+
+        self._solution_gas = self._state.span("mdot_gas", "Y_gas")
+        self._solution_bed = self._state.span("mdot_bed", "Y_bed")
 
         self._solution_gas[:, :] = self._tfm.initial_value
         self._solution_bed[:, :] = self._tbm.initial_value
@@ -575,12 +647,11 @@ class RotaryKilnModel:
 
         self._guess = self._Tmax * np.ones(4 * self._n_cells)
         
-        self._T_sym = None
-        if self._solver == "casadi-ipopt":
-            self._T_sym = MX.sym("T_sym", 4 * self._n_cells)
+        self._nlp_solver = None
 
     def __init_postprocess(self, **kwargs):
         """ Create postprocessing symbols. """
+        self._results = None
         self._table = None
 
     def __initialize(self,
@@ -617,9 +688,9 @@ class RotaryKilnModel:
         E = (1.0 + ex) / 2.0
         return self.__core_radiation(E, A, T_g, T_x, eu=eg, au=ag)
 
-    def __fn_q_cgw(self, T_g, T_w):
+    def __fn_q_cgw(self, T_g, T_w, h=None):
         """ Convection from gas to wall Eq. (18) X=W. """
-        h = self._h_cgw
+        h = self._h_cgw if h is None else h
         A = self._A_cgw
         return self.__core_convection(h, A, T_g, T_w)
 
@@ -639,9 +710,9 @@ class RotaryKilnModel:
         A = self._A_rgb
         return self.__fn_q_rgx(T_g, T_b, A, eg, ag, eb)
 
-    def __fn_q_cwb(self, T_w, T_b):
+    def __fn_q_cwb(self, T_w, T_b, h=None):
         """ Conduction(-like) from wall to bed Eq. (22). """
-        h = self._h_cwb
+        h = self._h_cwb if h is None else h
         A = self._A_cwb
         return self.__core_convection(h, A, T_w, T_b)
 
@@ -690,7 +761,8 @@ class RotaryKilnModel:
 
         return term1 + 0.5 / np.sqrt(term2)
     
-    def __steady_constraints(self, T, T_g, T_b, e_g, a_g, e_b, e_w):
+    def __steady_constraints(self, T, T_g, T_b, e_g, a_g, e_b, e_w,
+                             h_cgw=None, h_cwb=None):
         """ Steady-state nonlinear constraints function. """
         T_wi, T_cr, T_rs, T_sh = self.__unpack_temperatures(T)
 
@@ -702,10 +774,10 @@ class RotaryKilnModel:
                              T_rs, T_sh, self._R_rs, self._R_sh)
         q_env = self.__fn_q_env(T_sh)
 
-        q_cgw = self.__fn_q_cgw(T_g, T_wi)
+        q_cgw = self.__fn_q_cgw(T_g, T_wi, h=h_cgw)
         q_rgw = self.__fn_q_rgw(T_g, T_wi, e_g, a_g, e_w)
 
-        q_cwb = self.__fn_q_cwb(T_wi, T_b)
+        q_cwb = self.__fn_q_cwb(T_wi, T_b, h=h_cwb)
         q_rwb = self.__fn_q_rwb(T_wi, T_b, e_b, e_w)
 
         # Eqs. (12) to (15) from paper.
@@ -714,7 +786,8 @@ class RotaryKilnModel:
         eq14 = q_shell - q_refr
         eq15 = q_env - q_shell
 
-        if isinstance(T, MX):
+        if not isinstance(T, np.ndarray):
+            from casadi import vertcat
             return vertcat(eq12, eq13, eq14, eq15)
 
         return np.hstack((eq12, eq13, eq14, eq15))
@@ -793,12 +866,15 @@ class RotaryKilnModel:
         a_g = 0.0
     
         if self._radcal is not None and radon:
-            L = self._beam_length
-            X_h2o = X_g[:, self._tfm.species_index("H2O")]
-            X_co2 = X_g[:, self._tfm.species_index("CO2")]
-            e_g, a_g = self._radcal(T_b, T_g, X_h2o, X_co2, L)
+            with self._profiler.phase("radiation"):
+                L = self._beam_length
+                X_h2o = X_g[:, self._tfm.species_index("H2O")]
+                X_co2 = X_g[:, self._tfm.species_index("CO2")]
+                e_g, a_g = self._radcal(T_b, T_g, X_h2o, X_co2, L)
+
+        with self._profiler.phase("constraints"):
+            T_opt = self.__solve_constraints(T_g, T_b, e_g, a_g)
 
-        T_opt = self.__solve_constraints(T_g, T_b, e_g, a_g)
         T_w, T_cr, T_rs, T_s = self.__unpack_temperatures(T_opt)
 
         self.__update_fluxes(T_g, T_b, T_w, T_s, e_g, a_g, e_w, e_b)
@@ -872,24 +948,41 @@ class RotaryKilnModel:
             Convective heat transfer coefficient to environment [W/(m.K)].
         T_env: Optional[float] = 313.15
             External environment temperature [K].
+
+        Notes
+        -----
+        Wall time of each phase of every iteration and solver statistics
+        (integrators and constraints solver) are recorded and made
+        available through `profile` property after simulation. Time
+        spent in exchanges update includes the constraints solution.
         """
         self._relax = relax
         self._count = 0
+        self._profiler = SimulationProfiler()
+        profiler = self._profiler
 
         t0 = perf_counter()
         for step in range(max_steps):
             print("\n")
+            profiler.start_step(step)
 
             if self._reinitialize_per_iteration or not self._initialized:
                 print(f"Running initialization ({step})")
-                self.__initialize(model_tfm, model_tbm, **kwargs)
+                with profiler.phase("initialize"):
+                    self.__initialize(model_tfm, model_tbm, **kwargs)
 
             print(f"Integrating at step {step}")
-            self.__integrate_gas()
-            self.__integrate_bed()
+            with profiler.phase("gas"):
+                self.__integrate_gas()
+
+            with profiler.phase("bed"):
+                self.__integrate_bed()
                 
             print(f"Solving nonlinear constraints ({step})")
-            self.__update_exchanges(radon=step >= minrad)
+            with profiler.phase("exchanges"):
+                self.__update_exchanges(radon=step >= minrad)
+
+            profiler.end_step()
 
             if self.__test_convergence(atol) and step > minrad:
                 err = max(self._errg, self._errb)
@@ -914,8 +1007,10 @@ class RotaryKilnModel:
             reference: Optional[tuple[Vector, Vector]] = None
         ) -> Figure:
         """ Display simulation results from table. """
-        z = self._table["z"].to_numpy()
-        mean_loading = 100 * self._table["load"].mean()
+        import matplotlib.pyplot as plt
+
+        z = self._results["z"]
+        mean_loading = 100 * self._results["load"].mean()
         tfunc = self.__select_conversion(tunit)
 
         plt.close("all")
@@ -926,14 +1021,14 @@ class RotaryKilnModel:
         # COLUMN 1
 
         ax = plt.subplot(331, sharex=None)
-        ax.plot(z, 100 * self._table["h"])
+        ax.plot(z, 100 * self._results["h"])
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel("Bed height [cm]")
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(334, sharex=ax)
-        ax.plot(z, 100 * self._table["load"])
+        ax.plot(z, 100 * self._results["load"])
         ax.axhline(mean_loading, color="k", linestyle=":")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
@@ -941,8 +1036,8 @@ class RotaryKilnModel:
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(337, sharex=ax)
-        ax.plot(z, self._table["area_bed"], label="Bed")
-        ax.plot(z, self._table["area_gas"], label="Gas")
+        ax.plot(z, self._results["area_bed"], label="Bed")
+        ax.plot(z, self._results["area_gas"], label="Gas")
         ax.grid(linestyle=gridstyle)
         ax.set_ylabel("Coordinate [m]")
         ax.set_ylabel("Cross-section area [m²]")
@@ -952,9 +1047,9 @@ class RotaryKilnModel:
         # COLUMN 2
 
         ax = plt.subplot(332, sharex=ax)
-        ax.plot(z, tfunc(self._table["temp_bed"]), label="Bed")
-        ax.plot(z, tfunc(self._table["temp_gas"]), label="Gas")
-        ax.plot(z, tfunc(self._table["temp_inner"]), label="Wall")
+        ax.plot(z, tfunc(self._results["temp_bed"]), label="Bed")
+        ax.plot(z, tfunc(self._results["temp_gas"]), label="Gas")
+        ax.plot(z, tfunc(self._results["temp_inner"]), label="Wall")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Temperature [{tunit}]")
@@ -963,7 +1058,7 @@ class RotaryKilnModel:
         ax.set_ylim(ylim_temps)
 
         ax = plt.subplot(335, sharex=ax)
-        ax.plot(z, tfunc(self._table["temp_shell"]), label="Shell")
+        ax.plot(z, tfunc(self._results["temp_shell"]), label="Shell")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Temperature [{tunit}]")
@@ -972,9 +1067,9 @@ class RotaryKilnModel:
         ax.set_ylim(ylim_shell)
 
         ax = plt.subplot(338, sharex=ax)
-        ax.plot(z, self._table["x_o2"], label=r"$\mathrm{O_2}$")
-        ax.plot(z, self._table["x_h2o"], label=r"$\mathrm{H_2O}$")
-        ax.plot(z, self._table["x_co2"], label=r"$\mathrm{CO_2}$")
+        ax.plot(z, self._results["x_o2"], label=r"$\mathrm{O_2}$")
+        ax.plot(z, self._results["x_h2o"], label=r"$\mathrm{H_2O}$")
+        ax.plot(z, self._results["x_co2"], label=r"$\mathrm{CO_2}$")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Mole fraction [-]")
@@ -984,15 +1079,15 @@ class RotaryKilnModel:
         # COLUMN 3
 
         ax = plt.subplot(333, sharex=ax)
-        ax.plot(z, +self._table["q_cgw"]/1000, label="$Q_{CGW}$")
-        ax.plot(z, +self._table["q_cgb"]/1000, label="$Q_{CGB}$")
-        ax.plot(z, +self._table["q_cwb"]/1000, label="$Q_{CWB}$")
-        ax.plot(z, +self._table["q_rgw"]/1000, label="$Q_{RGW}$")
-        ax.plot(z, +self._table["q_rgb"]/1000, label="$Q_{RGB}$")
-        ax.plot(z, +self._table["q_rwb"]/1000, label="$Q_{RWB}$")
-        ax.plot(z, -self._table["q_gas"]/1000, label="$Q_{Gas}^\star$")
-        ax.plot(z, +self._table["q_bed"]/1000, label="$Q_{Bed}$")
-        ax.plot(z, +self._table["q_env"]/1000, label="$Q_{Env}$")
+        ax.plot(z, +self._results["q_cgw"]/1000, label="$Q_{CGW}$")
+        ax.plot(z, +self._results["q_cgb"]/1000, label="$Q_{CGB}$")
+        ax.plot(z, +self._results["q_cwb"]/1000, label="$Q_{CWB}$")
+        ax.plot(z, +self._results["q_rgw"]/1000, label="$Q_{RGW}$")
+        ax.plot(z, +self._results["q_rgb"]/1000, label="$Q_{RGB}$")
+        ax.plot(z, +self._results["q_rwb"]/1000, label="$Q_{RWB}$")
+        ax.plot(z, -self._results["q_gas"]/1000, label="$Q_{Gas}^\star$")
+        ax.plot(z, +self._results["q_bed"]/1000, label="$Q_{Bed}$")
+        ax.plot(z, +self._results["q_env"]/1000, label="$Q_{Env}$")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(r"Heat flux [$kW\cdotp{}m^{-1}$]")
@@ -1001,9 +1096,9 @@ class RotaryKilnModel:
 
         if not bed_residence_time:
             ax = plt.subplot(336, sharex=ax)
-            ax.plot(z, self._table["h_cgw"], label="$h_{CGW}$")
-            ax.plot(z, self._table["h_cgb"], label="$h_{CGB}$")
-            ax.plot(z, self._table["h_cwb"], label="$h_{CWB}$")
+            ax.plot(z, self._results["h_cgw"], label="$h_{CGW}$")
+            ax.plot(z, self._results["h_cgb"], label="$h_{CGB}$")
+            ax.plot(z, self._results["h_cwb"], label="$h_{CWB}$")
             ax.grid(linestyle=gridstyle)
             ax.set_xlabel("Coordinate [m]")
             ax.set_ylabel(r"Heat transfer coefficient [$W\cdotp{}m^{-2}K^{-1}$]")
@@ -1011,11 +1106,11 @@ class RotaryKilnModel:
             ax.set_xlim(0.0, self._length)
             ax.set_ylim(0.0, 50.0)
         else:
-            tau = self._table["t"]
-            tau_min = tau.iloc[0]
+            tau = self._results["t"]
+            tau_min = tau[0]
 
             ax = plt.subplot(336, sharex=None)
-            ax.plot(tau, tfunc(self._table["temp_bed"]), label="Bed")
+            ax.plot(tau, tfunc(self._results["temp_bed"]), label="Bed")
 
             if reference is not None:
                 tau_ref, bed_ref = reference
@@ -1072,9 +1167,27 @@ class RotaryKilnModel:
 
     @property
     def table(self) -> pd.DataFrame:
-        """ Access to results table. """
+        """ Access to results table (built once per simulation). """
+        if self._table is None and self._results is not None:
+            self._table = self._results.to_dataframe()
+
         return self._table
 
+    @property
+    def results(self) -> StateStore:
+        """ Access to results in columnar storage. """
+        return self._results
+
+    @property
+    def profiler(self) -> SimulationProfiler:
+        """ Access to timings and statistics of last simulation. """
+        return self._profiler
+
+    @property
+    def profile(self) -> pd.DataFrame:
+        """ Access to per-iteration timings and solver statistics. """
+        return self._profiler.to_dataframe()
+
     @property
     def shell_loss(self) -> float:
         """ Access to shell loss [kW]. """
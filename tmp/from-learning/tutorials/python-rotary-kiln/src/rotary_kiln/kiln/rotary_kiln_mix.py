@@ -1,23 +1,22 @@
 # -*- coding: utf-8 -*-
 
+# Postpone runtime parsing of annotations.
+from __future__ import annotations
+
 # Import Python built-in modules.
 from pathlib import Path
 from time import perf_counter
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Optional
+import hashlib
 
 # Import external modules.
-from casadi import MX
-from casadi import nlpsol
-from casadi import vertcat
-from majordome.utilities import Capturing
-from matplotlib.figure import Figure
 from scipy.integrate import simpson
 from scipy.integrate import solve_ivp
 from scipy.interpolate import interp1d
 from scipy.optimize import root
 import cantera as ct
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
@@ -32,6 +31,12 @@ from ..models import radiation
 from ..models import effective_thermal_conductivity
 from ..types import Matrix
 from ..types import Vector
+from .profiling import SimulationProfiler
+from .state_store import StateStore
+
+# CasADi and matplotlib are only loaded by features requiring them.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 # Make package kinetics data available.
 ct.add_directory(Path(__file__).resolve().parents[1] / "data")
@@ -105,6 +110,7 @@ class RotaryKilnMixModel:
         self._root_method = root_method
         self._Tmin = 200.0
         self._Tmax = 5000.0
+        self._profiler = SimulationProfiler()
         self.__discretization(nz)
 
     ###############################################################
@@ -119,17 +125,17 @@ class RotaryKilnMixModel:
     @property
     def _mass_flow_rate_gas(self) -> Matrix:
         """ Access to gas mass flow rate [kg/s]. """
-        return self._solution[:, 0]
+        return self._state["mdot_gas"]
 
     @property
     def _mass_flow_rate_bed(self) -> Matrix:
         """ Access to bed mass flow rate [kg/s]. """
-        return self._solution[:, self._n_vars_gas+0]
+        return self._state["mdot_bed"]
 
     @property
     def _mass_fractions_gas(self) -> Matrix:
         """ Access to gas composition in mass fractions [-]. """
-        return self._solution[:, 2:self._n_vars_gas]
+        return self._state["Y_gas"]
 
     @property
     def _mole_fractions_gas(self) -> Matrix:
@@ -140,12 +146,12 @@ class RotaryKilnMixModel:
     @property
     def _temperature_gas(self) -> Vector:
         """ Access to gas temperature in solution [K]. """
-        return self._solution[:, 1][::+1]
+        return self._state["temp_gas"][::+1]
 
     @property
     def _temperature_bed(self) -> Vector:
         """ Access to bed temperature in solution [K]. """
-        return self._solution[:, self._n_vars_gas+1][::-1]
+        return self._state["temp_bed"][::-1]
 
     @property
     def _partial_enthalpies_mass(self) -> Vector:
@@ -205,18 +211,26 @@ class RotaryKilnMixModel:
             self._T_b = interp1d(self._z, self._temperature_bed, **opts)
             self._mdot_g = interp1d(self._z, self._mass_flow_rate_gas, **opts)
         
-            sol = solve_ivp(self.__core_rhs_gas, t_span=(0.0, self._length),
-                            y0=self._initial_value_gas, method=method,
-                            t_eval=self._z, max_step=max_step)
+            with self._profiler.phase("gas"):
+                sol = solve_ivp(self.__core_rhs_gas,
+                                t_span=(0.0, self._length),
+                                y0=self._initial_value_gas, method=method,
+                                t_eval=self._z, max_step=max_step)
+
+            self._profiler.record_ivp("gas", sol)
 
             if not sol.success:
                 raise RuntimeError(f"Failed to integrate gas.")
 
             self._solution[:, :self._n_vars_gas] = sol.y.T
             
-            sol = solve_ivp(self.__core_rhs_bed, t_span=(0.0, self._length),
-                            y0=self._initial_value_bed, method=method,
-                            t_eval=self._z, max_step=max_step)
+            with self._profiler.phase("bed"):
+                sol = solve_ivp(self.__core_rhs_bed,
+                                t_span=(0.0, self._length),
+                                y0=self._initial_value_bed, method=method,
+                                t_eval=self._z, max_step=max_step)
+
+            self._profiler.record_ivp("bed", sol)
 
             if not sol.success:
                 raise RuntimeError(f"Failed to integrate bed.")
@@ -229,24 +243,76 @@ class RotaryKilnMixModel:
         sol = root(self.__steady_constraints, self._guess,
                    method=self._root_method, args=args)
 
+        self._profiler.record_root("constraints", sol)
+
         if not sol.success:
             raise ValueError("Rootfinding failed!")
         
         return sol.x
 
+    def __build_casadi_ipopt(self):
+        """ Build parametric constraints problem for CasADi/ipopt. """
+        from casadi import MX
+        from casadi import vertcat
+
+        # NOTE: all inputs changing between iterations are declared as
+        # parameters so that the solver is built only once per problem
+        # signature (see `__nlp_signature`), shared by similar models.
+        n = self._n_cells
+        T = MX.sym("T", 4 * n)
+        T_g = MX.sym("T_g", n)
+        T_b = MX.sym("T_b", n)
+        e_g = MX.sym("e_g", n)
+        a_g = MX.sym("a_g", n)
+        h_cgw = MX.sym("h_cgw", n + 2)
+        h_cwb = MX.sym("h_cwb", n + 2)
+
+        g = self.__steady_constraints(T, T_g, T_b, e_g, a_g,
+                                      self._eps_bed, self._eps_ref,
+                                      h_cgw=h_cgw, h_cwb=h_cwb)
+
+        p = vertcat(T_g, T_b, e_g, a_g, h_cgw, h_cwb)
+        return {"x": T, "p": p, "f": 1, "g": g}
+
+    def __nlp_signature(self):
+        """ Identify constraints problem by grid and embedded data. """
+        # Geometry and material data are constants of the symbolic
+        # graph, thus a digest of their values is part of signature.
+        data = np.hstack((self._cell_centers, self._R_wg, self._R_cr,
+                          self._R_rs, self._R_sh, self._A_cgw, self._A_rgw,
+                          self._A_cwb, self._A_rwb, self._A_env, self._omega,
+                          self._cell_length, self._eps_bed, self._eps_ref,
+                          self._e_env, self._h_env, self._T_env))
+        digest = hashlib.sha1(data.tobytes()).hexdigest()
+
+        return (type(self).__name__, "constraints", self._n_cells,
+                digest, *self._k_funcs)
+
     def __solve_casadi_ipopt(self, T_g, T_b, e_g, a_g):
         """ Solve constrained problem with CasADi interface to ipopt. """
-        g = self.__steady_constraints(self._T_sym, T_g, T_b, e_g, a_g, 
-                                      self._eps_bed, self._eps_ref)
+        from majordome.solvers import cached_nlpsol
+        from majordome.utilities import Capturing
 
-        nlp = {"x": self._T_sym, "f": 1, "g": g}
-        solver = nlpsol("solver", "ipopt", nlp)
+        # Keep default (verbose) output, only reported upon failure.
+        if self._nlp_solver is None:
+            self._nlp_solver = cached_nlpsol(self.__nlp_signature(),
+                                             self.__build_casadi_ipopt,
+                                             opts={})
+
+        shape = (self._n_cells,)
+        p = np.hstack((T_g, T_b,
+                       np.broadcast_to(e_g, shape),
+                       np.broadcast_to(a_g, shape),
+                       self._h_cgw, self._h_cwb))
 
         with Capturing() as solver_output:
-            result = solver(x0=self._guess,
-                            lbx=self._Tmin,
-                            ubx=self._Tmax,
-                            lbg=0.0, ubg=0.0)
+            result = self._nlp_solver(x0=self._guess, p=p,
+                                      lbx=self._Tmin,
+                                      ubx=self._Tmax,
+                                      lbg=0.0, ubg=0.0)
+
+        self._profiler.record_nlpsol("constraints",
+                                     self._nlp_solver.stats())
 
         constrain_violation = abs(result["g"].full()).max()
         if constrain_violation > self._nlptol:
@@ -300,7 +366,7 @@ class RotaryKilnMixModel:
     def __tabulate_solution(self, tabs: dict[str, Vector]) -> None:
         """ Compile model results in a tabular format. """
         def wrap_cell_based_results(arr):
-            return [float("nan"), *arr, float("nan")]
+            return np.pad(arr, 1, constant_values=np.nan)
 
         X_g = self._mole_fractions_gas
         Y_g = self._mass_fractions_gas
@@ -308,10 +374,10 @@ class RotaryKilnMixModel:
 
         self._sarr.TPY = T_g, None, Y_g
 
-        u = self._mass_flow_rate_gas
-        u /= (self._sarr.density * self._gas_cross_area)
+        u = self._mass_flow_rate_gas / (self._sarr.density *
+                                        self._gas_cross_area)
 
-        df = pd.DataFrame()
+        df = {}
 
         df["z"] = self._z
         df["h"] = self._bed_height
@@ -380,9 +446,10 @@ class RotaryKilnMixModel:
         bs = df["q_env"]
         df["balance_residual"] = bs - bg
 
-        self._table = df
+        self._results = StateStore.from_columns(df)
+        self._table = None
 
-        q_loss = simpson(df.q_env[1:-1], df.z[1:-1])
+        q_loss = simpson(df["q_env"][1:-1], df["z"][1:-1])
         print(f"Environment losses {q_loss:.2f} kW")
 
     ###############################################################
@@ -411,6 +478,8 @@ class RotaryKilnMixModel:
 
         # Store/allocate internals.
         self._mw_gas = self._gas.molecular_weights
+        self._idx_h2o = self._gas.species_index("H2O")
+        self._idx_co2 = self._gas.species_index("CO2")
         self._initial_value_gas = np.hstack((mf0, tf0, self._gas.Y))
         self._n_vars_gas = self._initial_value_gas.shape[0]
 
@@ -504,27 +573,8 @@ class RotaryKilnMixModel:
         self._local_loading = eta_loc
         self._mean_loading = eta_bar
 
-        opts = dict(fill_value="extrapolate")
-
-        # General interpolations.
-        self._fR = interp1d(self._z, self._R_zw, **opts)
-        self._fbeta = interp1d(self._z, self._central_angle, **opts)
-        self._feta = interp1d(self._z, self._local_loading, **opts)
-
-        # Compute gas and bed interpolated sections.
-        fAc = interp1d(self._z, self._gas_cross_area, **opts)
-        fPc = interp1d(self._z, self._bed_cord_length, **opts)
-        fAb = interp1d(self._z, self._bed_cross_area, **opts)
-        fPb = interp1d(self._z, self._bed_cord_length, **opts)
-
-        # Assembly accessor functions.
-        self._get_section_gas = lambda z: (fAc(z), fPc(z))
-        self._get_section_bed = lambda z: (fAb(z), fPb(z))
-
     def __init_heat_geometry(self, **kwargs):
         """ Evaluate internal areas and perimeters of kiln. """
-        opts = dict(fill_value="extrapolate")
-
         # Local radius is inner kiln radius all over...
         R = self._radius
 
@@ -534,9 +584,6 @@ class RotaryKilnMixModel:
         self._A_cgw = self._P_xgw * self._cell_length
         self._A_rgw = self._A_cgw
 
-        self._fA_cgw = interp1d(self._z, self._A_cgw, **opts)
-        self._fA_rgw = self._fA_cgw
-
         # Areas for pair gas-bed: this area is as trapezoidal
         # section because in fact bed is an inclined plane. Here,
         # to avoid useless complications it is computed as a
@@ -545,9 +592,6 @@ class RotaryKilnMixModel:
         self._A_cgb = self._P_xgb * self._cell_length
         self._A_rgb = self._A_cgb
 
-        self._fA_cgb = interp1d(self._z, self._A_cgb, **opts)
-        self._fA_rgb = self._fA_cgb
-
         # Areas for pair wall-bed: in this case there are two
         # different areas because radiation comes through the
         # exposed surface and conduction from contact with wall.
@@ -558,14 +602,9 @@ class RotaryKilnMixModel:
         self._A_cwb = self._P_cwb * self._cell_length
         self._A_rwb = self._P_rwb * self._cell_length
 
-        self._fA_cwb = interp1d(self._z, self._A_cwb, **opts)
-        self._fA_rwb = interp1d(self._z, self._A_rwb, **opts)
-
         # View factor for RWB is the ratio of receiving bed
         # surface to emitting walls (interface gas-wall).
         self._omega = self._P_rwb / self._P_xgw
-        self._fomega = interp1d(self._z, self._omega)
-
         # External shell area.
         self._P_env = 2 * np.pi * self._R_sh
         self._A_env = self._P_env * self._cell_length 
@@ -579,6 +618,7 @@ class RotaryKilnMixModel:
         self._fn_k_coat  = lambda T: k_coat(self._cell_centers, T)
         self._fn_k_refr  = lambda T: k_refr(self._cell_centers, T)
         self._fn_k_shell = lambda T: k_shell(self._cell_centers, T)
+        self._k_funcs = (k_coat, k_refr, k_shell)
 
         self._eps_bed = kwargs.get("eps_bed", 0.8)
         self._eps_ref = kwargs.get("eps_ref", 0.8)
@@ -606,6 +646,38 @@ class RotaryKilnMixModel:
                                    beta=self._central_angle,
                                    eta=self._local_loading)
 
+    def __init_rhs_geometry(self, **kwargs):
+        """ Tabulate all geometric quantities required by RHS. """
+        n = self._rotation_rate
+        w = 2 * np.pi * n
+
+        # Geometric factors of local heat transfer coefficients.
+        G_htc = self._htc.factors(self._gas_cross_area, w, n,
+                                  self._R_zw, self._central_angle)
+
+        # NOTE: gas sections use bed cord length as perimeter.
+        self._rhs_geometry = np.column_stack((
+            self._gas_cross_area,
+            self._bed_cord_length,
+            self._bed_cross_area,
+            self._bed_cord_length,
+            self._R_zw,
+            *G_htc,
+            self._A_cgw,
+            self._A_cgb,
+            self._A_cwb,
+            self._A_rwb,
+            self._omega
+        ))
+
+    def __geometry(self, z: float) -> Vector:
+        """ Fused linear interpolation of RHS geometry table at `z`. """
+        k = np.searchsorted(self._z, z) - 1
+        k = min(max(k, 0), self._z.shape[0] - 2)
+
+        w = (z - self._z[k]) / (self._z[k+1] - self._z[k])
+        return (1 - w) * self._rhs_geometry[k] + w * self._rhs_geometry[k+1]
+
     def __init_solution(self, **kwargs):
         """ Initialize variables used in solution process. """
         self._initial_value = np.hstack((
@@ -626,7 +698,13 @@ class RotaryKilnMixModel:
         self._Tg_last = np.zeros((self._n_cells+2,))
         self._Tb_last = np.zeros((self._n_cells+2,))
 
-        self._solution = np.zeros((self._n_cells+2, self._n_vars))
+        # Both phases states in a single store, bed in reversed order.
+        self._state = StateStore(self._n_cells+2, {
+            "mdot_gas": 1, "temp_gas": 1, "Y_gas": self._n_vars_gas - 2,
+            "mdot_bed": 1, "temp_bed": 1, "Y_bed": self._n_vars_bed - 2,
+        })
+
+        self._solution = self._state.span("mdot_gas", "Y_bed")
         self._solution[:, :] = self._initial_value
 
         self._history_gas = []
@@ -634,16 +712,16 @@ class RotaryKilnMixModel:
 
         self._guess = self._Tmax * np.ones(4 * self._n_cells)
         
-        self._T_sym = None
-        if self._solver == "casadi-ipopt":
-            self._T_sym = MX.sym("T_sym", 4 * self._n_cells)
+        self._nlp_solver = None
 
         # Access to wall temperature interpolation [K].
         T_w = 0.1 * self._Tmax * np.ones(self._n_cells)
-        self._T_w = lambda z: self.__extended_balance(T_w)(z)
+        fT_w = self.__extended_balance(T_w)
+        self._T_w = lambda z: fT_w(z)
 
     def __init_postprocess(self, **kwargs):
         """ Create postprocessing symbols. """
+        self._results = None
         self._table = None
 
     def __initialize(self, **kwargs) -> None:
@@ -653,6 +731,7 @@ class RotaryKilnMixModel:
         self.__init_bed_geometry(**kwargs)
         self.__init_heat_geometry(**kwargs)
         self.__init_heat_fluxes(**kwargs)
+        self.__init_rhs_geometry(**kwargs)
         self.__init_solution(**kwargs)
         self.__init_postprocess(**kwargs)
         self._initialized = True
@@ -676,9 +755,9 @@ class RotaryKilnMixModel:
         E = (1.0 + ex) / 2.0
         return self.__core_radiation(E, A, T_g, T_x, eu=eg, au=ag)
 
-    def __fn_q_cgw(self, T_g, T_w):
+    def __fn_q_cgw(self, T_g, T_w, h=None):
         """ Convection from gas to wall Eq. (18) X=W. """
-        h = self._h_cgw
+        h = self._h_cgw if h is None else h
         A = self._A_cgw
         return self.__core_convection(h, A, T_g, T_w)
 
@@ -698,9 +777,9 @@ class RotaryKilnMixModel:
         A = self._A_rgb
         return self.__fn_q_rgx(T_g, T_b, A, eg, ag, eb)
 
-    def __fn_q_cwb(self, T_w, T_b):
+    def __fn_q_cwb(self, T_w, T_b, h=None):
         """ Conduction(-like) from wall to bed Eq. (22). """
-        h = self._h_cwb
+        h = self._h_cwb if h is None else h
         A = self._A_cwb
         return self.__core_convection(h, A, T_w, T_b)
 
@@ -771,25 +850,29 @@ class RotaryKilnMixModel:
         a_g = 0.0
 
         if self._radcal is not None:
-            X_h2o = self._gas.X[self._gas.species_index("H2O")]
-            X_co2 = self._gas.X[self._gas.species_index("CO2")]
+            X = self._gas.X
+            X_h2o = X[self._idx_h2o]
+            X_co2 = X[self._idx_co2]
             e_g, a_g = self._radcal(T_b, T_g, X_h2o, X_co2, R)
 
         return e_w, e_b, e_g, a_g
     
-    def __core_rhs_qdot(self, z, mdot_g, T_g, T_b):
+    def __core_rhs_qdot(self, z, geom, mdot_g, T_g, T_b):
         """ Compute local HTC's with parameters. """
-        R = self._fR(z)
-        beta = self._fbeta(z)
-        eta = self._feta(z)
-        Ac = self._get_section_gas(z)[0]
+        R = geom[4]
+        G_htc = geom[5:8]
+        A_cgw, A_cgb, A_cwb, A_rwb, omega = geom[8:]
+        A_rgw = A_cgw
+        A_rgb = A_cgb
     
         # Compute radiative properties.
         e_w, e_b, e_g, a_g = self.__core_rhs_rad(T_g, T_b, R)
 
-        # Create local HTC calculator.
-        htc = HtcTscheng1979(D=2*R, beta=beta, eta=eta)
-        
+        # Gas thermophysical properties.
+        rho = self._gas.density
+        mu = self._gas.viscosity
+        k_g = self._gas.thermal_conductivity
+
         # Bed thermophysical properties.
         cp_b = self._si1o2.specific_heat_mass(T_b)
         k_b = self._kb(T_b)
@@ -798,28 +881,13 @@ class RotaryKilnMixModel:
         # Effective bed thermal conductivity.
         k_b_eff = effective_thermal_conductivity(k_g, k_b, 0.5)
 
-        u = mdot_g / (self._gas.density * Ac)
-        n = self._rotation_rate
-        w = 2 * np.pi * n
-
-        htc.update(self._gas.density, self._gas.viscosity, u, w)
-        h_cgw = htc.h_gw(self._gas.thermal_conductivity)
-        h_cgb = htc.h_gb(self._gas.thermal_conductivity)
-        h_cwb = htc.h_wb(k_b_eff, n, R, beta, a_b)
+        # Only state-dependent terms remain to evaluate here.
+        h_cgw, h_cgb, h_cwb = HtcTscheng1979.h_factored(
+            G_htc, k_g, k_b_eff, a_b, mdot_g, rho, mu)
 
         # Retrieve local values.
         T_w = self._T_w(z)
 
-        A_cgw = self._fA_cgw(z)
-        A_cgb = self._fA_cgb(z)
-        A_cwb = self._fA_cwb(z)
-
-        A_rgw = self._fA_rgw(z)
-        A_rgb = self._fA_cgb(z)
-        A_rwb = self._fA_rwb(z)
-
-        omega = self._fomega(z)
-
         # Compute emissivity parameters.
         e_rgw = 0.5 * (1.0 + e_w)
         e_rgb = 0.5 * (1.0 + e_b)
@@ -846,7 +914,8 @@ class RotaryKilnMixModel:
         sdotk = np.zeros_like(Y)
 
         # Compute sections and perimeters.
-        Ac, Pc = self._get_section_gas(z)
+        geom = self.__geometry(z)
+        Ac, Pc = geom[0], geom[1]
 
         try:
             # Set state to compute properties.
@@ -865,7 +934,7 @@ class RotaryKilnMixModel:
         # Retrieve local heat exchanges.
         T_b = self._T_b(z)
         mdot_g = mdot
-        q_all = self.__core_rhs_qdot(z, mdot_g, T, T_b)
+        q_all = self.__core_rhs_qdot(z, geom, mdot_g, T, T_b)
         q_cgw, q_cgb, _, q_rgw, q_rgb, _ = q_all
 
         # Perform energy balance and local density.
@@ -891,7 +960,8 @@ class RotaryKilnMixModel:
         sdotk = np.zeros_like(Y)
 
         # Compute sections and perimeters.
-        Ab, Pb = self._get_section_bed(z)
+        geom = self.__geometry(z)
+        Ab, Pb = geom[2], geom[3]
 
         # Set external state to compute properties.
         # Not applicable.
@@ -905,7 +975,7 @@ class RotaryKilnMixModel:
         # Retrieve local heat exchanges.
         T_g = self._T_g(self._length - z)
         mdot_g = self._mdot_g(self._length - z)
-        q_all = self.__core_rhs_qdot(z, mdot_g, T_g, T)
+        q_all = self.__core_rhs_qdot(z, geom, mdot_g, T_g, T)
         _, q_cgb, q_cwb, _, q_rgb, q_rwb = q_all
 
         # Perform energy balance and local density.
@@ -926,7 +996,8 @@ class RotaryKilnMixModel:
     # Main constraint methods
     ###############################################################
     
-    def __steady_constraints(self, T, T_g, T_b, e_g, a_g, e_b, e_w):
+    def __steady_constraints(self, T, T_g, T_b, e_g, a_g, e_b, e_w,
+                             h_cgw=None, h_cwb=None):
         """ Steady-state nonlinear constraints function. """
         T_wi, T_cr, T_rs, T_sh = self.__unpack_temperatures(T)
 
@@ -938,10 +1009,10 @@ class RotaryKilnMixModel:
                              T_rs, T_sh, self._R_rs, self._R_sh)
         q_env   = self.__fn_q_env(T_sh)
 
-        q_cgw = self.__fn_q_cgw(T_g, T_wi)
+        q_cgw = self.__fn_q_cgw(T_g, T_wi, h=h_cgw)
         q_rgw = self.__fn_q_rgw(T_g, T_wi, e_g, a_g, e_w)
 
-        q_cwb = self.__fn_q_cwb(T_wi, T_b)
+        q_cwb = self.__fn_q_cwb(T_wi, T_b, h=h_cwb)
         q_rwb = self.__fn_q_rwb(T_wi, T_b, e_b, e_w)
 
         # Eqs. (12) to (15) from paper.
@@ -950,7 +1021,8 @@ class RotaryKilnMixModel:
         eq14 = q_shell - q_refr
         eq15 = q_env - q_shell
 
-        if isinstance(T, MX):
+        if not isinstance(T, np.ndarray):
+            from casadi import vertcat
             return vertcat(eq12, eq13, eq14, eq15)
 
         return np.hstack((eq12, eq13, eq14, eq15))
@@ -962,6 +1034,12 @@ class RotaryKilnMixModel:
         T_g = self._temperature_gas
         T_b = self._temperature_bed
 
+        # Gas thermophysical properties.
+        self._sarr.TPY = T_g, None, Y_g
+        rho = self._sarr.density
+        mu = self._sarr.viscosity
+        k_g = self._sarr.thermal_conductivity
+
         # Bed thermophysical properties.
         cp_b = self._si1o2.specific_heat_mass(T_b)
         k_b = self._kb(T_b)
@@ -969,12 +1047,6 @@ class RotaryKilnMixModel:
 
         # Effective bed thermal conductivity.
         k_b_eff = effective_thermal_conductivity(k_g, k_b, 0.5)
-
-        # Gas thermophysical properties.
-        self._sarr.TPY = T_g, None, Y_g
-        rho = self._sarr.density
-        mu = self._sarr.viscosity
-        k_g = self._sarr.thermal_conductivity
         
         # NOTE: apparently Tscheng uses rev/s to be consistent
         # in units with Kramers equation and other references.
@@ -1011,12 +1083,15 @@ class RotaryKilnMixModel:
         a_g = 0.0
 
         if self._radcal is not None and radon:
-            L = self._radius
-            X_h2o = X_g[:, self._sarr.species_index("H2O")]
-            X_co2 = X_g[:, self._sarr.species_index("CO2")]
-            e_g, a_g = self._radcal(T_b, T_g, X_h2o, X_co2, L)
+            with self._profiler.phase("radiation"):
+                L = self._radius
+                X_h2o = X_g[:, self._sarr.species_index("H2O")]
+                X_co2 = X_g[:, self._sarr.species_index("CO2")]
+                e_g, a_g = self._radcal(T_b, T_g, X_h2o, X_co2, L)
+
+        with self._profiler.phase("constraints"):
+            T_opt = self.__solve_constraints(T_g, T_b, e_g, a_g)
 
-        T_opt = self.__solve_constraints(T_g, T_b, e_g, a_g)
         T_w, T_cr, T_rs, T_s = self.__unpack_temperatures(T_opt)
 
         # Access to wall temperature interpolation [K].
@@ -1136,22 +1211,36 @@ class RotaryKilnMixModel:
             Material angle of repose (AOR) in degrees [°].
         kb: Optional[Callable[[float], float]] = lambda T: 0.2
             Material apparent thermal conductivity [W/(m.K)].
+
+        Notes
+        -----
+        Wall time of each phase of every iteration and solver statistics
+        (integrators and constraints solver) are recorded and made
+        available through `profile` property after simulation. Time
+        spent in exchanges update includes the constraints solution.
         """
         self._count = 0
+        self._profiler = SimulationProfiler()
+        profiler = self._profiler
 
         t0 = perf_counter()
         for step in range(max_steps):
             print("\n")
+            profiler.start_step(step)
 
             if self._reinitialize_per_iteration or not self._initialized:
                 print(f"Running initialization ({step})")
-                self.__initialize(**kwargs)
+                with profiler.phase("initialize"):
+                    self.__initialize(**kwargs)
 
             print(f"Integrating at step {step}")
             self.__integrate(max_iters=1)
 
             print(f"Solving nonlinear constraints ({step})")
-            self.__update_exchanges(radon=step > minrad)
+            with profiler.phase("exchanges"):
+                self.__update_exchanges(radon=step > minrad)
+
+            profiler.end_step()
 
             if self.__test_convergence(atol) and step > minrad:
                 err = max(self._errg, self._errb)
@@ -1171,8 +1260,10 @@ class RotaryKilnMixModel:
             figsize: Optional[tuple[float, float]] = (14.0, 10.0)
         ) -> Figure:
         """ Display simulation results from table. """
-        z = self._table["z"].to_numpy()
-        mean_loading = 100 * self._table["load"].mean()
+        import matplotlib.pyplot as plt
+
+        z = self._results["z"]
+        mean_loading = 100 * self._results["load"].mean()
         tfunc = self.__select_conversion(tunit)
 
         plt.close("all")
@@ -1183,14 +1274,14 @@ class RotaryKilnMixModel:
         # COLUMN 1
 
         ax = plt.subplot(331, sharex=None)
-        ax.plot(z, 100 * self._table["h"])
+        ax.plot(z, 100 * self._results["h"])
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel("Bed height [cm]")
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(334, sharex=ax)
-        ax.plot(z, 100 * self._table["load"])
+        ax.plot(z, 100 * self._results["load"])
         ax.axhline(mean_loading, color="k", linestyle=":")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
@@ -1198,8 +1289,8 @@ class RotaryKilnMixModel:
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(337, sharex=ax)
-        ax.plot(z, self._table["area_bed"], label="Bed")
-        ax.plot(z, self._table["area_gas"], label="Gas")
+        ax.plot(z, self._results["area_bed"], label="Bed")
+        ax.plot(z, self._results["area_gas"], label="Gas")
         ax.grid(linestyle=gridstyle)
         ax.set_ylabel("Coordinate [m]")
         ax.set_ylabel("Cross-section area [m²]")
@@ -1209,9 +1300,9 @@ class RotaryKilnMixModel:
         # COLUMN 2
 
         ax = plt.subplot(332, sharex=ax)
-        ax.plot(z, tfunc(self._table["temp_bed"]), label="Bed")
-        ax.plot(z, tfunc(self._table["temp_gas"]), label="Gas")
-        ax.plot(z, tfunc(self._table["temp_inner"]), label="Wall")
+        ax.plot(z, tfunc(self._results["temp_bed"]), label="Bed")
+        ax.plot(z, tfunc(self._results["temp_gas"]), label="Gas")
+        ax.plot(z, tfunc(self._results["temp_inner"]), label="Wall")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Temperature [{tunit}]")
@@ -1219,7 +1310,7 @@ class RotaryKilnMixModel:
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(335, sharex=ax)
-        ax.plot(z, tfunc(self._table["temp_shell"]), label="Shell")
+        ax.plot(z, tfunc(self._results["temp_shell"]), label="Shell")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Temperature [{tunit}]")
@@ -1227,9 +1318,9 @@ class RotaryKilnMixModel:
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(338, sharex=ax)
-        ax.plot(z, self._table["x_o2"], label=r"$\mathrm{O_2}$")
-        ax.plot(z, self._table["x_h2o"], label=r"$\mathrm{H_2O}$")
-        ax.plot(z, self._table["x_co2"], label=r"$\mathrm{CO_2}$")
+        ax.plot(z, self._results["x_o2"], label=r"$\mathrm{O_2}$")
+        ax.plot(z, self._results["x_h2o"], label=r"$\mathrm{H_2O}$")
+        ax.plot(z, self._results["x_co2"], label=r"$\mathrm{CO_2}$")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(f"Mole fraction [-]")
@@ -1239,15 +1330,15 @@ class RotaryKilnMixModel:
         # COLUMN 3
 
         ax = plt.subplot(333, sharex=ax)
-        ax.plot(z, self._table["q_cgw"]/1000, label="$Q_{CGW}$")
-        ax.plot(z, self._table["q_cgb"]/1000, label="$Q_{CGB}$")
-        ax.plot(z, self._table["q_cwb"]/1000, label="$Q_{CWB}$")
-        ax.plot(z, self._table["q_rgw"]/1000, label="$Q_{RGW}$")
-        ax.plot(z, self._table["q_rgb"]/1000, label="$Q_{RGB}$")
-        ax.plot(z, self._table["q_rwb"]/1000, label="$Q_{RWB}$")
-        ax.plot(z, self._table["q_gas"]/1000, label="$Q_{Gas}$")
-        ax.plot(z, self._table["q_bed"]/1000, label="$Q_{Bed}$")
-        ax.plot(z, self._table["q_env"]/1000, label="$Q_{Env}$")
+        ax.plot(z, self._results["q_cgw"]/1000, label="$Q_{CGW}$")
+        ax.plot(z, self._results["q_cgb"]/1000, label="$Q_{CGB}$")
+        ax.plot(z, self._results["q_cwb"]/1000, label="$Q_{CWB}$")
+        ax.plot(z, self._results["q_rgw"]/1000, label="$Q_{RGW}$")
+        ax.plot(z, self._results["q_rgb"]/1000, label="$Q_{RGB}$")
+        ax.plot(z, self._results["q_rwb"]/1000, label="$Q_{RWB}$")
+        ax.plot(z, self._results["q_gas"]/1000, label="$Q_{Gas}$")
+        ax.plot(z, self._results["q_bed"]/1000, label="$Q_{Bed}$")
+        ax.plot(z, self._results["q_env"]/1000, label="$Q_{Env}$")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(r"Heat flux [$kW\cdotp{}m^{-1}$]")
@@ -1255,9 +1346,9 @@ class RotaryKilnMixModel:
         ax.set_xlim(0.0, self._length)
 
         ax = plt.subplot(336, sharex=ax)
-        ax.plot(z, self._table["h_cgw"], label="$h_{CGW}$")
-        ax.plot(z, self._table["h_cgb"], label="$h_{CGB}$")
-        ax.plot(z, self._table["h_cwb"], label="$h_{CWB}$")
+        ax.plot(z, self._results["h_cgw"], label="$h_{CGW}$")
+        ax.plot(z, self._results["h_cgb"], label="$h_{CGB}$")
+        ax.plot(z, self._results["h_cwb"], label="$h_{CWB}$")
         ax.grid(linestyle=gridstyle)
         ax.set_xlabel("Coordinate [m]")
         ax.set_ylabel(r"Heat transfer coefficient [$W\cdotp{}m^{-2}K^{-1}$]")
@@ -1282,5 +1373,23 @@ class RotaryKilnMixModel:
 
     @property
     def table(self) -> pd.DataFrame:
-        """ Provides access results table. """
+        """ Provides access results table (built once per simulation). """
+        if self._table is None and self._results is not None:
+            self._table = self._results.to_dataframe()
+
         return self._table
+
+    @property
+    def results(self) -> StateStore:
+        """ Provides access to results in columnar storage. """
+        return self._results
+
+    @property
+    def profiler(self) -> SimulationProfiler:
+        """ Provides access to timings and statistics of simulation. """
+        return self._profiler
+
+    @property
+    def profile(self) -> pd.DataFrame:
+        """ Provides access to per-iteration timings and statistics. """
+        return self._profiler.to_dataframe()
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Import Python built-in modules.
+from pathlib import Path
+from typing import Iterator
+from typing import Optional
+
+# Import external modules.
+import numpy as np
+import pandas as pd
+
+# Own imports.
+from ..types import Matrix
+from ..types import PathLike
+from ..types import Tensor
+
+
+class StateStore:
+    """ Columnar storage of named fields sharing the same rows.
+
+    All fields are held in a single contiguous column-major array and are
+    accessed through zero-copy views, so that each field (column) is also
+    contiguous in memory. Fields might span several columns (*e.g.* the
+    mass fractions of all species), in which case views are 2D. Data can
+    be stored in NumPy `.npz` or HDF5 `.h5` (requires `h5py`) formats and
+    a DataFrame is only built on demand with `to_dataframe`.
+
+    Parameters
+    ----------
+    n_rows: int
+        Number of rows (*e.g.* kiln coordinates) of all fields.
+    fields: dict[str, int]
+        Ordered mapping of field names to their number of columns.
+    data: Optional[Matrix] = None
+        Initial data of shape `(n_rows, sum(fields.values()))`. If not
+        provided the store is initialized with NaN.
+    """
+    def __init__(self,
+            n_rows: int,
+            fields: dict[str, int],
+            data: Optional[Matrix] = None
+        ) -> None:
+        self._fields = dict(fields)
+        self._slices = {}
+
+        start = 0
+        for name, width in self._fields.items():
+            self._slices[name] = slice(start, start + width)
+            start += width
+
+        if data is None:
+            self._data = np.full((n_rows, start), np.nan, order="F")
+        else:
+            self._data = np.asfortranarray(data, dtype=float)
+
+        if self._data.shape != (n_rows, start):
+            raise ValueError("Data shape does not match fields.")
+
+    def __getitem__(self, name: str) -> Tensor:
+        """ View of a field, 1D for single column fields. """
+        s = self._slices[name]
+        return self._data[:, s.start] if self._fields[name] == 1 \
+            else self._data[:, s]
+
+    def __setitem__(self, name: str, value: Tensor) -> None:
+        """ Assign values to a field in place. """
+        self[name][...] = value
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, Tensor]) -> "StateStore":
+        """ Create store from mapping of names to (1D or 2D) arrays. """
+        columns = {k: np.asarray(v, dtype=float) for k, v in columns.items()}
+        fields = {k: 1 if v.ndim == 1 else v.shape[1]
+                  for k, v in columns.items()}
+
+        n_rows = len(next(iter(columns.values())))
+        store = cls(n_rows, fields)
+
+        for name, value in columns.items():
+            store[name] = value
+
+        return store
+
+    def span(self, first: str, last: str) -> Matrix:
+        """ 2D view of consecutive fields from `first` to `last`. """
+        start = self._slices[first].start
+        stop = self._slices[last].stop
+        return self._data[:, start:stop]
+
+    def columns(self) -> list[str]:
+        """ Column labels, multi-column fields suffixed by index. """
+        labels = []
+
+        for name, width in self._fields.items():
+            labels.extend([name] if width == 1 else
+                          [f"{name}_{k}" for k in range(width)])
+
+        return labels
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Build a DataFrame with all fields. """
+        return pd.DataFrame(self._data, columns=self.columns())
+
+    @staticmethod
+    def _path(fname: PathLike) -> Path:
+        """ File path with `.npz` suffix unless HDF5 `.h5` is given. """
+        fname = Path(fname)
+        return fname if fname.suffix == ".h5" else fname.with_suffix(".npz")
+
+    def save(self, fname: PathLike) -> None:
+        """ Store data in `.npz` or `.h5` format (by file suffix).
+
+        Any suffix other than `.h5` is replaced by `.npz`, so that `load`
+        finds the file under the same name.
+        """
+        fname = self._path(fname)
+        names = list(self._fields.keys())
+        widths = list(self._fields.values())
+
+        if fname.suffix != ".h5":
+            np.savez(fname, data=self._data, names=names, widths=widths)
+            return
+
+        import h5py
+
+        with h5py.File(fname, "w") as fp:
+            fp.create_dataset("data", data=self._data)
+            fp.attrs["names"] = names
+            fp.attrs["widths"] = widths
+
+    @classmethod
+    def load(cls, fname: PathLike) -> "StateStore":
+        """ Load data stored with `save` (same suffix rules). """
+        fname = cls._path(fname)
+
+        if fname.suffix != ".h5":
+            with np.load(fname) as fp:
+                data = fp["data"]
+                names = fp["names"].tolist()
+                widths = fp["widths"].tolist()
+        else:
+            import h5py
+
+            with h5py.File(fname, "r") as fp:
+                data = fp["data"][...]
+                names = [str(n) for n in fp.attrs["names"]]
+                widths = fp.attrs["widths"].tolist()
+
+        return cls(data.shape[0], dict(zip(names, widths)), data=data)
+
+    @property
+    def data(self) -> Matrix:
+        """ Underlying column-major array. """
+        return self._data
+
+    @property
+    def fields(self) -> dict[str, int]:
+        """ Mapping of field names to their number of columns. """
+        return dict(self._fields)
+
+    @property
+    def nbytes(self) -> int:
+        """ Memory used by stored data [bytes]. """
+        return self._data.nbytes
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from .si1o2 import ThermoSi1O2
+from .water import ThermoH2OLiquid
 
 __all__ = [
+    "ThermoH2OLiquid",
     "ThermoSi1O2"
 ]
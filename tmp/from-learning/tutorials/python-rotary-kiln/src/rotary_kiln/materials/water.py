@@ -1,3 +1,16 @@
 # -*- coding: utf-8 -*-
 
-# TODO: implement water to use in mixture phases.
\ No newline at end of file
+# Own imports.
+from ..models import ShomateEquation
+
+
+class ThermoH2OLiquid(ShomateEquation):
+    """ Thermodynamic properties of liquid H2O.
+
+    Data extracted from (valid from 298 K to 500 K):
+    https://webbook.nist.gov/cgi/cbook.cgi?ID=C7732185&Type=JANAFL
+    """
+    def __init__(self) -> None:
+        coefs = [-2.036060e+02, +1.523290e+03, -3.196413e+03, +2.474455e+03,
+                 +3.855326e+00, -2.565478e+02, -4.887163e+02, -2.858304e+02]
+        super().__init__(coefs, coefs, 500.0, 0.0180153)
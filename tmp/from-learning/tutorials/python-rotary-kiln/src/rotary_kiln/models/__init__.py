@@ -2,10 +2,15 @@
 from .htc_tscheng1979 import HtcTscheng1979
 from .kramers_model import KramersModel
 from .kramers_model import KramersModelExperimental
+from .kramers_model import KramersModelBatch
+from .machine_learning import DenseNetwork
 from .machine_learning import NeuralModel
+from .machine_learning import TabulatedModel
+from .shomate_equation import ShomateDatabase
 from .shomate_equation import ShomateEquation
 from .radiation import RadcalWrapper
 from .kramers_model import solve_kramers_model
+from .kramers_model import solve_kramers_batch
 from .machine_learning import load_standard_scaler
 from ._models import arrhenius
 from ._models import conduction
@@ -17,10 +22,15 @@ __all__ = [
     "HtcTscheng1979",
     "KramersModel",
     "KramersModelExperimental",
+    "KramersModelBatch",
+    "DenseNetwork",
     "NeuralModel",
+    "TabulatedModel",
+    "ShomateDatabase",
     "ShomateEquation",
     "RadcalWrapper",
     "solve_kramers_model",
+    "solve_kramers_batch",
     "load_standard_scaler",
     "arrhenius",
     "conduction",
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 # Import external modules.
-import cantera as ct
+from scipy.constants import gas_constant
+from scipy.constants import Stefan_Boltzmann
 import numpy as np
 
-
-SIGMA = ct.stefan_boltzmann
+# NOTE: constants are taken from SciPy (same CODATA values as Cantera)
+# to avoid loading Cantera when importing this package.
+SIGMA = Stefan_Boltzmann
 """ Stefan-Boltzmann constant W/(m².K⁴). """
 
 
@@ -28,7 +30,7 @@ def radiation(E, A, Tu, Tv, eu=1.0, au=1.0):
 
 def arrhenius(k0, Ea, T):
     """ Arrhenius kinetic rate at `k0` units. """
-    return k0 * np.exp(-Ea / (ct.gas_constant * T / 1000.0))
+    return k0 * np.exp(-Ea / (gas_constant * T))
 
 
 def effective_thermal_conductivity(kg, ks, phi):
@@ -8,12 +8,16 @@ import numpy as np
 
 # Own imports.
 from ..bases import BaseHtcModel
+from ..types import Matrix
 from ..types import NumberOrVector
 from ..types import Vector
 
 
 class HtcTscheng1979(BaseHtcModel):
     """ Heat transfer coefficient by Tscheng (1979). """
+    COEFS_GB = [+0.46, +0.535, +0.104, -0.341]
+    COEFS_GW = [+1.54, +0.575, -0.292, +0.000]
+
     def __init__(self,
             D: NumberOrVector,
             beta: NumberOrVector,
@@ -55,11 +59,11 @@ class HtcTscheng1979(BaseHtcModel):
 
     def h_gb(self, kg: NumberOrVector) -> NumberOrVector:
         """ Gas-bed heat transfer coefficient. """
-        return self._model(kg, [+0.46, +0.535, +0.104, -0.341])
+        return self._model(kg, self.COEFS_GB)
 
     def h_gw(self, kg: NumberOrVector) -> NumberOrVector:
         """ Gas-wall heat transfer coefficient. """
-        return self._model(kg, [+1.54, +0.575, -0.292, +0.000])
+        return self._model(kg, self.COEFS_GW)
 
     def h_wb(self,
             kb: NumberOrVector,
@@ -87,3 +91,54 @@ class HtcTscheng1979(BaseHtcModel):
 
         h = kb * Nu / (R * beta)
         return h
+
+    def _flow_factor(self, a: Vector, Ac: NumberOrVector, w: float
+                     ) -> NumberOrVector:
+        """ Geometric factor of gas coefficient for given coefficients. """
+        return (a[0] * pow(self._D_e, a[1] + 2 * a[2] - 1) *
+                pow(Ac, -a[1]) * pow(w, a[2]) * pow(self._eta, a[3]))
+
+    def factors(self,
+            Ac: NumberOrVector,
+            w: float,
+            n: float,
+            R: NumberOrVector,
+            beta: NumberOrVector
+        ) -> Matrix:
+        """ State-independent factors of gas-wall, gas-bed, and wall-bed
+        coefficients, in this order.
+
+        Reynolds numbers are products of geometry and of flow state, with
+        `Re_D = mdot D_e / (Ac mu)` and `Re_w = rho w D_e^2 / mu`, so that
+        coefficients can be split into a geometric factor (provided here)
+        that can be tabulated over the kiln grid and a state-dependent
+        part, evaluated with `h_factored`. Arguments are the same as in
+        `update` and `h_wb`, `Ac` being the gas cross section area.
+        """
+        G_gw = self._flow_factor(self.COEFS_GW, Ac, w)
+        G_gb = self._flow_factor(self.COEFS_GB, Ac, w)
+        G_wb = 11.6 * pow(n * R**2 * beta, 0.3) / (R * beta)
+        return np.vstack((G_gw, G_gb, G_wb))
+
+    @classmethod
+    def h_factored(cls,
+            G: Vector,
+            kg: NumberOrVector,
+            kb: NumberOrVector,
+            a_b: NumberOrVector,
+            mdot: NumberOrVector,
+            rho: NumberOrVector,
+            mu: NumberOrVector
+        ) -> tuple[NumberOrVector, NumberOrVector, NumberOrVector]:
+        """ Gas-wall, gas-bed, and wall-bed coefficients from factors.
+
+        See `factors` for details; here `mdot` is the gas mass flow rate
+        and the remaining parameters are the same as in other methods.
+        """
+        def h_flow(g, a):
+            return g * kg * pow(mdot / mu, a[1]) * pow(rho / mu, a[2])
+
+        h_gw = h_flow(G[0], cls.COEFS_GW)
+        h_gb = h_flow(G[1], cls.COEFS_GB)
+        h_wb = G[2] * kb * pow(a_b, -0.3)
+        return h_gw, h_gb, h_wb
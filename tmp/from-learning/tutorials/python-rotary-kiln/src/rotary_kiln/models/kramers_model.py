@@ -5,15 +5,116 @@ from typing import Callable
 from typing import Optional
 
 # Import external modules.
+from majordome.integrate import solve_ivp_batch
 from scipy.integrate import solve_ivp
+from scipy.sparse import diags
 import numpy as np
 
 # Own imports.
 from ..types import Vector
 
 
-class KramersModel:
-    """ Kramers (1952) model for a rotary kiln bed height. 
+class KramersModelBatch:
+    """ Kramers (1952) model for a batch of operating points.
+
+    All operating points share the same kiln radius profile and are
+    evaluated at once as a system of decoupled equations. Scalar
+    arguments are broadcast against the others and the batch size is
+    given by the resulting shape. The right-hand side accepts arrays of
+    states with one column per evaluation point for vectorized
+    integrators.
+
+    Parameters
+    ----------
+    radius: Callable[[float], float]
+        Rotary kiln internal radius [m].
+    slope: float | Vector
+        Rotary kiln slope [rad].
+    rotation_rate: float | Vector
+        Rotary kiln rotation rate [rev/s].
+    feed_rate: float | Vector
+        Rotary kilnn keed rate [kg/s].
+    repose_angle: float | Vector
+        Bed material repose angle [rad].
+    rho: float | Vector
+        Bed material bulk density [kg/m³].
+    experimental: Optional[bool] = False
+        If True, use local slope of generalized cross section model.
+    """
+    def __init__(self,
+        radius: Callable[[float], float],
+        slope: float | Vector,
+        rotation_rate: float | Vector,
+        feed_rate: float | Vector,
+        repose_angle: float | Vector,
+        rho: float | Vector,
+        experimental: Optional[bool] = False
+    ) -> None:
+        args = (slope, rotation_rate, feed_rate, repose_angle, rho)
+        args = np.broadcast_arrays(*map(np.atleast_1d, args))
+        slope, rotation_rate, feed_rate, repose_angle, rho = args
+
+        self._radius = radius
+        self._experimental = experimental
+        self._tan_a = np.tan(slope)
+        self._sin_b = np.sin(repose_angle)
+        self._tan_b = np.tan(repose_angle)
+        self._coef = (3/4) * (feed_rate / rho) / (np.pi * rotation_rate)
+
+        # TODO add this to interface or autodiff.
+        self._dz = 0.01
+
+    @property
+    def size(self) -> int:
+        """ Number of operating points in batch. """
+        return self._coef.shape[0]
+
+    def _local_slope(self, z, R):
+        """ Compute slope of current cell (one per operating point). """
+        m1 = self._tan_a
+
+        if not self._experimental:
+            return m1
+
+        m2 = (self._radius(z + self._dz) - R) / self._dz
+        return abs((m1 - m2) / (1 + m1 * m2))
+
+    def _terms(self, z, h):
+        """ Common terms of right-hand side and its Jacobian. """
+        R = self._radius(z)
+        tan_a = self._local_slope(z, R)
+
+        coef, sin_b, tan_b = self._coef, self._sin_b, self._tan_b
+
+        if np.ndim(h) == 2:
+            tan_a = tan_a[:, None]
+            coef = coef[:, None]
+            sin_b = sin_b[:, None]
+            tan_b = tan_b[:, None]
+
+        ratio = h / R
+        phi = coef / R**3
+        base = (2 - ratio) * ratio
+
+        return R, ratio, phi, base, tan_a / sin_b, tan_b
+
+    def __call__(self, z, h):
+        """ Right-hand side of Kramer's equation for integration. """
+        _, _, phi, base, terml, tan_b = self._terms(z, h)
+        termr = phi * pow(base, -3/2)
+        return -tan_b * (terml - termr)
+
+    def jacobian(self, z, h):
+        """ Diagonal Jacobian of right-hand side for stiff solvers. """
+        R, ratio, phi, base, _, tan_b = self._terms(z, h)
+        dtermr = -(3/2) * phi * pow(base, -5/2) * (2 - 2 * ratio) / R
+        return diags(tan_b * dtermr, format="csc")
+
+
+class KramersModel(KramersModelBatch):
+    """ Kramers (1952) model for a rotary kiln bed height.
+
+    Single operating point specialization of `KramersModelBatch`.
 
     Parameters
     ----------
@@ -38,25 +139,16 @@ class KramersModel:
         repose_angle: float,
         rho: float,
     ) -> None:
-        self._radius = radius
-        self._n = rotation_rate
-        self._vdot = feed_rate / rho
-        self._terml = np.tan(slope) / np.sin(repose_angle)
-        self._tan_b = np.tan(repose_angle)
-
-    def __call__(self, z, h):
-        """ Right-hand side of Kramer's equation for integration. """
-        R = self._radius(z)
-        ratio = h / R
-        phi = (3/4) * self._vdot / (np.pi * R**3 * self._n)
-        termr = phi * pow((2 - ratio) * ratio, -3/2)
-        value = -self._tan_b * (self._terml - termr)
-        return value
+        super().__init__(radius, slope, rotation_rate, feed_rate,
+                         repose_angle, rho, experimental=False)
 
 
-class KramersModelExperimental:
+class KramersModelExperimental(KramersModelBatch):
     """ Kramers (1952) model for a rotary kiln bed height. 
 
+    Single operating point specialization of `KramersModelBatch` using
+    the local slope of the generalized cross section model.
+
     Note: in the source papers greek letters alpha and beta
     are used respectively for slope and repose angle. Here
     we use the respective latin letters as subscripts for
@@ -85,34 +177,72 @@ class KramersModelExperimental:
         repose_angle: float,
         rho: float
     ) -> None:
-        self._radius = radius
-        self._tan_a = np.tan(slope)
-        self._n = rotation_rate
-        self._vdot = feed_rate / rho
+        super().__init__(radius, slope, rotation_rate, feed_rate,
+                         repose_angle, rho, experimental=True)
 
-        # TODO add this to interface or autodiff.
-        self._dz = 0.01
 
-        # This will not change 
-        self._sin_b = np.sin(repose_angle)
-        self._tan_b = np.tan(repose_angle)
+def solve_kramers_batch(
+        radius: Callable[[float], float],
+        length: float,
+        slope: float | Vector,
+        rotation_rate: float | Vector,
+        feed_rate: float | Vector,
+        repose_angle: float | Vector,
+        rho: float | Vector,
+        discharge_height: Optional[float | Vector] = 0.0,
+        t_eval: Optional[Vector] = None,
+        rtol: Optional[float] = 1.0e-03,
+        atol: Optional[float] = 1.0e-06,
+        frac: Optional[float] = 0.001,
+        experimental: Optional[bool] = False
+    ) -> tuple[Vector, Vector]:
+    """ Solve Kramers (1952) model for many operating points at once.
 
-    def _local_slope(self, z, R):
-        """ Compute slope of current cell. """
-        m1 = self._tan_a
-        m2 = self._radius(z + self._dz) - R
-        m2 = m2 / self._dz
-        return abs((m1 - m2) / (1 + m1 * m2))
+    Parameters are the same as `solve_kramers_model` but operating
+    conditions may be provided as arrays, broadcast against each other.
+    All operating points are integrated in lock-step in a single state
+    array by `majordome.integrate.solve_ivp_batch`, which controls the
+    error of every point against its own tolerance, so that profiles do
+    not depend on the other members of the batch beyond `rtol`.
+
+    Parameters
+    ----------
+    rtol: Optional[float] = 1.0e-03
+        Relative tolerance of each operating point.
+    atol: Optional[float] = 1.0e-06
+        Absolute tolerance of each operating point [m].
+
+    Returns
+    -------
+    tuple[Vector, Vector]:
+        Evaluated positions [m] and bed heights [m] with one row per
+        operating point in batch.
+
+    Raises
+    ------
+    RuntimeError
+        Integration of model did not succeed.
+    ValueError
+        Evaluation points do not respect lenght of kiln.
+    """
+    if t_eval is not None:
+        if min(t_eval) < 0.0 or max(t_eval) > length:
+            raise ValueError("Evaluation points outside kiln [0;L].")
+
+    model = KramersModelBatch(radius, slope, rotation_rate, feed_rate,
+                              repose_angle, rho, experimental=experimental)
+
+    # Do not use zero as discharge height as initial value,
+    # but a small fraction of radius (division by zero).
+    y0 = np.maximum(discharge_height, frac * radius(0.0))
+    y0 = np.broadcast_to(y0, (model.size,)).astype(float)
+
+    try:
+        return solve_ivp_batch(model, (0.0, length), y0, t_eval=t_eval,
+                               rtol=rtol, atol=atol)
+    except RuntimeError as err:
+        raise RuntimeError("Failed to solve Kramers equation!") from err
 
-    def __call__(self, z, h):
-        """ Right-hand side of Kramer's equation for integration. """
-        R = self._radius(z)
-        tan_a = self._local_slope(z, R)
-        self._phi = (3/4) * self._vdot / (np.pi * self._n * R**3)
-        terml = tan_a / self._sin_b
-        termr = self._phi * pow((2 - h / R) * h / R, -3/2)
-        return -self._tan_b * (terml - termr)
-    
 
 def solve_kramers_model(
         radius: float,
@@ -169,26 +299,24 @@ def solve_kramers_model(
     ValueError
         Evaluation points do not respect lenght of kiln.
     """
-    if min(t_eval) < 0.0 or max(t_eval) > length:
-        raise ValueError("Evaluation points outside kiln [0;L].")
+    if t_eval is not None:
+        if min(t_eval) < 0.0 or max(t_eval) > length:
+            raise ValueError("Evaluation points outside kiln [0;L].")
 
-    model_api = KramersModel if not experimental \
-        else KramersModelExperimental
+    model = KramersModelBatch(radius, slope, rotation_rate, feed_rate,
+                              repose_angle, rho, experimental=experimental)
 
-    model = model_api(radius, slope, rotation_rate,
-                      feed_rate, repose_angle, rho)
-    
     # Do not use zero as discharge height as initial value,
     # but a small fraction of radius (division by zero).
-    y0 = max(discharge_height, frac * radius(0.0))
+    y0 = [max(discharge_height, frac * radius(0.0))]
+
+    # Only implicit methods make use of (sparse) Jacobian.
+    jac = model.jacobian if method in ("BDF", "Radau") else None
 
-    sol = solve_ivp(model, y0=[y0], t_span=(0.0, length),
-                    t_eval=t_eval, method=method)
+    sol = solve_ivp(model, y0=y0, t_span=(0.0, length), t_eval=t_eval,
+                    method=method, jac=jac, vectorized=True)
 
     if not sol.success:
         raise RuntimeError("Failed to solve Kramers equation!")
 
-    z = sol.t
-    h = sol.y[0]
-
-    return z, h
+    return sol.t, sol.y[0]
@@ -1,53 +1,342 @@
 # -*- coding: utf-8 -*-
 
 # Import Python built-in modules.
+from pathlib import Path
 from typing import Callable
+from typing import Optional
 import abc
+import json
 
 # Import external modules.
-from keras.models import load_model
 import numpy as np
 import yaml
 
 # Own imports.
 from ..types import PathLike
 from ..types import Tensor
+from ..types import Vector
+
+
+class DenseNetwork:
+    """ NumPy-only inference of sequential dense neural networks.
+
+    Evaluation of small networks over small batches is dominated by
+    framework call overhead; this class evaluates the dense layers from
+    exported weights with plain matrix products instead. Weights can be
+    read from a Keras HDF5 file (requires `h5py`, not Keras) or from the
+    lightweight `.npz` format produced by `save`.
+
+    Parameters
+    ----------
+    layers: list[tuple[Tensor, Tensor, str]]
+        Kernel, bias, and activation name of each dense layer.
+    max_value: Optional[float] = None
+        Upper clipping value of a final ReLU filtering layer, if any.
+    """
+    ACTIVATIONS = {
+        "linear": lambda x: x,
+        "relu": lambda x: np.maximum(x, 0.0),
+        "tanh": np.tanh,
+        "sigmoid": lambda x: 1.0 / (1.0 + np.exp(-x)),
+    }
+
+    def __init__(self,
+            layers: list[tuple[Tensor, Tensor, str]],
+            max_value: Optional[float] = None
+        ) -> None:
+        for _, _, activation in layers:
+            if activation not in self.ACTIVATIONS:
+                raise ValueError(f"Unsupported activation {activation}")
+
+        self._layers = [(np.asarray(W), np.asarray(b), a)
+                        for W, b, a in layers]
+        self._max_value = max_value
+
+    def __call__(self, X: Tensor) -> Tensor:
+        """ Evaluate network over rows of inputs `X`. """
+        for W, b, activation in self._layers:
+            X = self.ACTIVATIONS[activation](X @ W + b)
+
+        if self._max_value is not None:
+            X = np.clip(X, 0.0, self._max_value)
+
+        return X
+
+    @classmethod
+    def from_keras_h5(cls, fname: PathLike) -> "DenseNetwork":
+        """ Read dense layers from a Keras sequential HDF5 model. """
+        import h5py
+
+        with h5py.File(fname, "r") as fp:
+            config = json.loads(fp.attrs["model_config"])
+            weights = fp["model_weights"]
+
+            layers = []
+            max_value = None
+
+            for layer in config["config"]["layers"]:
+                name = layer["config"]["name"]
+
+                match layer["class_name"]:
+                    case "InputLayer":
+                        continue
+                    case "Dense":
+                        group = weights[name][name]
+                        W = group["kernel:0"][...]
+                        b = group["bias:0"][...]
+                        a = layer["config"]["activation"]
+                        layers.append((W, b, a))
+                    case "ReLU":
+                        conf = layer["config"]
+                        if conf["negative_slope"] or conf["threshold"]:
+                            raise ValueError("Only clipping ReLU supported")
+                        max_value = conf["max_value"]
+                    case other:
+                        raise ValueError(f"Unsupported layer {other}")
+
+        return cls(layers, max_value=max_value)
+
+    @classmethod
+    def load(cls, fname: PathLike) -> "DenseNetwork":
+        """ Load network from exported `.npz` or Keras `.h5` file. """
+        if Path(fname).suffix == ".h5":
+            return cls.from_keras_h5(fname)
+
+        with np.load(fname) as data:
+            activations = data["activations"]
+            max_value = float(data["max_value"])
+
+            layers = [(data[f"kernel_{k}"], data[f"bias_{k}"], str(a))
+                      for k, a in enumerate(activations)]
+
+        max_value = None if np.isnan(max_value) else max_value
+        return cls(layers, max_value=max_value)
+
+    def save(self, fname: PathLike) -> None:
+        """ Export network weights to NumPy `.npz` format. """
+        data = {"activations": np.array([a for _, _, a in self._layers])}
+        data["max_value"] = np.nan if self._max_value is None \
+            else self._max_value
+
+        for k, (W, b, _) in enumerate(self._layers):
+            data[f"kernel_{k}"] = W
+            data[f"bias_{k}"] = b
+
+        np.savez(fname, **data)
+
+
+class TabulatedModel:
+    """ Multilinear lookup table of a model over a box of inputs.
+
+    Table values are sampled over a regular grid and stored in NumPy
+    `.npy` format, so that they can be memory-mapped when loaded. Box
+    limits are stored in a companion `.box.yaml` file with the same stem.
+    Inputs outside of the box are clamped to its boundaries.
+
+    Parameters
+    ----------
+    table: Tensor
+        Array of shape `(*points, n_outputs)` of tabulated values, with
+        at least two points per dimension.
+    lower: Vector
+        Lower limits of input box.
+    upper: Vector
+        Upper limits of input box.
+    """
+    def __init__(self, table: Tensor, lower: Vector, upper: Vector) -> None:
+        self._table = table
+        self._lower = np.asarray(lower, dtype=float)
+        self._upper = np.asarray(upper, dtype=float)
+
+        self._n_dims = len(self._lower)
+
+        if self._n_dims != len(self._upper) or table.ndim != self._n_dims + 1:
+            raise ValueError("Table dimensions do not match input box.")
+
+        self._shape = np.array(table.shape[:self._n_dims])
+
+        if np.any(self._shape < 2):
+            raise ValueError("Table requires two points per dimension.")
+
+        self._scale = (self._shape - 1) / (self._upper - self._lower)
+
+        # Flat view of table and offsets of cell corners in that view.
+        self._flat = np.asarray(table).reshape((-1, table.shape[-1]))
+        self._strides = np.cumprod([1, *self._shape[:0:-1]])[::-1]
+        self._corners = np.array(list(np.ndindex(*(self._n_dims * [2]))))
+        self._offsets = self._corners @ self._strides
+
+    def __call__(self, X: Tensor) -> Tensor:
+        """ Interpolate table over rows of inputs `X`. """
+        X = np.atleast_2d(X)
+
+        u = (X - self._lower) * self._scale
+        u = np.clip(u, 0.0, self._shape - 1)
+        i = np.minimum(u.astype(int), self._shape - 2)
+        w = u - i
+
+        base = i @ self._strides
+        Y = 0.0
+
+        for c, offset in zip(self._corners, self._offsets):
+            weight = np.prod(np.where(c, w, 1.0 - w), axis=1)
+            Y = Y + weight[:, None] * self._flat[base + offset]
+
+        return Y
+
+    @staticmethod
+    def _fname_box(fname: PathLike) -> Path:
+        """ Name of YAML file holding table input box. """
+        return Path(fname).with_suffix(".box.yaml")
+
+    @classmethod
+    def build(cls,
+            model: Callable[[Tensor], Tensor],
+            lower: Vector,
+            upper: Vector,
+            points: int | list[int],
+            batch: Optional[int] = 100_000,
+            dtype: Optional[type] = np.float32
+        ) -> "TabulatedModel":
+        """ Sample model over regular grid of input box.
+
+        Parameters
+        ----------
+        model: Callable[[Tensor], Tensor]
+            Function evaluated over rows of inputs.
+        lower: Vector
+            Lower limits of input box.
+        upper: Vector
+            Upper limits of input box.
+        points: int | list[int]
+            Number of points per dimension of input box (at least 2).
+        batch: Optional[int] = 100_000
+            Number of grid points evaluated per model call.
+        dtype: Optional[type] = np.float32
+            Data type of stored table.
+
+        Returns
+        -------
+        TabulatedModel
+            Lookup table of model.
+        """
+        points = np.broadcast_to(points, (len(lower),))
+
+        if np.any(points < 2):
+            raise ValueError("Table requires two points per dimension.")
+
+        axes = [np.linspace(lo, hi, n)
+                for lo, hi, n in zip(lower, upper, points)]
+
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
+        grid = grid.reshape((-1, len(lower)))
+
+        values = [model(grid[k:k+batch]) for k in range(0, len(grid), batch)]
+        table = np.vstack(values).astype(dtype)
+        table = table.reshape((*points, -1))
+
+        return cls(table, lower, upper)
+
+    @classmethod
+    def load(cls,
+            fname: PathLike,
+            mmap_mode: Optional[str] = "r"
+        ) -> "TabulatedModel":
+        """ Load table (memory-mapped by default) and its input box. """
+        with open(cls._fname_box(fname)) as fp:
+            box = yaml.safe_load(fp)
+
+        table = np.load(Path(fname).with_suffix(".npy"), mmap_mode=mmap_mode)
+        return cls(table, box["lower"], box["upper"])
+
+    def save(self, fname: PathLike) -> None:
+        """ Store table in `.npy` format and its input box in YAML. """
+        np.save(Path(fname).with_suffix(".npy"), self._table)
+
+        box = {"lower": self._lower.tolist(), "upper": self._upper.tolist()}
+
+        with open(self._fname_box(fname), "w") as fp:
+            yaml.safe_dump(box, fp)
 
 
 class NeuralModel(abc.ABC):
     """ Base class for neural network wrapper.
-    
+
     Parameters
     ----------
     fmodel: PathLike
-        Path to Keras sequential model to be loaded. 
+        Path to neural network model to be loaded.
     fscale: PathLike
         Path to model scaler to be loaded.
+    backend: Optional[str] = "numpy"
+        Inference backend, "numpy" (evaluates `DenseNetwork` from `.npz`
+        or `.h5` weights) or "keras" (loads full Keras model).
+    ftable: Optional[PathLike] = None
+        Path to a table created with `tabulate`. If provided, the table
+        replaces the network evaluation and `fmodel` is not loaded.
     """
-    def __init__(self, fmodel: PathLike, fscale: PathLike) -> None:
+    def __init__(self,
+            fmodel: PathLike,
+            fscale: PathLike,
+            backend: Optional[str] = "numpy",
+            ftable: Optional[PathLike] = None
+        ) -> None:
         super().__init__()
-        model = load_model(fmodel)
         self._scaler = load_standard_scaler(fscale)
-        self._model = lambda X: model(self._scaler(X))
+
+        if ftable is not None:
+            self._model = TabulatedModel.load(ftable)
+            return
+
+        match backend:
+            case "numpy":
+                model = DenseNetwork.load(fmodel)
+                self._model = lambda X: model(self._scaler(X))
+            case "keras":
+                from keras.models import load_model
+                model = load_model(fmodel)
+                self._model = lambda X: model(self._scaler(X)).numpy()
+            case _:
+                raise ValueError(f"Unknown backend {backend}")
 
     def __call__(self, *args):
         """ Prepare arguments and return model evaluation """
-        return self._model(self.get_arguments(*args).T).numpy().T
+        return self._model(self.get_arguments(*args).T).T
 
     @abc.abstractmethod
     def get_arguments(self, *args) -> Tensor:
         """ Interface for argument processing to be implemented. """
         pass
 
+    def tabulate(self,
+            lower: Vector,
+            upper: Vector,
+            points: int | list[int],
+            fname: Optional[PathLike] = None
+        ) -> TabulatedModel:
+        """ Replace model by a lookup table over its inputs box.
+
+        Limits are given in the space of `get_arguments` outputs. See
+        `TabulatedModel.build` for details. If `fname` is provided the
+        table is stored for later use through `ftable` argument.
+        """
+        table = TabulatedModel.build(self._model, lower, upper, points)
+
+        if fname is not None:
+            table.save(fname)
+
+        self._model = table
+        return table
+
     @property
     def scaler(self):
         """ Provide access to model scaler. """
         return self._scaler
-    
+
 
 def load_standard_scaler(fname: PathLike) -> Callable[[Tensor], Tensor]:
     """ Load scaler data and return inputs transformer.
-    
+
     Parameters
     ----------
     fname: PathLike
@@ -67,7 +356,7 @@ def load_standard_scaler(fname: PathLike) -> Callable[[Tensor], Tensor]:
     """
     with open(fname) as fp:
         scaler_data = yaml.safe_load(fp)
-        
+
     if "mean" not in scaler_data or "var" not in scaler_data:
         raise AttributeError("Check required keywords in YAML file.")
 
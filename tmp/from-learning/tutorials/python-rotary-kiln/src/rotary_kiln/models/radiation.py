@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+# Import Python built-in modules.
+from typing import Optional
+
 # Import external modules.
 import numpy as np
 
@@ -17,16 +20,26 @@ class RadcalWrapper(NeuralModel):
     Parameters
     ----------
     fmodel: PathLike
-        Path to Keras sequential model to be loaded. 
+        Path to neural network model to be loaded. 
     fscale: PathLike
         Path to model scaler to be loaded.
+    backend: Optional[str] = "numpy"
+        Inference backend, see `NeuralModel`.
+    ftable: Optional[PathLike] = None
+        Path to tabulated model, see `NeuralModel.tabulate`.
     """
-    def __init__(self, fmodel: PathLike, fscale: PathLike):
+    def __init__(self,
+            fmodel: PathLike,
+            fscale: PathLike,
+            backend: Optional[str] = "numpy",
+            ftable: Optional[PathLike] = None
+        ) -> None:
         if fmodel is None or fscale is None:
-            fmodel = data_dir / "radcal.h5"
+            ext = "h5" if backend == "keras" else "npz"
+            fmodel = data_dir / f"radcal.{ext}"
             fscale = data_dir / "radcal.yaml"
 
-        super().__init__(fmodel, fscale)
+        super().__init__(fmodel, fscale, backend=backend, ftable=ftable)
 
     def get_arguments(self,
             T_w: Tensor, 
@@ -1,16 +1,181 @@
 # -*- coding: utf-8 -*-
 
+# Import Python built-in modules.
+from typing import Callable
+from typing import Optional
+
 # Import external modules.
 import numpy as np
 
 # Own imports.
+from ..types import Matrix
 from ..types import Vector
 from ..types import NumberOrVector
 
 
+class ShomateDatabase:
+    """ Thermophysical data of several species in Shomate's format.
+
+    Coefficients of all species are stored as arrays of shape
+    `(n_species, 8)` for low and high temperature ranges, so that the
+    properties of all species over an array of temperatures are evaluated
+    at once as arrays of shape `(n_species, *T.shape)`. Mixture properties
+    are obtained as products with mass or mole fractions.
+
+    Parameters
+    ----------
+    lo: Matrix
+        Low temperature range model coefficients of each species.
+    hi: Matrix
+        High temperature range model coefficients of each species.
+    t_crit: Vector
+        Temperature separating low and high ranges of each species [K].
+    mw: Vector
+        Molecular mass of each species [kg/mol].
+    names: Optional[list[str]] = None
+        Names of species, used for lookup with `species_index`.
+
+    Raises
+    ------
+    ValueError
+        Coefficients are not of right shape (8-elements per species).
+    """
+    def __init__(self,
+            lo: Matrix,
+            hi: Matrix,
+            t_crit: Vector,
+            mw: Vector,
+            names: Optional[list[str]] = None
+        ) -> None:
+        self._lo = np.atleast_2d(np.asarray(lo, dtype=float))
+        self._hi = np.atleast_2d(np.asarray(hi, dtype=float))
+
+        if self._lo.shape[1] != 8 or self._hi.shape != self._lo.shape:
+            raise ValueError("Coefficients must be 8-elements long")
+
+        n_species = self._lo.shape[0]
+        self._t_crit = np.broadcast_to(t_crit, (n_species,))[:, None]
+        self._mw = np.broadcast_to(mw, (n_species,))[:, None]
+        self._names = names
+
+    @classmethod
+    def from_equations(cls,
+            equations: list["ShomateEquation"],
+            names: Optional[list[str]] = None
+        ) -> "ShomateDatabase":
+        """ Gather data of single species models in a database. """
+        dbs = [eq._db for eq in equations]
+        return cls(np.vstack([db._lo for db in dbs]),
+                   np.vstack([db._hi for db in dbs]),
+                   np.hstack([db._t_crit.ravel() for db in dbs]),
+                   np.hstack([db._mw.ravel() for db in dbs]),
+                   names=names)
+
+    def _evaluate(self,
+            basis: Callable[[Vector], Matrix],
+            T: NumberOrVector
+        ) -> Matrix:
+        """ Evaluate property of all species with given basis. """
+        T = np.asarray(T, dtype=float)
+        t = T.reshape(-1) / 1000
+        B = basis(t)
+
+        values = np.where(T.reshape(-1) < self._t_crit,
+                          self._lo @ B, self._hi @ B)
+        return values.reshape((-1, *T.shape))
+
+    @staticmethod
+    def _average(values: Matrix, Z: Vector | Matrix) -> NumberOrVector:
+        """ Composition-weighted sum of species properties. """
+        Z = np.asarray(Z)
+
+        if Z.ndim == 1:
+            return np.tensordot(Z, values, axes=1)
+
+        return np.einsum("...k,k...->...", Z, values)
+
+    def species_index(self, name: str) -> int:
+        """ Index of species in database. """
+        return self._names.index(name)
+
+    def specific_heat_mole(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate specific heats at given temperature [J/(mol.K)]. """
+        return self._evaluate(_basis_cp, T)
+
+    def enthalpy_mole(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate enthalpies at given temperature [J/mol]. """
+        return self._evaluate(_basis_dh, T)
+
+    def entropy_mole(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate entropies at given temperature [J/(mol.K)]. """
+        return self._evaluate(_basis_so, T)
+
+    def specific_heat_mass(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate specific heats at given temperature [J/(kg.K)]. """
+        return self._scale_mass(self.specific_heat_mole(T))
+
+    def enthalpy_mass(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate enthalpies at given temperature [J/kg]. """
+        return self._scale_mass(self.enthalpy_mole(T))
+
+    def entropy_mass(self, T: NumberOrVector) -> Matrix:
+        """ Evaluate entropies at given temperature [J/(kg.K)]. """
+        return self._scale_mass(self.entropy_mole(T))
+
+    def _scale_mass(self, values: Matrix) -> Matrix:
+        """ Convert molar properties of all species to mass units. """
+        return values / self._mw.reshape((-1,) + (values.ndim - 1) * (1,))
+
+    def mixture_specific_heat_mole(self,
+            T: NumberOrVector,
+            X: Vector | Matrix
+        ) -> NumberOrVector:
+        """ Mixture specific heat from mole fractions [J/(mol.K)].
+
+        Mole fractions are either given for a single composition with
+        shape `(n_species,)` or per temperature as `(*T.shape, n_species)`.
+        """
+        return self._average(self.specific_heat_mole(T), X)
+
+    def mixture_enthalpy_mole(self,
+            T: NumberOrVector,
+            X: Vector | Matrix
+        ) -> NumberOrVector:
+        """ Mixture enthalpy from mole fractions [J/mol]. """
+        return self._average(self.enthalpy_mole(T), X)
+
+    def mixture_specific_heat_mass(self,
+            T: NumberOrVector,
+            Y: Vector | Matrix
+        ) -> NumberOrVector:
+        """ Mixture specific heat from mass fractions [J/(kg.K)].
+
+        Mass fractions are either given for a single composition with
+        shape `(n_species,)` or per temperature as `(*T.shape, n_species)`.
+        """
+        return self._average(self.specific_heat_mass(T), Y)
+
+    def mixture_enthalpy_mass(self,
+            T: NumberOrVector,
+            Y: Vector | Matrix
+        ) -> NumberOrVector:
+        """ Mixture enthalpy from mass fractions [J/kg]. """
+        return self._average(self.enthalpy_mass(T), Y)
+
+    @property
+    def n_species(self) -> int:
+        """ Number of species in database. """
+        return self._lo.shape[0]
+
+    @property
+    def molecular_weights(self) -> Vector:
+        """ Molecular masses of species [kg/mol]. """
+        return self._mw.ravel()
+
+
 class ShomateEquation:
     """ Implements thermophysical data in Shomate's format.
-    
+
     Parameters
     ----------
     lo: Vector
@@ -37,26 +202,19 @@ class ShomateEquation:
             raise ValueError("Coefficients must be 8-elements long")
 
         self._mw = mw
-        self._condlist = lambda T: [(T < t_crit), (T >= t_crit)]
-
-        cp_lo, dh_lo, so_lo = _shomate_functions(*lo)
-        cp_hi, dh_hi, so_hi = _shomate_functions(*hi)
-
-        self._cplist = [cp_lo, cp_hi]
-        self._dhlist = [dh_lo, dh_hi]
-        self._solist = [so_lo, so_hi]
+        self._db = ShomateDatabase([lo], [hi], t_crit, mw)
 
     def specific_heat_mole(self, T: NumberOrVector) -> NumberOrVector:
         """ Evaluate specific heat at given temperature [J/(mol.K)]. """
-        return np.piecewise(T/1000, self._condlist(T), self._cplist)
+        return self._db.specific_heat_mole(T)[0]
 
     def enthalpy_mole(self, T: NumberOrVector) -> NumberOrVector:
         """ Evaluate enthalpy at given temperature [J/mol]. """
-        return np.piecewise(T/1000, self._condlist(T), self._dhlist)
+        return self._db.enthalpy_mole(T)[0]
 
     def entropy_mole(self, T: NumberOrVector) -> NumberOrVector:
         """ Evaluate entropy at given temperature [J/(mol.K)]. """
-        return np.piecewise(T/1000, self._condlist(T), self._solist)
+        return self._db.entropy_mole(T)[0]
 
     def specific_heat_mass(self, T: NumberOrVector) -> NumberOrVector:
         """ Evaluate specific heat at given temperature [J/(kg.K)]. """
@@ -71,9 +229,20 @@ class ShomateEquation:
         return self.entropy_mole(T) / self._mw
 
 
-def _shomate_functions(a, b, c, d, e, f, g, h):
-    """ Create reduced temperature functions from parameters. """
-    cp = lambda t: a+b*t+c*t**2+d*t**3+e/t**2
-    dh = lambda t: a*t+b/2*t**2+c/3*t**3+d/4*t**4-e/t+f-h
-    so = lambda t: a*np.log(t)+b*t+c/2*t**2+d/3*t**3+e/(2*t**2)+g
-    return cp, dh, so
+def _basis_cp(t: Vector) -> Matrix:
+    """ Reduced temperature basis of specific heat. """
+    one, zero = np.ones_like(t), np.zeros_like(t)
+    return np.stack((one, t, t**2, t**3, t**-2, zero, zero, zero))
+
+
+def _basis_dh(t: Vector) -> Matrix:
+    """ Reduced temperature basis of enthalpy. """
+    one, zero = np.ones_like(t), np.zeros_like(t)
+    return np.stack((t, t**2/2, t**3/3, t**4/4, -1/t, one, zero, -one))
+
+
+def _basis_so(t: Vector) -> Matrix:
+    """ Reduced temperature basis of entropy. """
+    one, zero = np.ones_like(t), np.zeros_like(t)
+    return np.stack((np.log(t), t, t**2/2, t**3/3, -1/(2*t**2),
+                     zero, one, zero))
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
-from .bed import SilicaBasedBed
-from .freeboard import FreeboardCantera
-from .freeboard import FreeboardMethane1S
-from .freeboard import FreeboardMethane1SLeak
-from .freeboard import find_air_leak
+from majordome._lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "SilicaBasedBed": ".bed",
+    "EquilibriumTable": ".freeboard",
+    "FreeboardCantera": ".freeboard",
+    "FreeboardMethane1S": ".freeboard",
+    "FreeboardMethane1SLeak": ".freeboard",
+    "FreeboardTabulated": ".freeboard",
+    "find_air_leak": ".freeboard",
+})
 
 __all__ = [
     "SilicaBasedBed",
+    "EquilibriumTable",
     "FreeboardCantera",
     "FreeboardMethane1S",
     "FreeboardMethane1SLeak",
+    "FreeboardTabulated",
     "find_air_leak"
 ]
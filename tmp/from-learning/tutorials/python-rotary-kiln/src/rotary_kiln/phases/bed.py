@@ -11,7 +11,9 @@ import numpy as np
 
 # Own imports.
 from ..bases import BaseThermoBed
+from ..materials import ThermoH2OLiquid
 from ..materials import ThermoSi1O2
+from ..models import ShomateDatabase
 from ..types import NumberOrVector
 from ..types import Vector
 
@@ -44,6 +46,8 @@ class SilicaBasedBed(BaseThermoBed):
         self._repose_angle = np.radians(aor)
         self._kb = kb
         self._si1o2 = ThermoSi1O2()
+        self._db = ShomateDatabase.from_equations(
+            [self._si1o2, ThermoH2OLiquid()], names=["SiO2", "H2O"])
         self._initial_value = np.array([m0 / 3600.0, t0])
         self._n_vars = self._initial_value.shape[0]
         self._rhs = np.zeros((self._n_vars,))
@@ -87,30 +91,32 @@ class SilicaBasedBed(BaseThermoBed):
         perc = interp1d(z, kiln.bed_cord_length, **opts)
         self._get_section = lambda z: (area(z), perc(z))
 
-    def specific_heat_mass(self, T: NumberOrVector) -> NumberOrVector:
-        """ Add water specific heat and latent heat of vaporization. """
+    def _mass_fractions(self, T: NumberOrVector) -> Vector:
+        """ Bed SiO2 and H2O mass fractions drying from 353 to 373 K. """
         # TODO add this to model interface.
         y_h2o = 0.02
-        
-        cp_bed = self._si1o2.specific_heat_mass
-        cp_h2o = 4186.0
-        dh_h2o = 2260000.0
-
-        def f1(T):
-            return y_h2o * cp_h2o + (1 - y_h2o) * cp_bed(T)
 
-        def f2(T, m=1.0/20.0):
-            y = y_h2o * (1.0 - m * (T - 353.15))
-            # dcp = m * y_h2o * dh_h2o ... or should it be this?
-            dcp = m * dh_h2o
-            return y * (cp_h2o + dcp) + (1 - y) * cp_bed(T)
+        T = np.asarray(T, dtype=float)
+        y = y_h2o * np.clip(1.0 - (T - 353.15) / 20.0, 0.0, 1.0)
+        return np.stack((1.0 - y, y), axis=-1)
 
-        condlist = [T <= 353.15, T <= 373.15, T >  373.15]
-        funclist = [f1         , f2         , cp_bed     ]
+    def specific_heat_mass(self, T: NumberOrVector) -> NumberOrVector:
+        """ Add water specific heat and latent heat of vaporization.
+
+        Species properties are evaluated at once over all temperatures
+        (*e.g.* along the axial grid) and averaged with the local mass
+        fractions of bed constituents.
+        """
+        T = np.asarray(T, dtype=float)
+        Y = self._mass_fractions(T)
+        cp = self._db.mixture_specific_heat_mass(T, Y)
+
+        # Latent heat spread over drying interval (20 K).
+        # dcp = m * y_h2o * dh_h2o ... or should it be this?
+        dh_h2o = 2260000.0
+        drying = (T > 353.15) & (T <= 373.15)
+        return cp + np.where(drying, Y[..., 1] * dh_h2o / 20.0, 0.0)
 
-        cp = np.piecewise(T, condlist, funclist)
-        return cp
-    
     def thermal_conductivity(self, T: NumberOrVector) -> NumberOrVector:
         """ Access to bed thermal conductivity [W/(m.K)]. """
         return self._kb(T)
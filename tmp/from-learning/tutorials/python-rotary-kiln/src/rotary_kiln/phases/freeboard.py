@@ -5,17 +5,22 @@ from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Optional
+import warnings
 
 # Import external modules.
 from scipy.interpolate import interp1d
 from scipy.optimize import root
 import cantera as ct
 import numpy as np
+import yaml
 
 # Own imports.
 from ..bases import BaseThermoFreeboard
+from ..models import TabulatedModel
 from ..models import arrhenius
+from ..types import Matrix
 from ..types import NumberOrVector
+from ..types import PathLike
 from ..types import Vector
 
 # Make package kinetics data available.
@@ -242,6 +247,261 @@ class FreeboardMethane1S(FreeboardCantera):
             self._ke = lambda z: z / kiln.length
 
 
+class EquilibriumTable:
+    """ Tabulated equilibrium chemistry of a fuel-oxidizer system.
+
+    Equilibrium states (at constant enthalpy and pressure) of mixtures of
+    fuel and oxidizer streams are computed with Cantera over a regular grid
+    of Bilger mixture fraction `Z` and enthalpy defect `dh` with respect to
+    the adiabatic mixing of the streams. Equilibrium temperature and mass
+    fractions are stored as a `TabulatedModel`, memory-mapped when loaded,
+    and later retrieved by multilinear interpolation. States that cannot be
+    reached by the enthalpy defect are clamped to equilibrium at `tmin`.
+
+    Parameters
+    ----------
+    mechanism: str
+        Kinetics mechanism in Cantera format.
+    fuel: str | dict[str, float]
+        Fuel composition in mole fractions [-].
+    oxid: str | dict[str, float]
+        Oxidizer composition in mole fractions [-].
+    t0: Optional[float] = 300.0
+        Temperature of both fuel and oxidizer streams [K].
+    p0: Optional[float] = ct.one_atm
+        Operating pressure [Pa].
+    table: Optional[TabulatedModel] = None
+        Table of states, as created by `build` or `load`.
+    """
+    def __init__(self,
+            mechanism: str,
+            fuel: str | dict[str, float],
+            oxid: str | dict[str, float],
+            t0: Optional[float] = 300.0,
+            p0: Optional[float] = ct.one_atm,
+            table: Optional[TabulatedModel] = None
+        ) -> None:
+        self._meta = dict(mechanism=mechanism, fuel=fuel, oxid=oxid,
+                          t0=float(t0), p0=float(p0))
+        self._table = table
+        self._gas = ct.Solution(mechanism)
+
+        self._gas.TPX = t0, p0, fuel
+        self._Y_f = self._gas.Y
+        self._h_f = self._gas.enthalpy_mass
+
+        self._gas.TPX = t0, p0, oxid
+        self._Y_o = self._gas.Y
+        self._h_o = self._gas.enthalpy_mass
+
+        # Bilger coupling function is linear in mass fractions.
+        factors = {"C": 2.0, "H": 0.5, "O": -1.0}
+        names = self._gas.element_names
+        self._coupling = np.zeros(self._gas.n_species)
+
+        for k, W in enumerate(self._gas.molecular_weights):
+            for e, f in factors.items():
+                if e in names:
+                    self._coupling[k] += f * self._gas.n_atoms(k, e) / W
+
+        self._beta_f = self._Y_f @ self._coupling
+        self._beta_o = self._Y_o @ self._coupling
+
+    def __call__(self,
+            Z: NumberOrVector,
+            dh: NumberOrVector
+        ) -> tuple[Vector, Matrix]:
+        """ Equilibrium temperature [K] and mass fractions [-]. """
+        if self._table is None:
+            raise RuntimeError("Table was neither built nor loaded.")
+
+        values = self._table(np.column_stack((Z, dh)))
+        return values[:, 0], values[:, 1:]
+
+    def mixture_fraction(self, Y: Vector | Matrix) -> NumberOrVector:
+        """ Bilger mixture fraction of mass fractions [-]. """
+        beta = np.asarray(Y) @ self._coupling
+        return (beta - self._beta_o) / (self._beta_f - self._beta_o)
+
+    def adiabatic_enthalpy(self, Z: NumberOrVector) -> NumberOrVector:
+        """ Specific enthalpy of adiabatic streams mixing [J/kg]. """
+        return Z * self._h_f + (1 - Z) * self._h_o
+
+    def _equilibrium(self, X: Matrix, tmin: float) -> Matrix:
+        """ Compute equilibrium states over rows of `(Z, dh)`. """
+        gas = self._gas
+        p0 = self._meta["p0"]
+        states = np.empty((X.shape[0], gas.n_species + 1))
+
+        # NOTE: unreachable states are clamped below, silence Cantera.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            for k, (Z, dh) in enumerate(X):
+                Y = Z * self._Y_f + (1 - Z) * self._Y_o
+
+                try:
+                    gas.HPY = self.adiabatic_enthalpy(Z) + dh, p0, Y
+                    gas.equilibrate("HP")
+
+                    if gas.T < tmin:
+                        raise ct.CanteraError("Temperature below minimum.")
+                except ct.CanteraError:
+                    gas.TPY = tmin, p0, Y
+                    gas.equilibrate("TP")
+
+                states[k, 0] = gas.T
+                states[k, 1:] = gas.Y
+
+        return states
+
+    @classmethod
+    def build(cls,
+            mechanism: str,
+            fuel: str | dict[str, float],
+            oxid: str | dict[str, float],
+            t0: Optional[float] = 300.0,
+            p0: Optional[float] = ct.one_atm,
+            zmax: Optional[float] = 1.0,
+            dhmin: Optional[float] = -1.0e+06,
+            dhmax: Optional[float] = 0.0,
+            points: Optional[int | list[int]] = (201, 21),
+            tmin: Optional[float] = 300.0
+        ) -> "EquilibriumTable":
+        """ Compute equilibrium table over given box.
+
+        Parameters not described here are the same as in class.
+
+        Parameters
+        ----------
+        zmax: Optional[float] = 1.0
+            Upper limit of mixture fraction axis [-].
+        dhmin: Optional[float] = -1.0e+06
+            Lower limit of enthalpy defect axis [J/kg].
+        dhmax: Optional[float] = 0.0
+            Upper limit of enthalpy defect axis [J/kg].
+        points: Optional[int | list[int]] = (201, 21)
+            Number of points along mixture fraction and enthalpy defect.
+        tmin: Optional[float] = 300.0
+            Minimum temperature of tabulated states [K].
+
+        Returns
+        -------
+        EquilibriumTable
+            Table ready for lookups.
+        """
+        chem = cls(mechanism, fuel, oxid, t0, p0)
+        model = lambda X: chem._equilibrium(X, tmin)
+
+        chem._table = TabulatedModel.build(model, [0.0, dhmin],
+                                           [zmax, dhmax], points)
+        return chem
+
+    @staticmethod
+    def _fname_meta(fname: PathLike) -> Path:
+        """ Name of YAML file holding streams definition. """
+        return Path(fname).with_suffix(".chem.yaml")
+
+    @classmethod
+    def load(cls, fname: PathLike) -> "EquilibriumTable":
+        """ Load table (memory-mapped) and its streams definition. """
+        with open(cls._fname_meta(fname)) as fp:
+            meta = yaml.safe_load(fp)
+
+        table = TabulatedModel.load(Path(fname).with_suffix(".npy"))
+        return cls(**meta, table=table)
+
+    def save(self, fname: PathLike) -> None:
+        """ Store table in `.npy` format and streams in YAML. """
+        self._table.save(fname)
+
+        with open(self._fname_meta(fname), "w") as fp:
+            yaml.safe_dump(self._meta, fp)
+
+    @property
+    def mechanism(self) -> str:
+        """ Kinetics mechanism used for tabulation. """
+        return self._meta["mechanism"]
+
+    @property
+    def fuel(self) -> str | dict[str, float]:
+        """ Fuel composition in mole fractions [-]. """
+        return self._meta["fuel"]
+
+    @property
+    def oxid(self) -> str | dict[str, float]:
+        """ Oxidizer composition in mole fractions [-]. """
+        return self._meta["oxid"]
+
+    @property
+    def pressure(self) -> float:
+        """ Operating pressure [Pa]. """
+        return self._meta["p0"]
+
+
+class FreeboardTabulated(FreeboardCantera):
+    """ Implementation of rotary kiln freeboard gas with tabulated chemistry.
+
+    Instead of evaluating kinetics, species are relaxed towards the local
+    equilibrium composition retrieved from an `EquilibriumTable` for the
+    current mixture fraction and enthalpy defect, at a rate given by the
+    eddy break-up (EBU) mixing frequency. Heat release follows from the
+    resulting production rates as in parent class. Mechanism, streams, and
+    pressure are those of the table.
+
+    Parameters
+    ----------
+    table: EquilibriumTable | PathLike
+        Equilibrium table or path to a table stored with its `save`.
+    m0: float
+        Inlet total mass flow rate [kg/s].
+    t0: float
+        Inlet temperature [K].
+    lambda0: float
+        Inlet equivalence ratio [-].
+    ke: Optional[Callable[[NumberOrVector], NumberOrVector]] = None
+        Eddy break-up (EBU) k-epsilon ratio.
+    cr: Optional[float] = 4.0
+        Eddy break-up (EBU) rate constant [-].
+    equilibrate: Optional[float] = False
+        If `True`, gas is pre-equilibrated on initialization.
+    """
+    def __init__(self,
+            table: EquilibriumTable | PathLike,
+            m0: float,
+            t0: float,
+            lambda0: float,
+            ke: Optional[Callable[[NumberOrVector], NumberOrVector]] = None,
+            cr: Optional[float] = 4.0,
+            equilibrate: Optional[float] = False
+        ) -> None:
+        if not isinstance(table, EquilibriumTable):
+            table = EquilibriumTable.load(table)
+
+        super().__init__(table.mechanism, m0, t0, lambda0, table.fuel,
+                         table.oxid, table.pressure, equilibrate)
+        self._table = table
+        self._ke = ke
+        self._cr = cr
+
+    def _wdot_mass(self, z: float, T: float, Y: Vector) -> Vector:
+        """ Return reaction rate in mass units [kg/(m³.s)]. """
+        Z = self._table.mixture_fraction(Y)
+        dh = self._gas.enthalpy_mass - self._table.adiabatic_enthalpy(Z)
+        Y_eq = self._table(Z, dh)[1][0]
+
+        rho = self._gas.density_mass
+        return rho * self._cr * self._ke(z) * (Y_eq - Y)
+
+    def register_section_getter(self, kiln: Any) -> None:
+        """ Creates a function to retrieve section properties. """
+        super().register_section_getter(kiln)
+
+        if self._ke is None:
+            # Approximate k/e ratio proposed by Mujumdar (2006).
+            self._ke = lambda z: z / kiln.length
+
+
 class FreeboardMethane1SLeak(FreeboardMethane1S):
     """ Implementation of rotary kiln freeboard gas with air leak. 
     
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Import Python built-in modules.
+from types import SimpleNamespace
+
+# Import external modules.
+import numpy as np
+import pytest
+
+ct = pytest.importorskip("cantera")
+
+# Own imports.
+from rotary_kiln.phases import EquilibriumTable
+from rotary_kiln.phases import FreeboardTabulated
+
+MECHANISM = "1S_CH4_MP1.yaml"
+FUEL = "CH4: 1.0"
+OXID = "O2: 0.21, N2: 0.78, AR: 0.01"
+
+# Interior points (Z, dh) away from grid nodes and stoichiometry.
+POINTS = np.array([
+    [0.0215, -0.53e+05],
+    [0.0385, -2.17e+05],
+    [0.0720, -1.61e+05],
+    [0.1530, -0.85e+05],
+])
+
+
+@pytest.fixture(scope="module")
+def table():
+    """ Small equilibrium table of methane-air system. """
+    return EquilibriumTable.build(MECHANISM, FUEL, OXID, zmax=0.2,
+                                  dhmin=-5.0e+05, dhmax=0.0,
+                                  points=(81, 21))
+
+
+def equilibrium(table, Z, dh):
+    """ Direct Cantera equilibrium at mixture fraction and defect. """
+    gas = ct.Solution(MECHANISM)
+    gas.TPX = 300.0, ct.one_atm, FUEL
+    Y_f = gas.Y
+    gas.TPX = 300.0, ct.one_atm, OXID
+    Y_o = gas.Y
+
+    Y = Z * Y_f + (1 - Z) * Y_o
+    gas.HPY = table.adiabatic_enthalpy(Z) + dh, ct.one_atm, Y
+    gas.equilibrate("HP")
+    return gas.T, gas.Y
+
+
+def test_table_matches_equilibrium(table):
+    """ Interpolated states agree with direct equilibrium. """
+    T, Y = table(POINTS[:, 0], POINTS[:, 1])
+
+    for k, (Z, dh) in enumerate(POINTS):
+        T_ref, Y_ref = equilibrium(table, Z, dh)
+
+        assert T[k] == pytest.approx(T_ref, rel=1.0e-03)
+        assert np.allclose(Y[k], Y_ref, atol=1.0e-06)
+        assert table.mixture_fraction(Y_ref) == pytest.approx(Z)
+
+
+def test_table_round_trip(tmp_path, table):
+    """ Stored table is reloaded with its streams definition. """
+    table.save(tmp_path / "chem")
+    loaded = EquilibriumTable.load(tmp_path / "chem")
+
+    assert loaded.mechanism == MECHANISM
+    assert loaded.fuel == FUEL
+    assert np.allclose(loaded(*POINTS.T)[1], table(*POINTS.T)[1])
+
+
+def test_tabulated_freeboard_relaxes_to_equilibrium(table):
+    """ Species relax towards equilibrium at EBU mixing frequency. """
+    freeboard = FreeboardTabulated(table, 1.0, 300.0, 0.8, ke=lambda z: 2.0)
+
+    kiln = SimpleNamespace(length=10.0, coordinates=np.linspace(0, 10, 5),
+                           gas_cross_area=np.full(5, 3.0),
+                           bed_cord_length=np.full(5, 1.0))
+    freeboard.register_section_getter(kiln)
+
+    # Unburnt premixed inlet (adiabatic, so zero enthalpy defect).
+    state = freeboard.initial_value.copy()
+    mdot, T, Y = state[0], state[1], state[2:]
+    Z = table.mixture_fraction(Y)
+
+    rhs = freeboard(5.0, state, lambda z: 0.0)
+    _, Y_eq = equilibrium(table, Z, 0.0)
+
+    gas = ct.Solution(MECHANISM)
+    gas.TPY = T, ct.one_atm, Y
+    wdot = gas.density_mass * 4.0 * 2.0 * (Y_eq - Y)
+
+    assert np.allclose(rhs[2:], 3.0 * wdot / mdot, rtol=1.0e-03,
+                       atol=1.0e-06)
+    assert rhs[1] > 0.0
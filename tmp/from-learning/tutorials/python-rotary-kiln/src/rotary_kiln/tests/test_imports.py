@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Import Python built-in modules.
+from textwrap import dedent
+import os
+import subprocess
+import sys
+
+# Import external modules.
+import pytest
+
+HEAVY_MODULES = ["cantera", "casadi", "keras", "matplotlib", "pandas"]
+""" Backends that must not be loaded by a bare package import. """
+
+IMPORT_BUDGET = float(os.environ.get("ROTARY_KILN_IMPORT_BUDGET", "1.0"))
+""" Maximum cold import time [s], override for slow machines. """
+
+
+def cold_import(module: str, repeats: int = 3) -> tuple[float, list[str]]:
+    """ Import module in fresh interpreters, return time and backends. """
+    code = dedent(f"""\
+        import sys, time
+        t0 = time.perf_counter()
+        import {module}
+        print(time.perf_counter() - t0)
+        print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+    """)
+
+    times = []
+
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             capture_output=True, text=True).stdout
+        elapsed, loaded = out.splitlines()
+        times.append(float(elapsed))
+
+    return min(times), [m for m in loaded.split(",") if m]
+
+
+@pytest.mark.parametrize("module", [
+    "rotary_kiln",
+    "rotary_kiln.kiln",
+    "rotary_kiln.phases",
+])
+def test_cold_import_is_lazy(module):
+    """ Importing package must not load heavy backends. """
+    _, loaded = cold_import(module, repeats=1)
+    assert not loaded, f"{module} loaded {loaded} at import"
+
+
+def test_cold_import_time():
+    """ Cold start of package within budget. """
+    elapsed, _ = cold_import("rotary_kiln")
+    assert elapsed < IMPORT_BUDGET, f"cold import took {elapsed:.3f} s"
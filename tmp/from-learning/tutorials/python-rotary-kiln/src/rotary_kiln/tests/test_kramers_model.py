@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Import external modules.
+from scipy.integrate import solve_ivp
+import numpy as np
+import pytest
+
+# Own imports.
+from rotary_kiln.models import KramersModelBatch
+from rotary_kiln.models import solve_kramers_batch
+from rotary_kiln.models import solve_kramers_model
+
+LENGTH = 20.0
+""" Length of reference kiln [m]. """
+
+SLOPE, REPOSE, RHO = np.radians(2.0), np.radians(35.0), 1500.0
+""" Common slope [rad], repose angle [rad] and density [kg/m³]. """
+
+
+def radius(z):
+    """ Smooth radius profile of reference kiln [m]. """
+    return 1.0 + 0.1 * np.sin(np.pi * z / LENGTH)
+
+
+def operating_points(size=6):
+    """ Rotation [rev/s] and feed rates [kg/s] of a batch. """
+    return np.linspace(0.02, 0.08, size), np.linspace(1.0, 5.0, size)
+
+
+@pytest.mark.parametrize("experimental", [False, True])
+def test_batch_matches_per_point(experimental):
+    """ Lock-step batch matches points integrated separately. """
+    n, feed = operating_points()
+    z = np.linspace(0.0, LENGTH, 41)
+
+    zb, hb = solve_kramers_batch(radius, LENGTH, SLOPE, n, feed, REPOSE,
+                                 RHO, t_eval=z, rtol=1.0e-07, atol=1.0e-10,
+                                 experimental=experimental)
+
+    assert np.array_equal(zb, z)
+    assert hb.shape == (n.size, z.size)
+
+    for k, (nk, fk) in enumerate(zip(n, feed)):
+        model = KramersModelBatch(radius, SLOPE, nk, fk, REPOSE, RHO,
+                                  experimental=experimental)
+        ref = solve_ivp(model, (0.0, LENGTH), [0.001], t_eval=z,
+                        method="BDF", jac=model.jacobian, vectorized=True,
+                        rtol=1.0e-10, atol=1.0e-12)
+        assert np.allclose(hb[k], ref.y[0], rtol=1.0e-05)
+
+
+def test_batch_default_tolerance():
+    """ Default tolerances agree with scalar solution. """
+    n, feed = operating_points(3)
+    z = np.linspace(0.0, LENGTH, 41)
+
+    _, hb = solve_kramers_batch(radius, LENGTH, SLOPE, n, feed, REPOSE,
+                                RHO, t_eval=z)
+
+    for k, (nk, fk) in enumerate(zip(n, feed)):
+        _, h = solve_kramers_model(radius, LENGTH, SLOPE, nk, fk, REPOSE,
+                                   RHO, t_eval=z)
+        assert np.allclose(hb[k], h, rtol=2.0e-02)
+
+
+def test_batch_evaluation_outside_kiln():
+    """ Evaluation points must lie within kiln. """
+    with pytest.raises(ValueError):
+        solve_kramers_batch(radius, LENGTH, SLOPE, 0.05, 3.0, REPOSE, RHO,
+                            t_eval=[0.0, 2 * LENGTH])
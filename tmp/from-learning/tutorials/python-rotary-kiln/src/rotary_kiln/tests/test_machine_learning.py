@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Import external modules.
+import numpy as np
+import pytest
+
+# Own imports.
+from rotary_kiln.models import TabulatedModel
+
+
+def bilinear(X):
+    """ Model exactly represented by multilinear interpolation. """
+    return np.column_stack([X[:, 0] * X[:, 1], X[:, 0] - 2 * X[:, 1]])
+
+
+@pytest.mark.parametrize("fname", ["table", "table.npy", "table.dat"])
+def test_tabulated_round_trip(tmp_path, fname):
+    """ Saved table is found by `load` whatever the given suffix. """
+    model = TabulatedModel.build(bilinear, [0, 0], [1, 2], [3, 5])
+    model.save(tmp_path / fname)
+
+    loaded = TabulatedModel.load(tmp_path / fname)
+    X = np.array([[0.3, 1.7], [0.9, 0.1], [2.0, -1.0]])
+
+    assert np.allclose(loaded(X), model(X))
+    assert np.allclose(loaded(X[:2]), bilinear(X[:2]), atol=1.0e-06)
+
+
+def test_tabulated_requires_two_points():
+    """ Degenerate tables cannot be interpolated. """
+    with pytest.raises(ValueError):
+        TabulatedModel.build(bilinear, [0, 0], [1, 2], [1, 5])
+
+    with pytest.raises(ValueError):
+        TabulatedModel(np.zeros((1, 5, 2)), [0, 0], [1, 2])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Import external modules.
+import numpy as np
+import pytest
+
+# Own imports.
+from rotary_kiln.materials import ThermoH2OLiquid
+from rotary_kiln.materials import ThermoSi1O2
+from rotary_kiln.models import ShomateDatabase
+from rotary_kiln.phases import SilicaBasedBed
+
+# Temperatures on both sides of SiO2 range change (847 K) [K].
+TEMPERATURES = np.array([300.0, 360.0, 500.0, 846.0, 847.0, 1200.0])
+
+PROPERTIES = [
+    "specific_heat_mole", "enthalpy_mole", "entropy_mole",
+    "specific_heat_mass", "enthalpy_mass", "entropy_mass",
+]
+
+
+@pytest.mark.parametrize("prop", PROPERTIES)
+def test_database_matches_equations(prop):
+    """ Database evaluates all species as their own equations. """
+    equations = [ThermoSi1O2(), ThermoH2OLiquid()]
+    db = ShomateDatabase.from_equations(equations, names=["SiO2", "H2O"])
+
+    values = getattr(db, prop)(TEMPERATURES)
+    assert values.shape == (len(equations), TEMPERATURES.size)
+
+    for k, eq in enumerate(equations):
+        assert np.allclose(values[k], getattr(eq, prop)(TEMPERATURES))
+
+        for T, v in zip(TEMPERATURES, values[k]):
+            assert v == pytest.approx(getattr(eq, prop)(T))
+
+
+def test_database_mixture_averages():
+    """ Mixture properties are weighted sums of species properties. """
+    equations = [ThermoSi1O2(), ThermoH2OLiquid()]
+    db = ShomateDatabase.from_equations(equations)
+
+    Y = np.column_stack((np.linspace(0.9, 1.0, TEMPERATURES.size),
+                         np.linspace(0.1, 0.0, TEMPERATURES.size)))
+
+    expected = sum(Y[:, k] * eq.specific_heat_mass(TEMPERATURES)
+                   for k, eq in enumerate(equations))
+    assert np.allclose(db.mixture_specific_heat_mass(TEMPERATURES, Y),
+                       expected)
+
+    expected = sum(y * eq.enthalpy_mass(TEMPERATURES)
+                   for y, eq in zip(Y[0], equations))
+    assert np.allclose(db.mixture_enthalpy_mass(TEMPERATURES, Y[0]),
+                       expected)
+
+
+def test_bed_specific_heat_along_grid():
+    """ Bed specific heat over an array matches species by species. """
+    bed = SilicaBasedBed(1000.0)
+    si1o2, h2o = ThermoSi1O2(), ThermoH2OLiquid()
+
+    T = np.linspace(300.0, 1200.0, 91)
+    cp = bed.specific_heat_mass(T)
+
+    for Tk, cpk in zip(T, cp):
+        y = 0.02 * min(1.0, max(0.0, 1.0 - (Tk - 353.15) / 20.0))
+        ref = y * h2o.specific_heat_mass(Tk)
+        ref += (1 - y) * si1o2.specific_heat_mass(Tk)
+
+        if 353.15 < Tk <= 373.15:
+            ref += y * 2260000.0 / 20.0
+
+        assert cpk == pytest.approx(ref)
+        assert bed.specific_heat_mass(Tk) == pytest.approx(cpk)
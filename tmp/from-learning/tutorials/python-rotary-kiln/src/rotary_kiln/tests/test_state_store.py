@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Import external modules.
+import numpy as np
+import pytest
+
+# Own imports.
+from rotary_kiln.kiln.state_store import StateStore
+
+
+def make_store():
+    """ Store with single and multiple column fields. """
+    rng = np.random.default_rng(42)
+    return StateStore.from_columns({
+        "temp_gas": rng.random(7),
+        "Y_gas": rng.random((7, 3)),
+        "temp_bed": rng.random(7),
+    })
+
+
+@pytest.mark.parametrize("fname", ["state", "state.npz", "state.dat"])
+def test_state_store_round_trip(tmp_path, fname):
+    """ Saved store is found by `load` whatever the given suffix. """
+    store = make_store()
+    store.save(tmp_path / fname)
+
+    loaded = StateStore.load(tmp_path / fname)
+
+    assert (tmp_path / "state.npz").exists()
+    assert loaded.fields == store.fields
+    assert np.array_equal(loaded.data, store.data)
+    assert np.array_equal(loaded["Y_gas"], store["Y_gas"])
+
+
+def test_state_store_round_trip_hdf5(tmp_path):
+    """ HDF5 suffix is kept as given. """
+    pytest.importorskip("h5py")
+
+    store = make_store()
+    store.save(tmp_path / "state.h5")
+
+    loaded = StateStore.load(tmp_path / "state.h5")
+
+    assert loaded.fields == store.fields
+    assert np.array_equal(loaded.data, store.data)